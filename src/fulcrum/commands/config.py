@@ -9,7 +9,7 @@ from rich.console import Console
 from rich.table import Table
 
 from ..core.config import load_yaml, merge_config_projects, write_yaml
-from ..core.settings import load_settings, save_settings, Settings
+from ..core.settings import load_settings, save_settings, validate_settings, Settings
 
 console = Console()
 log = structlog.get_logger()
@@ -117,7 +117,7 @@ def config_validate(
 ):
     """Validate the configuration file."""
     try:
-        settings = load_settings(config)
+        settings = validate_settings(load_settings(config))
         console.print("[green]Configuration is valid[/]")
 
         if not settings.org.org_id:
@@ -12,7 +12,7 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from ..core.settings import get_cli_defaults, load_settings
+from ..core.settings import get_cli_defaults, load_settings, locate_config
 from ..gcp.finops_client import GCPFinOpsClient
 from ..gcp.gke_cost_client import GKECostClient
 
@@ -29,8 +29,9 @@ finops_app = typer.Typer(
 def _get_finops_defaults(config_path: Optional[str] = None) -> dict:
     """Get FinOps defaults from config with fallback values."""
     try:
-        settings = load_settings(config_path)
-        defaults = get_cli_defaults(settings, config_path)
+        cfg_path = locate_config(config_path)
+        settings = load_settings(cfg_path, located=True)
+        defaults = get_cli_defaults(settings, cfg_path, located=True)
         finops = settings.finops
 
         return {
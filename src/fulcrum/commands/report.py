@@ -2,10 +2,11 @@
 
 import asyncio
 import os
+import re
 import sys
 import time
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 import structlog
 import typer
@@ -32,14 +33,20 @@ from ..core.catalog import (
 from ..core.logging import setup_logging
 from ..core.progress import init_projects, read_state
 from ..core.reporting import generate_standard_report, HistoryManager
-from ..core.settings import get_cli_defaults, load_settings
+from ..core.settings import get_cli_defaults, load_settings, locate_config
 from ..core.validator import validate_report
 from ..prowler.aggregator import ReportAggregator
 from ..prowler.runner import list_checks, run_scan
 from ..prowler.scanner import AsyncScanner
 
 console = Console()
-log = structlog.get_logger()
+log = structlog.get_logger(module="commands.report")
+
+# Inventory categories tracked per project while metadata is collected
+_CATEGORIES = ("compute", "networking", "security", "storage", "sql", "gke")
+
+# Trailing date token of report directory names (report-YYYYMMDD)
+_DATE_TOKEN_RE = re.compile(r"\d{8}", re.ASCII)
 
 # Create Typer app for report commands
 report_app = typer.Typer(
@@ -48,22 +55,30 @@ report_app = typer.Typer(
 )
 
 
+_FALLBACK_DEFAULTS = {
+    "out_dir": "master-report",
+    "summary_path": None,
+    "slides_dir": None,
+    "projects": [],
+}
+
+
 def _get_cli_defaults():
     """Get CLI defaults with fallback values."""
+    cfg_path = locate_config()
+    if cfg_path is None:
+        return dict(_FALLBACK_DEFAULTS)
     try:
-        return get_cli_defaults()
-    except Exception as e:
+        return get_cli_defaults(
+            load_settings(cfg_path, located=True), cfg_path, located=True
+        )
+    except (FileNotFoundError, KeyError) as e:
         log.warning("report.cli_defaults_error", error=str(e), security_event=True)
-        return {
-            "out_dir": "master-report",
-            "summary_path": None,
-            "slides_dir": None,
-            "projects": [],
-        }
+        return dict(_FALLBACK_DEFAULTS)
 
 
 async def _wait_for_completion_async(
-    report_dir: str, total_checks: int, prog, main_task
+    state_path: str, total_checks: int, prog, main_task
 ):
     """Async version of progress polling loop.
 
@@ -71,24 +86,19 @@ async def _wait_for_completion_async(
     for better async integration.
     """
     last_update = time.time()
-    updates = {
-        "compute": 0,
-        "networking": 0,
-        "security": 0,
-        "storage": 0,
-        "sql": 0,
-        "gke": 0,
-    }
-    categories = ["compute", "networking", "security", "storage", "sql", "gke"]
+    logged = set()
+    pairs = None
+    # Resolve the lazy logger once (setup_logging has run) rather than per event
+    log_info = log.info
 
     while not prog.finished:
-        current_state = read_state(report_dir)
+        current_state = read_state(state_path)["projects"]
         if current_state:
+            # The project set is fixed once collection starts.
+            if pairs is None:
+                pairs = tuple((p, cat) for p in current_state for cat in _CATEGORIES)
             completed = sum(
-                1
-                for p in current_state
-                for cat in categories
-                if current_state[p]["categories"][cat]["completed"]
+                current_state[p]["phases"][cat]["status"] == "done" for p, cat in pairs
             )
             if completed >= total_checks:
                 prog.update(main_task, completed=total_checks)
@@ -96,21 +106,41 @@ async def _wait_for_completion_async(
             prog.update(main_task, completed=completed)
 
             if time.time() - last_update > 0.5:
-                for p in current_state:
-                    for cat in categories:
-                        if current_state[p]["categories"][cat][
-                            "completed"
-                        ] and not updates.get(f"{p}_{cat}"):
-                            updates[f"{p}_{cat}"] = True
-                            log.info(
-                                "project_category_completed",
-                                project=p,
-                                category=cat,
-                            )
+                for p, cat in pairs:
+                    if (p, cat) in logged:
+                        continue
+                    if current_state[p]["phases"][cat]["status"] == "done":
+                        logged.add((p, cat))
+                        log_info(
+                            "project_category_completed",
+                            project=p,
+                            category=cat,
+                        )
                 last_update = time.time()
         await asyncio.sleep(0.1)
 
 
+async def _aggregate_and_init_projects(
+    aggregator: Optional[ReportAggregator], projects: List[str], state_path: str
+) -> Optional[Dict[str, Any]]:
+    """Run Prowler aggregation and project state setup concurrently.
+
+    The two steps share no data, so the aggregation disk I/O overlaps with
+    metadata collection start-up. Returns the aggregated Prowler summary,
+    or None without an aggregator.
+    """
+    init_task = asyncio.to_thread(
+        init_projects, state_path, projects, list(_CATEGORIES)
+    )
+    if aggregator is None:
+        await init_task
+        return None
+    summary, _ = await asyncio.gather(
+        asyncio.to_thread(aggregator.aggregate), init_task
+    )
+    return summary
+
+
 def create_progress_columns():
     """Create Rich progress columns for scanning."""
     return [
@@ -177,6 +207,7 @@ def report_generate(
     defaults = _get_cli_defaults()
 
     report_dir = out_dir
+    aggregator = None
     if prowler and not skip_prowler:
         if prowler_directory is None:
             prowler_directory = "prowler_output"
@@ -210,22 +241,24 @@ def report_generate(
             scanner.run()
             prog.update(task, description="Prowler scan complete", completed=True)
 
-        aggregator = ReportAggregator(input_dir=prowler_directory)
-        aggregator.run()
+        aggregator = ReportAggregator(report_dir=prowler_directory)
 
     if not projects:
         if defaults.get("projects"):
             projects = defaults["projects"]
         else:
+            if aggregator is not None:
+                aggregator.aggregate()
             log.error("no_projects_specified")
             console.print(
                 "[red]Error: No projects specified. Use --projects or configure in fulcrum.toml"
             )
             raise typer.Exit(1)
 
-    projects_state = init_projects(projects, report_dir)
+    state_path = os.path.join(report_dir, "progress.json")
+    asyncio.run(_aggregate_and_init_projects(aggregator, projects, state_path))
     total_projects = len(projects)
-    total_checks = len(projects_state) * 6
+    total_checks = total_projects * len(_CATEGORIES)
 
     with Progress(
         SpinnerColumn(),
@@ -243,7 +276,7 @@ def report_generate(
         )
         try:
             asyncio.run(
-                _wait_for_completion_async(report_dir, total_checks, prog, main_task)
+                _wait_for_completion_async(state_path, total_checks, prog, main_task)
             )
         except KeyboardInterrupt:
             console.print("\n[yellow]Interrupted by user[/]")
@@ -308,6 +341,41 @@ def validate_data(
         raise typer.Exit(code=1)
 
 
+def _to_date_token(name: str) -> str:
+    """Return the trailing ``YYYYMMDD`` token of a report name, or ``""``."""
+    tok = name.rsplit("-", 1)[-1]
+    return tok if _DATE_TOKEN_RE.fullmatch(tok) else ""
+
+
+def _resolve_report_dir(path: str) -> str:
+    """Resolve the report directory to validate with a single ``os.scandir`` pass.
+
+    Returns ``path`` itself when it is not a directory or already holds an
+    ``index.md``; otherwise the most recent ``report-*`` entry, where entries
+    carrying a date token win by token (ties go to the last one listed) and
+    the lexicographically greatest name is the fallback.
+    """
+    best_name = best_token = ""
+    fallback = ""
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name == "index.md" and entry.is_file():
+                    return path
+                if not name.startswith("report-"):
+                    continue
+                token = _to_date_token(name)
+                if token and token >= best_token:
+                    best_token, best_name = token, name
+                if name > fallback:
+                    fallback = name
+    except (FileNotFoundError, NotADirectoryError):
+        return path
+    latest = best_name or fallback
+    return os.path.join(path, latest) if latest else path
+
+
 @report_app.command(
     "validate-report",
     help=("Validate standardized Markdown report structure, syntax, and links."),
@@ -316,29 +384,7 @@ def validate_report_cmd(
     path: str = typer.Option("reports", help="Base path or specific report directory"),
 ):
     setup_logging()
-    report_dir = path
-    if os.path.isdir(path) and not os.path.isfile(os.path.join(path, "index.md")):
-        candidates = [p for p in os.listdir(path) if p.startswith("report-")]
-        if candidates:
-
-            def _to_date_token(name: str) -> str:
-                try:
-                    tok = name.split("-")[-1]
-                    if len(tok) == 8 and tok.isdigit():
-                        return tok
-                    return ""
-                except (ValueError, AttributeError) as e:
-                    log.debug("report.date_token_error", name=name, error=str(e))
-                    return ""
-
-            dated = [(n, _to_date_token(n)) for n in candidates]
-            usable = [x for x in dated if x[1]]
-            latest = (
-                sorted(usable, key=lambda x: x[1])[-1][0]
-                if usable
-                else sorted(candidates)[-1]
-            )
-            report_dir = os.path.join(path, latest)
+    report_dir = _resolve_report_dir(path)
     issues = validate_report(report_dir)
     if not issues:
         console.print(f"[green]Report validation passed[/] -> {report_dir}")
@@ -3,6 +3,8 @@
 import asyncio
 import os
 import logging
+from contextlib import ExitStack
+from logging.handlers import RotatingFileHandler
 from typing import List, Optional
 
 import structlog
@@ -11,6 +13,7 @@ from rich.console import Console
 from rich.live import Live
 from rich.table import Table
 
+from ..core.jsonio import dumps
 from ..core.logging import setup_logging
 from ..core.remediation import RemediationManager
 from ..core.settings import load_settings
@@ -27,7 +30,7 @@ from ..security.port_checker import check_port
 from ..ui.scan_dashboard import ScanDashboard
 
 console = Console()
-log = structlog.get_logger()
+log = structlog.get_logger(module="commands.security")
 
 security_app = typer.Typer(
     help="Security auditing and remediation tools",
@@ -40,6 +43,29 @@ security_app_no_prowler = typer.Typer(
 )
 
 
+_LOG_HANDLER: Optional[logging.Handler] = None
+
+
+def _redirect_logs_to_file(log_file: str) -> None:
+    """Route root logging to a rotating file so the Live dashboard stays clean.
+
+    The handler is created once per process; later calls only re-attach it
+    if something else replaced the root handlers in the meantime.
+    """
+    global _LOG_HANDLER
+    if _LOG_HANDLER is None:
+        _LOG_HANDLER = RotatingFileHandler(
+            log_file, maxBytes=10_000_000, backupCount=3
+        )
+        _LOG_HANDLER.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    root = logging.getLogger()
+    if root.handlers != [_LOG_HANDLER]:
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        root.addHandler(_LOG_HANDLER)
+    root.setLevel(logging.INFO)
+
+
 @security_app.command("scan")
 def security_scan(
     all_projects: bool = typer.Option(
@@ -126,10 +152,7 @@ def security_scan(
     else:
         # Redirect logs to file to keep UI clean
         log_file = "security-scan.log"
-        # Force reconfig of basic logging to file
-        for handler in logging.root.handlers[:]:
-            logging.root.removeHandler(handler)
-        logging.basicConfig(filename=log_file, level=logging.INFO, force=True)
+        _redirect_logs_to_file(log_file)
 
         console.print(f"[dim]Detailed logs redirected to {log_file}[/]")
 
@@ -250,11 +273,6 @@ def security_audit(
     # Use first path as root for scanning
     root_path: str = paths[0] if paths else "."
     auditor = SecurityAuditor(root_path=root_path)
-    findings = auditor.scan()
-
-    if not findings:
-        console.print("[green]No security issues found[/]")
-        raise typer.Exit(0)
 
     table = Table(title="Security Findings")
     table.add_column("File", style="cyan")
@@ -262,24 +280,34 @@ def security_audit(
     table.add_column("Type", style="red")
     table.add_column("Description", style="blue")
 
-    for finding in findings:
-        table.add_row(
-            finding.get("file", "unknown"),
-            str(finding.get("line", "?")),
-            finding.get("rule", "secret"),
-            finding.get("match_snippet", "")[:50],
-        )
+    # Rows are streamed into a Live table and, when requested, appended to an
+    # NDJSON file as they arrive, so no full findings list is kept in memory.
+    found = 0
+    with ExitStack() as stack:
+        out = None
+        for finding in auditor.iter_scan():
+            if not found:
+                stack.enter_context(Live(table, console=console, refresh_per_second=4))
+                if output:
+                    out = stack.enter_context(open(output, "wb"))
+            found += 1
+            table.add_row(
+                finding.get("file", "unknown"),
+                str(finding.get("line", "?")),
+                finding.get("rule", "secret"),
+                finding.get("match_snippet", "")[:50],
+            )
+            if out is not None:
+                out.write(dumps(finding) + b"\n")
 
-    console.print(table)
+    if not found:
+        console.print("[green]No security issues found[/]")
+        raise typer.Exit(0)
 
     if output:
-        import json
-
-        with open(output, "w") as f:
-            json.dump(findings, f, indent=2)
-        console.print(f"\n[green]Findings written to {output}[/]")
+        console.print(f"\n[green]Findings written to {output} (NDJSON)[/]")
 
-    console.print(f"\n[red]Found {len(findings)} potential security issues[/]")
+    console.print(f"\n[red]Found {found} potential security issues[/]")
     raise typer.Exit(1)
 
 
@@ -1,4 +1,8 @@
-from typing import List, Dict, Any
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import List, Dict, Any, Optional
 from ..gcp.backup import GKEBackupManager
 from ..gcp.auth import load_credentials
 from ..core.settings import load_settings
@@ -6,9 +10,20 @@ import structlog
 
 log = structlog.get_logger()
 
+# Bound on concurrent GCP list calls, kept low to stay within per-minute quotas
+MAX_WORKERS = 8
+
+# Bound on in-flight GCP calls for the asyncio entry points
+ASYNC_CONCURRENCY = 16
+
+# projects/{project}/locations/{location}/backupPlans/{plan}
+_PLAN_NAME_RE = re.compile(r"projects/([^/]+)/locations/([^/]+)/backupPlans/([^/]+)")
+
 class BackupOrchestrator:
     def __init__(self, project_id: str, sa_key_path: str = None):
         self.project_id = project_id
+        # Stable prefix of every location-scoped resource name in this project
+        self._proj_loc_prefix = f"projects/{project_id}/locations/"
         # Load settings to check for SA key if not provided
         if not sa_key_path:
             s = load_settings(None)
@@ -16,33 +31,124 @@ class BackupOrchestrator:
         
         creds, _ = load_credentials(sa_key_path)
         self.mgr = GKEBackupManager(creds, project_id)
+        # Listing results are cached per instance so each workflow pays for
+        # the GCP round-trips once; see invalidate_cache().
+        self._inventory_cache: Optional[List[Dict[str, Any]]] = None
+        self._clusters_cache: Optional[List[Dict[str, Any]]] = None
+        self._plans_by_loc: Dict[str, List[Dict[str, Any]]] = {}
+
+    def invalidate_cache(self) -> None:
+        """Drop cached clusters, backup plans and inventory."""
+        self._inventory_cache = None
+        self._clusters_cache = None
+        self._plans_by_loc.clear()
+
+    def _get_clusters(self) -> List[Dict[str, Any]]:
+        if self._clusters_cache is None:
+            self._clusters_cache = self.mgr.list_clusters()
+        return self._clusters_cache
+
+    def _get_plans(self, location: str) -> List[Dict[str, Any]]:
+        plans = self._plans_by_loc.get(location)
+        if plans is None:
+            plans = self._plans_by_loc[location] = self.mgr.list_backup_plans(location)
+        return plans
+
+    @staticmethod
+    def _cluster_names_by_location(clusters: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+        # Lets the manager skip the europe-west1 probe for a location whose
+        # clusters all have a plan there already
+        names_by_loc: Dict[str, List[str]] = {}
+        for c in clusters:
+            names_by_loc.setdefault(c['location'], []).append(c['name'])
+        return names_by_loc
+
+    def _get_all_plans(self, clusters: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Plans are listed per location; collect the unique cluster locations
+        # and fetch the ones not cached yet concurrently.
+        names_by_loc = self._cluster_names_by_location(clusters)
+        locations = list(names_by_loc)
+        missing = [loc for loc in locations if loc not in self._plans_by_loc]
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(missing))) as ex:
+                fetched = ex.map(
+                    lambda loc: self.mgr.list_backup_plans(loc, names_by_loc[loc]), missing
+                )
+                for loc, plans in zip(missing, fetched):
+                    self._plans_by_loc[loc] = plans
+        return list(chain.from_iterable(self._get_plans(loc) for loc in locations))
 
     def inventory(self) -> List[Dict[str, Any]]:
         """
         Generate an inventory of clusters and their backup status.
         """
+        if self._inventory_cache is not None:
+            return self._inventory_cache
+
+        try:
+            clusters = self._get_clusters()
+        except Exception as e:
+            log.error("failed_to_list_clusters", project=self.project_id, error=str(e))
+            return []
+
+        inventory = self._build_inventory(clusters, self._get_all_plans(clusters))
+        self._inventory_cache = inventory
+        return inventory
+
+    async def _acall(self, semaphore: asyncio.Semaphore, fn, *args):
+        # The discovery client is blocking; run it off the event loop, bounded
+        # by the semaphore. GKEBackupManager retries 429/5xx with backoff.
+        async with semaphore:
+            return await asyncio.to_thread(fn, *args)
+
+    async def ainventory(self) -> List[Dict[str, Any]]:
+        """
+        Async variant of inventory() that overlaps the per-location plan listings.
+        """
+        if self._inventory_cache is not None:
+            return self._inventory_cache
+
+        semaphore = asyncio.Semaphore(ASYNC_CONCURRENCY)
         try:
-            clusters = self.mgr.list_clusters()
+            if self._clusters_cache is None:
+                self._clusters_cache = await self._acall(semaphore, self.mgr.list_clusters)
+            clusters = self._clusters_cache
         except Exception as e:
             log.error("failed_to_list_clusters", project=self.project_id, error=str(e))
             return []
 
-        # We need to query plans per location, but list_backup_plans takes location.
-        # Clusters can be in different locations.
-        # Optimization: Collect unique locations from clusters.
-        locations = set(c['location'] for c in clusters)
-        all_plans = []
-        for loc in locations:
-            all_plans.extend(self.mgr.list_backup_plans(loc))
+        names_by_loc = self._cluster_names_by_location(clusters)
+        locations = list(names_by_loc)
+        missing = [loc for loc in locations if loc not in self._plans_by_loc]
+        fetched = await asyncio.gather(
+            *(
+                self._acall(semaphore, self.mgr.list_backup_plans, loc, names_by_loc[loc])
+                for loc in missing
+            )
+        )
+        self._plans_by_loc.update(zip(missing, fetched))
+        all_plans = list(chain.from_iterable(self._plans_by_loc[loc] for loc in locations))
+
+        inventory = self._build_inventory(clusters, all_plans)
+        self._inventory_cache = inventory
+        return inventory
 
+    def _build_inventory(
+        self, clusters: List[Dict[str, Any]], all_plans: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        # Index plans by their target cluster for an O(1) join per cluster
+        plans_by_cluster: Dict[str, List[Dict[str, Any]]] = {}
+        for p in all_plans:
+            plans_by_cluster.setdefault(p.get('cluster', ''), []).append(p)
+
+        # Full cluster name format in Backup Plan: projects/{project}/locations/{location}/clusters/{cluster}
         inventory = []
         for c in clusters:
             c_name = c['name']
             c_loc = c['location']
-            # Full cluster name format in Backup Plan: projects/{project}/locations/{location}/clusters/{cluster}
-            c_full = f"projects/{self.project_id}/locations/{c_loc}/clusters/{c_name}"
+            c_full = self._proj_loc_prefix + c_loc + "/clusters/" + c_name
             
-            matched_plans = [p for p in all_plans if p.get('cluster') == c_full]
+            matched_plans = plans_by_cluster.get(c_full, [])
             
             # Detect location mismatch
             location_mismatch = None
@@ -56,7 +162,7 @@ class BackupOrchestrator:
                 "cluster": c_name,
                 "location": c_loc,
                 "status": c.get('status'),
-                "backup_plans": [p['name'].split('/')[-1] for p in matched_plans],
+                "backup_plans": [p['name'].rpartition('/')[2] for p in matched_plans],
                 "backup_plan_full_names": [p['name'] for p in matched_plans],
                 "protected": len(matched_plans) > 0,
                 "location_mismatch": location_mismatch,
@@ -68,29 +174,29 @@ class BackupOrchestrator:
         """
         Get full details of all backup plans for the project.
         """
-        inv = self.inventory()
         plans_details = []
         
-        # We need to list plans again or extract from inventory if we had full details.
-        # But inventory only has names. Let's list all plans properly using manager.
-        # We can reuse the location logic from inventory.
-        
-        clusters = self.mgr.list_clusters()
-        locations = set(c['location'] for c in clusters)
-        all_plans = []
-        for loc in locations:
-            all_plans.extend(self.mgr.list_backup_plans(loc))
+        # Inventory only keeps plan names; the full plans come from the same
+        # cached per-location listings.
+        all_plans = self._get_all_plans(self._get_clusters())
             
         for p in all_plans:
             # Add cluster mapping for convenience
             cluster_full = p.get('cluster', '')
-            cluster_short = cluster_full.split('/')[-1] if cluster_full else "Unknown"
+            cluster_short = cluster_full.rpartition('/')[2] if cluster_full else "Unknown"
+
+            full_name = p.get('name', '')
+            m = _PLAN_NAME_RE.fullmatch(full_name)
+            if m:
+                location, plan_name = m.group(2), m.group(3)
+            else:
+                location, plan_name = "", full_name.rpartition('/')[2]
             
             plans_details.append({
-                "name": p.get('name', '').split('/')[-1],
+                "name": plan_name,
                 "full_name": p.get('name'),
                 "cluster": cluster_short,
-                "location": p.get('name', '').split('/')[3], # Extract location from full name
+                "location": location,
                 "retention_days": p.get('retentionPolicy', {}).get('backupRetainDays'),
                 "backup_config": p.get('backupConfig', {}),
                 "cron_schedule": p.get('cronSchedule', {}).get('cronSchedule'),
@@ -104,13 +210,24 @@ class BackupOrchestrator:
         List all backups across all protected clusters.
         """
         inv = self.inventory()
+        plan_names = list(dict.fromkeys(
+            plan_full
+            for item in inv
+            if item['protected']
+            for plan_full in item.get('backup_plan_full_names') or []
+        ))
+        backups_by_plan: Dict[str, List[Dict[str, Any]]] = {}
+        if plan_names:
+            with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(plan_names))) as ex:
+                backups_by_plan = dict(zip(plan_names, ex.map(self.mgr.list_backups, plan_names)))
+
         results = []
         for item in inv:
             if item['protected'] and item.get('backup_plan_full_names'):
                 # Check backups for each plan (usually one)
                 for plan_full in item['backup_plan_full_names']:
-                    plan_short = plan_full.split('/')[-1]
-                    backups = self.mgr.list_backups(plan_full)
+                    plan_short = plan_full.rpartition('/')[2]
+                    backups = backups_by_plan[plan_full]
                     if not backups:
                         results.append({
                             "project": self.project_id,
@@ -125,7 +242,7 @@ class BackupOrchestrator:
                             "project": self.project_id,
                             "cluster": item['cluster'],
                             "plan": plan_short,
-                            "backup_name": b['name'].split('/')[-1],
+                            "backup_name": b['name'].rpartition('/')[2],
                             "state": b.get('state'),
                             "create_time": b.get('createTime')
                         })
@@ -179,6 +296,8 @@ class BackupOrchestrator:
                     "status": "Skipped",
                     "reason": "Already protected"
                 })
+        if any(r["status"] == "Created" for r in results):
+            self.invalidate_cache()
         return results
 
     def run_backup(self) -> List[Dict[str, Any]]:
@@ -191,7 +310,7 @@ class BackupOrchestrator:
             if item['backup_plans']:
                 # Use the first plan found
                 plan_id = item['backup_plans'][0]
-                plan_full = f"projects/{self.project_id}/locations/{item['location']}/backupPlans/{plan_id}"
+                plan_full = self._proj_loc_prefix + item['location'] + "/backupPlans/" + plan_id
                 try:
                     op = self.mgr.create_backup(plan_full)
                     results.append({
@@ -21,21 +21,29 @@ from ..gcp.client import (
 
 log = structlog.get_logger()
 
+# Bound on concurrent list calls per project; the calls are independent
+# and each is mostly network round-trips
+COLLECT_WORKERS = 8
+
 def collect_project(project: str, creds) -> Dict[str, List[Dict]]:
     compute = build_compute(creds)
     crm = build_crm(creds)
     storage_client = build_storage_client(creds)
     sqladmin = build_sqladmin(creds)
     container = build_container(creds)
-    data: Dict[str, List[Dict]] = {}
-    data["instances"] = list_instances(compute, project)
-    data["firewalls"] = list_firewalls(compute, project)
-    data["networks"] = list_networks(compute, project)
-    data["subnetworks"] = list_subnetworks(compute, project)
-    data["iam_policy"] = [get_iam_policy(crm, project)]
-    data["buckets"] = list_buckets(storage_client, project)
-    data["sql_instances"] = list_sql_instances(sqladmin, project)
-    data["gke_clusters"] = list_gke_clusters(container, project)
+    calls = {
+        "instances": lambda: list_instances(compute, project),
+        "firewalls": lambda: list_firewalls(compute, project),
+        "networks": lambda: list_networks(compute, project),
+        "subnetworks": lambda: list_subnetworks(compute, project),
+        "iam_policy": lambda: [get_iam_policy(crm, project)],
+        "buckets": lambda: list_buckets(storage_client, project),
+        "sql_instances": lambda: list_sql_instances(sqladmin, project),
+        "gke_clusters": lambda: list_gke_clusters(container, project),
+    }
+    with ThreadPoolExecutor(max_workers=COLLECT_WORKERS) as ex:
+        futs = {key: ex.submit(fn) for key, fn in calls.items()}
+        data: Dict[str, List[Dict]] = {key: fut.result() for key, fut in futs.items()}
     return data
 
 def collect_all(sa_key_path: Optional[str] = None, projects: Optional[List[str]] = None) -> Dict[str, Dict]:
@@ -1,18 +1,30 @@
 from typing import Any, Dict, List
+import copy
+import functools
 import os
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:  # libyaml bindings not available
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+@functools.lru_cache(maxsize=16)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_Loader) or {}
+
 def load_yaml(path: str) -> Dict[str, Any]:
     try:
-        with open(path, "r") as f:
-            return yaml.safe_load(f) or {}
+        st = os.stat(path)
+        return copy.deepcopy(_parse_yaml(os.path.abspath(path), st.st_mtime_ns, st.st_size))
     except FileNotFoundError:
         return {}
 
 def write_yaml(path: str, data: Dict[str, Any]) -> None:
     os.makedirs(os.path.dirname(path), exist_ok=True)
     with open(path, "w") as f:
-        yaml.safe_dump(data, f)
+        yaml.dump(data, f, Dumper=_Dumper)
 
 def merge_config_projects(cfg: Dict[str, Any], org_id: str, projects: List[str], redact: bool) -> Dict[str, Any]:
     res = dict(cfg)
@@ -0,0 +1,46 @@
+"""JSON helpers that use ``orjson`` when it is installed and fall back to stdlib."""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def write_json(path: str, data: Any, indent: bool = True) -> None:
+    """Serialize ``data`` to ``path`` as UTF-8 JSON.
+
+    With ``orjson`` the document is encoded in one call and written as bytes;
+    otherwise ``json.dump`` streams the encoder chunks straight to the file.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=option))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2 if indent else None, ensure_ascii=False)
+
+
+def dumps(data: Any) -> bytes:
+    """Encode ``data`` as compact UTF-8 JSON bytes (one NDJSON record)."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def read_json(path: str) -> Any:
+    """Load JSON from ``path``, reading raw bytes so no text decoding pass is needed."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def loads(raw: bytes) -> Any:
+    """Decode one JSON document (e.g. an NDJSON line) from bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
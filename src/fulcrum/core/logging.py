@@ -1,7 +1,15 @@
 import logging
 import structlog
 
+_CONFIGURED = False
+
+
 def setup_logging() -> None:
+    """Configure stdlib logging and structlog once per process."""
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
+    _CONFIGURED = True
     logging.basicConfig(level=logging.INFO, format="%(message)s")
     
     # Suppress noisy library logs
@@ -1,19 +1,23 @@
 from typing import Any, List, Optional
 
 
+# Single-pass translation table for the markdown escapes applied by escape()
+_ESCAPES = str.maketrans({
+    "\\": "\\\\",
+    "|": "\\|",
+    "*": "\\*",
+    "_": "\\_",
+    "[": "\\[",
+    "]": "\\]",
+    "`": "\\`",
+    "\n": "<br/>",
+})
+
+
 def escape(text: str) -> str:
     if text is None:
         return ""
-    s = str(text)
-    s = s.replace("\\", "\\\\")
-    s = s.replace("|", "\\|")
-    s = s.replace("*", "\\*")
-    s = s.replace("_", "\\_")
-    s = s.replace("[", "\\[")
-    s = s.replace("]", "\\]")
-    s = s.replace("`", "\\`")
-    s = s.replace("\n", "<br/>")
-    return s
+    return str(text).translate(_ESCAPES)
 
 
 def header(level: int, text: str) -> str:
@@ -51,7 +55,10 @@ def table(
     s = "| " + " | ".join(sep) + " |\n"
     body_lines: List[str] = []
     for r in rows:
-        cells = [escape(r[i]) if i < len(r) else "" for i in range(cols)]
+        if len(r) == cols:
+            cells = map(escape, r)
+        else:
+            cells = [escape(r[i]) if i < len(r) else "" for i in range(cols)]
         body_lines.append("| " + " | ".join(cells) + " |")
     return h + s + "\n".join(body_lines) + ("\n" if body_lines else "")
 
@@ -1,7 +1,27 @@
+import atexit
 import os
 import json
 import time
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Set, Tuple
+
+from .jsonio import dumps, loads, read_json
+
+# Minimum seconds between appends of pending ticks to a state's update log
+FLUSH_INTERVAL = 1.0
+
+# The update log is folded into the snapshot after this many records or
+# seconds, so the replay in read_state stays short during long scans
+COMPACT_EVERY = 200
+COMPACT_INTERVAL = 30.0
+
+# path -> state; updated in memory by update_phase, persisted by compact_state
+_STATE_CACHE: Dict[str, Dict[str, Any]] = {}
+
+# path -> (project, phase) ticks not yet appended to the log
+_PENDING: Dict[str, Set[Tuple[str, str]]] = {}
+
+# path -> (time of last append, records in the log, time of last compaction)
+_LOG_INFO: Dict[str, Tuple[float, int, float]] = {}
 
 def now() -> float:
     return time.time()
@@ -12,15 +32,88 @@ def ensure_file(path: str) -> None:
         with open(path, "w") as f:
             json.dump({"projects": {}}, f)
 
+def _log_path(path: str) -> str:
+    return path + ".log"
+
 def read_state(path: str) -> Dict[str, Any]:
+    """Load the snapshot at ``path`` with any not-yet-compacted updates applied."""
     ensure_file(path)
-    with open(path, "r") as f:
-        return json.load(f)
+    st = read_json(path)
+    try:
+        with open(_log_path(path), "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                rec = loads(line)
+                proj = st["projects"].setdefault(rec["project"], {"phases": {}, "summary": {}})
+                proj["phases"][rec["phase"]] = rec["state"]
+                proj.setdefault("summary", {})["completion"] = rec["completion"]
+    except FileNotFoundError:
+        pass
+    return st
+
+def _sanitize(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop the ``_``-prefixed bookkeeping keys kept in project summaries."""
+    projects = {}
+    for name, proj in state.get("projects", {}).items():
+        summary = proj.get("summary", {})
+        if any(k.startswith("_") for k in summary):
+            proj = dict(proj, summary={k: v for k, v in summary.items() if not k.startswith("_")})
+        projects[name] = proj
+    return dict(state, projects=projects)
 
 def write_state(path: str, state: Dict[str, Any]) -> None:
+    """Atomically replace the snapshot at ``path``; it supersedes the update log."""
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(state, f)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(dumps(_sanitize(state)))
+    os.replace(tmp, path)
+    try:
+        os.remove(_log_path(path))
+    except FileNotFoundError:
+        pass
+    t = now()
+    _PENDING.pop(path, None)
+    _LOG_INFO[path] = (t, 0, t)
+
+def append_update(path: str, project: str, phase: str, state: Dict[str, Any], completion: float) -> None:
+    """Append one phase update to the ``.log`` sidecar of ``path``."""
+    record = dumps({"project": project, "phase": phase, "state": state, "completion": completion})
+    fd = os.open(_log_path(path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, record + b"\n")
+    finally:
+        os.close(fd)
+
+def _flush_ticks(path: str, st: Dict[str, Any], project: str, phase: str) -> None:
+    """Append pending ticks at most once per FLUSH_INTERVAL; compact when due."""
+    pending = _PENDING.setdefault(path, set())
+    pending.add((project, phase))
+    t = now()
+    last_flush, n_records, last_compact = _LOG_INFO.get(path, (0.0, 0, t))
+    if t - last_flush < FLUSH_INTERVAL:
+        return
+    if n_records + len(pending) > COMPACT_EVERY or t - last_compact >= COMPACT_INTERVAL:
+        compact_state(path)
+        return
+    for proj_name, ph_name in pending:
+        proj = st["projects"][proj_name]
+        append_update(path, proj_name, ph_name, proj["phases"][ph_name], proj["summary"]["completion"])
+    _LOG_INFO[path] = (t, n_records + len(pending), last_compact)
+    pending.clear()
+
+def compact_state(path: str) -> None:
+    """Fold the cached state for ``path`` into its snapshot and drop the log."""
+    cached = _STATE_CACHE.get(path)
+    if cached is not None:
+        write_state(path, cached)
+
+def compact_all() -> None:
+    for path in list(_STATE_CACHE):
+        compact_state(path)
+
+atexit.register(compact_all)
 
 def init_projects(path: str, projects: List[str], phases: List[str]) -> None:
     st = {"projects": {}}
@@ -32,14 +125,25 @@ def init_projects(path: str, projects: List[str], phases: List[str]) -> None:
             "summary": {"avg_eta": "--", "completion": 0.0}
         }
     write_state(path, st)
+    _STATE_CACHE[path] = st
 
 def update_phase(path: str, project: str, phase: str, progress: float, status: str) -> None:
-    st = read_state(path)
+    st = _STATE_CACHE.get(path)
+    if st is None:
+        st = _STATE_CACHE[path] = read_state(path)
     proj = st["projects"].setdefault(project, {"phases": {}, "summary": {}})
+    summary = proj.setdefault("summary", {})
+    if "_progress_sum" not in summary:
+        summary["_progress_sum"] = sum(p.get("progress", 0.0) for p in proj["phases"].values())
+        summary["_n_phases"] = len(proj["phases"])
+    if phase not in proj["phases"]:
+        summary["_n_phases"] += 1
     ph = proj["phases"].setdefault(phase, {})
     if ph.get("start", 0.0) == 0.0:
         ph["start"] = now()
+    old = ph.get("progress", 0.0)
     ph["progress"] = max(0.0, min(100.0, progress))
+    summary["_progress_sum"] += ph["progress"] - old
     el = now() - ph["start"]
     ph["elapsed"] = el
     remaining = max(0.0, 100.0 - ph["progress"]) / max(1e-3, ph["progress"]) * el if ph["progress"] > 0 else 0.0
@@ -47,7 +151,8 @@ def update_phase(path: str, project: str, phase: str, progress: float, status: s
     m = int((remaining % 3600) // 60)
     ph["eta"] = f"{h}:{m:02d}"
     ph["status"] = status
-    proj["phases"][phase] = ph
-    comp = sum(p.get("progress", 0.0) for p in proj["phases"].values()) / max(1, len(proj["phases"]))
-    proj["summary"]["completion"] = comp
-    write_state(path, st)
+    summary["completion"] = summary["_progress_sum"] / max(1, summary["_n_phases"])
+    if status in ("done", "error"):
+        compact_state(path)
+    else:
+        _flush_ticks(path, st, project, phase)
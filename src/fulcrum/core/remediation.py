@@ -1,3 +1,4 @@
+import logging
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 import structlog
@@ -6,6 +7,8 @@ log = structlog.get_logger()
 
 
 class RemediationResult:
+    __slots__ = ("action_name", "success", "message", "changes")
+
     def __init__(
         self,
         action_name: str,
@@ -53,23 +56,27 @@ class RemediationManager:
     def remediate(
         self, action_id: str, target: Any, dry_run: bool = False
     ) -> RemediationResult:
-        action = self.get_action(action_id)
+        action = self.actions.get(action_id)
         if not action:
             return RemediationResult(
                 action_id, False, f"No remediation action found for ID: {action_id}"
             )
 
+        # Skip building the event payloads (notably str(target)) when INFO is filtered out
+        info = log.is_enabled_for(logging.INFO)
         try:
-            log.info(
-                "remediation.start",
-                action_id=action_id,
-                target=str(target),
-                dry_run=dry_run,
-            )
+            if info:
+                log.info(
+                    "remediation.start",
+                    action_id=action_id,
+                    target=str(target),
+                    dry_run=dry_run,
+                )
             result = action.execute(target, dry_run=dry_run)
-            log.info(
-                "remediation.complete", action_id=action_id, success=result.success
-            )
+            if info:
+                log.info(
+                    "remediation.complete", action_id=action_id, success=result.success
+                )
             return result
         except Exception as e:
             log.error("remediation.failed", action_id=action_id, error=str(e))
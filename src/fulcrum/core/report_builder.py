@@ -12,16 +12,39 @@ Classes:
 """
 
 import csv
-import json
 import os
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Type
 
-
-@dataclass
+import structlog
+
+from .jsonio import write_json
+from .markdown import escape, header, link, table
+
+log = structlog.get_logger()
+
+# Pages listed in the standard index, in display order, with their titles
+_STANDARD_INDEX_PAGES: Tuple[Tuple[str, str], ...] = tuple(
+    (name, name.replace("_", " ").title())
+    for name in (
+        "compute",
+        "data_storage",
+        "data_analytics",
+        "networking",
+        "kubernetes",
+        "security",
+        "serverless",
+        "virtual_machines",
+        "storage",
+        "buckets",
+    )
+)
+
+@dataclass(slots=True)
 class ReportConfig:
     """Configuration for report generation."""
     output_dir: str = "reports"
@@ -31,7 +54,7 @@ class ReportConfig:
     version: str = "1.0.0"
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportResult:
     """Result of report generation."""
     output_dir: str
@@ -46,6 +69,14 @@ class ReportStrategy(ABC):
 
     def __init__(self, config: ReportConfig):
         self.config = config
+        self._dirs_created: set = set()
+
+    def _ensure_dir(self, d: str) -> None:
+        """Create ``d`` once per strategy; later calls skip the syscall."""
+        if d in self._dirs_created:
+            return
+        os.makedirs(d, exist_ok=True)
+        self._dirs_created.add(d)
 
     @abstractmethod
     def get_output_subdir(self) -> str:
@@ -74,19 +105,13 @@ class ReportStrategy(ABC):
         report_type = self.config.report_type
 
         # Build directory name: {base}/report-{type}-{date}
-        parent = os.path.join(out_base, f"report-{report_type}-{date_str}")
+        base_name = f"report-{report_type}-{date_str}"
+        parent = os.path.join(out_base, base_name)
 
-        # Handle duplicate directories
+        # Handle duplicate directories: reuse an empty one, else claim the next suffix
         if os.path.isdir(parent):
             try:
-                if any(True for _ in os.scandir(parent)):
-                    suffix = 2
-                    while True:
-                        candidate = f"{parent}-{suffix:02d}"
-                        if not os.path.exists(candidate):
-                            parent = candidate
-                            break
-                        suffix += 1
+                in_use = any(True for _ in os.scandir(parent))
             except OSError as e:
                 log.warning(
                     "report_builder.scandir_error",
@@ -94,29 +119,73 @@ class ReportStrategy(ABC):
                     error=str(e),
                     security_event=True
                 )
-                suffix = 2
-                while True:
-                    candidate = f"{parent}-{suffix:02d}"
-                    if not os.path.exists(candidate):
-                        parent = candidate
-                        break
-                    suffix += 1
-
-        os.makedirs(parent, exist_ok=True)
-        os.makedirs(os.path.join(parent, "projects"), exist_ok=True)
-        os.makedirs(os.path.join(parent, "data"), exist_ok=True)
+                in_use = True
+            if in_use:
+                parent = self._claim_suffixed_dir(out_base, base_name)
+
+        self._ensure_dir(parent)
+        self._ensure_dir(os.path.join(parent, "projects"))
+        self._ensure_dir(os.path.join(parent, "data"))
         return parent
 
+    def _claim_suffixed_dir(self, out_base: str, base_name: str) -> str:
+        """Create and return ``{base_name}-NN`` after the highest existing suffix.
+
+        Siblings are listed once instead of probing each suffix; creation uses
+        ``exist_ok=False`` so a concurrent run cannot claim the same directory.
+        """
+        pattern = re.compile(rf"{re.escape(base_name)}-(\d{{2,}})")
+        suffix = 1
+        try:
+            with os.scandir(out_base or ".") as it:
+                for entry in it:
+                    m = pattern.fullmatch(entry.name)
+                    if m:
+                        suffix = max(suffix, int(m.group(1)))
+        except OSError:
+            pass
+        while True:
+            suffix += 1
+            candidate = os.path.join(out_base, f"{base_name}-{suffix:02d}")
+            try:
+                os.makedirs(candidate, exist_ok=False)
+            except FileExistsError:
+                continue
+            self._dirs_created.add(candidate)
+            return candidate
+
+    def _relative_pages(self, pages: Dict[str, str]) -> Dict[str, str]:
+        """Map page names to paths relative to the output dir.
+
+        The base is resolved once; pages under it (the usual case) are sliced
+        instead of going through ``os.path.relpath`` each.
+        """
+        base = os.path.abspath(self.config.output_dir)
+        prefix = base.rstrip(os.sep) + os.sep
+        rel: Dict[str, str] = {}
+        for name, path in pages.items():
+            abs_path = os.path.abspath(path)
+            rel[name] = (
+                abs_path[len(prefix):]
+                if abs_path.startswith(prefix)
+                else os.path.relpath(abs_path, base)
+            )
+        return rel
+
     def read_csv(self, path: str) -> Tuple[List[str], List[List[str]]]:
         """Read CSV file and return headers and rows."""
         if not os.path.exists(path):
             return [], []
         with open(path, newline="") as f:
-            reader = csv.DictReader(f)
-            headers = list(reader.fieldnames or [])
-            rows: List[List[str]] = []
-            for r in reader:
-                rows.append([str(r.get(h, "")) for h in headers])
+            reader = csv.reader(f)
+            headers = next(reader, [])
+            n = len(headers)
+            # Blank lines are skipped; rows are padded or trimmed to the header width
+            rows: List[List[str]] = [
+                row[:n] if len(row) >= n else row + [""] * (n - len(row))
+                for row in reader
+                if row
+            ]
             return headers, rows
 
     def read_csv_dict(self, path: str) -> List[Dict[str, str]]:
@@ -128,19 +197,18 @@ class ReportStrategy(ABC):
 
     def write_md(self, path: str, content: str) -> None:
         """Write markdown content to file."""
-        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._ensure_dir(os.path.dirname(path))
         with open(path, "w") as f:
             f.write(content)
 
     def write_json(self, path: str, data: Any) -> None:
         """Write JSON data to file."""
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2)
+        self._ensure_dir(os.path.dirname(path))
+        write_json(path, data)
 
     def write_csv(self, path: str, headers: List[str], rows: List[List[str]]) -> None:
         """Write CSV file from headers and rows."""
-        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._ensure_dir(os.path.dirname(path))
         with open(path, "w", newline="") as f:
             writer = csv.writer(f)
             writer.writerow(headers)
@@ -155,8 +223,6 @@ class StandardReportStrategy(ReportStrategy):
 
     def format_page(self, name: str, headers: List[str], rows: List[List[str]]) -> str:
         """Format a standard report page with table."""
-        from .markdown import header, table
-
         content = header(2, name.replace("_", " ").title())
         if headers:
             content += table(headers, rows)
@@ -166,30 +232,19 @@ class StandardReportStrategy(ReportStrategy):
 
     def format_index(self, pages: Dict[str, str], author: str) -> str:
         """Format the standard report index."""
-        from .markdown import header, link, escape
-
-        lines: List[str] = []
-        lines.append(header(2, "Report Overview"))
-        lines.append(f"Author: {escape(author)}\n\n")
-        lines.append(header(3, "Contents"))
-
-        for name in [
-            "compute",
-            "data_storage",
-            "data_analytics",
-            "networking",
-            "kubernetes",
-            "security",
-            "serverless",
-            "virtual_machines",
-            "storage",
-            "buckets",
-        ]:
-            if name in pages:
-                rel = os.path.relpath(pages[name], self.config.output_dir)
-                lines.append(f"- {link(name.replace('_', ' ').title(), rel})")
-
-        return "".join(lines)
+        parts: List[str] = [
+            "## Report Overview",
+            "",
+            f"Author: {escape(author)}",
+            "",
+            "### Contents",
+            "",
+        ]
+        rel = self._relative_pages(pages)
+        for name, title in _STANDARD_INDEX_PAGES:
+            if name in rel:
+                parts.append(f"- {link(title, rel[name])}")
+        return "\n".join(parts) + "\n"
 
     def get_project_filename(self, name: str) -> str:
         return f"{name}.md"
@@ -203,8 +258,6 @@ class ExecutiveReportStrategy(ReportStrategy):
 
     def format_page(self, name: str, headers: List[str], rows: List[List[str]]) -> str:
         """Format an executive page with enhanced headers."""
-        from .markdown import table
-
         title = name.replace("_", " ").title()
         content = f"# {title}\n\n"
         if headers:
@@ -215,17 +268,17 @@ class ExecutiveReportStrategy(ReportStrategy):
 
     def format_index(self, pages: Dict[str, str], author: str) -> str:
         """Format the executive report index."""
-        lines: List[str] = []
-        lines.append("# Project Documentation Index\n\n")
-        lines.append(f"Author: {author}\n")
-        lines.append(f"Generated: {datetime.utcnow().isoformat()}Z\n\n")
-        lines.append("## Table of Contents\n")
-
-        for name, path in sorted(pages.items()):
-            rel = os.path.relpath(path, self.config.output_dir)
-            lines.append(f"- [{name.replace('_', ' ').title()}]({rel})")
-
-        return "\n".join(lines)
+        parts: List[str] = [
+            "# Project Documentation Index",
+            "",
+            f"Author: {author}",
+            f"Generated: {datetime.utcnow().isoformat()}Z",
+            "",
+            "## Table of Contents",
+        ]
+        for name, rel in sorted(self._relative_pages(pages).items()):
+            parts.append(f"- [{name.replace('_', ' ').title()}]({rel})")
+        return "\n".join(parts) + "\n"
 
     def get_project_filename(self, name: str) -> str:
         return f"{name}.md"
@@ -239,8 +292,6 @@ class FinOpsReportStrategy(ReportStrategy):
 
     def format_page(self, name: str, headers: List[str], rows: List[List[str]]) -> str:
         """Format a FinOps report page."""
-        from .markdown import header, table
-        
         title = name.replace("_", " ").title()
         content = header(2, title)
         if headers:
@@ -251,34 +302,35 @@ class FinOpsReportStrategy(ReportStrategy):
 
     def format_index(self, pages: Dict[str, str], author: str) -> str:
         """Format the FinOps report index."""
-        from .markdown import header, link, escape
-        
-        lines: List[str] = []
-        lines.append(header(2, "FinOps Report Overview"))
-        lines.append(f"Author: {escape(author)}\n")
-        lines.append(f"Generated: {datetime.utcnow().isoformat()}Z\n\n")
-        lines.append(header(3, "Contents"))
-        
-        # Add cost summary
-        lines.append(header(3, "Cost Summary"))
-        
+        parts: List[str] = [
+            "## FinOps Report Overview",
+            "",
+            f"Author: {escape(author)}",
+            f"Generated: {datetime.utcnow().isoformat()}Z",
+            "",
+            "### Contents",
+            "",
+            # Add cost summary
+            "### Cost Summary",
+            "",
+        ]
+
+        rel = self._relative_pages(pages)
+
         # Add recommendations if available
-        if "recommendations" in pages:
-            rel = os.path.relpath(pages["recommendations"], self.config.output_dir)
-            lines.append(f"- [Cost Optimization Recommendations]({rel})")
-        
+        if "recommendations" in rel:
+            parts.append(f"- [Cost Optimization Recommendations]({rel['recommendations']})")
+
         # Add GKE costs if available
-        if "gke_costs" in pages:
-            rel = os.path.relpath(pages["gke_costs"], self.config.output_dir)
-            lines.append(f"- [GKE Cost Analysis]({rel})")
-        
+        if "gke_costs" in rel:
+            parts.append(f"- [GKE Cost Analysis]({rel['gke_costs']})")
+
         # Add other pages
-        for name in sorted(pages.keys()):
-            if name not in ["recommendations", "gke_costs"]:
-                rel = os.path.relpath(pages[name], self.config.output_dir)
-                lines.append(f"- [{name.replace('_', ' ').title()}]({rel})")
-        
-        return "\n".join(lines)
+        for name in sorted(rel):
+            if name not in ("recommendations", "gke_costs"):
+                parts.append(f"- [{name.replace('_', ' ').title()}]({rel[name]})")
+
+        return "\n".join(parts) + "\n"
 
     def get_project_filename(self, name: str) -> str:
         return f"{name}.md"
@@ -296,12 +348,21 @@ class ReportBuilder:
         "std": StandardReportStrategy,
         "sec": StandardReportStrategy,
         "executive": ExecutiveReportStrategy,
-        "finops": "FinOpsReportStrategy",  # Lazy reference for now
+        "finops": FinOpsReportStrategy,
     }
 
     def __init__(self, strategy: Optional[ReportStrategy] = None):
         self.strategy = strategy or StandardReportStrategy(ReportConfig())
 
+    @classmethod
+    def from_config(cls, config: ReportConfig) -> "ReportBuilder":
+        """Create a builder using the strategy registered for ``config.report_type``."""
+        try:
+            strategy_cls = cls.STRATEGIES[config.report_type]
+        except KeyError:
+            raise ValueError(f"Unknown report type: {config.report_type}") from None
+        return cls(strategy_cls(config))
+
     def set_strategy(self, strategy: ReportStrategy) -> "ReportBuilder":
         """Set the report generation strategy."""
         self.strategy = strategy
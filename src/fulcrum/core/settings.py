@@ -1,8 +1,10 @@
+import functools
 import os
+import stat
+import tomllib
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from pydantic import BaseModel, Field
-import tomlkit
 import structlog
 
 log = structlog.get_logger()
@@ -22,10 +24,46 @@ ALLOWED_CONFIG_DIRS = [
 ]
 
 
+@functools.lru_cache(maxsize=8)
+def _resolve_allowed(dirs: Tuple[Path, ...]) -> Tuple[str, ...]:
+    """Resolve allowed base directories once per distinct list."""
+    resolved = []
+    for d in dirs:
+        try:
+            resolved.append(os.path.realpath(d))
+        except (OSError, RuntimeError):
+            continue
+    return tuple(resolved)
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_path(abs_path: str) -> str:
+    return os.path.realpath(abs_path)
+
+
+def _symlink_component(path: str, stop_at: set) -> Optional[str]:
+    """Return the first symlink among ``path`` and its parents below ``stop_at``."""
+    p = path
+    while p not in stop_at:
+        try:
+            if stat.S_ISLNK(os.lstat(p).st_mode):
+                return p
+        except FileNotFoundError:
+            pass
+        parent = os.path.dirname(p)
+        if parent == p:
+            break
+        p = parent
+    return None
+
+
 def _is_path_safe(requested_path: Path, allowed_dirs: List[Path]) -> bool:
     """
     Check if a path is within allowed directories.
 
+    Symlinks are rejected before resolving: realpath would follow them and
+    hide a link inside an allowed directory that points outside of it.
+
     Args:
         requested_path: Path to validate
         allowed_dirs: List of allowed base directories
@@ -34,20 +72,38 @@ def _is_path_safe(requested_path: Path, allowed_dirs: List[Path]) -> bool:
         True if path is safe, False otherwise
     """
     try:
-        resolved = requested_path.resolve()
-        for allowed in allowed_dirs:
-            allowed_resolved = allowed.resolve()
-            # Check if resolved path starts with allowed directory
-            try:
-                resolved.relative_to(allowed_resolved)
+        # Plain strings from here on; pathlib objects are only the interface.
+        # Absolute but not normalized: abspath would collapse "link/.." as
+        # text, while the filesystem follows the link first.
+        abs_path = os.path.join(os.getcwd(), os.fspath(requested_path))
+        allowed_resolved_dirs = _resolve_allowed(tuple(allowed_dirs))
+        stop_at = {os.path.abspath(d) for d in allowed_dirs}
+        stop_at.update(allowed_resolved_dirs)
+        # Walk the path as given so a "link/.." segment is still lstat'ed
+        link = _symlink_component(abs_path, stop_at)
+        if link is not None:
+            log.error(
+                "settings.symlink_rejected",
+                path=str(requested_path),
+                link=link,
+                security_event=True,
+            )
+            return False
+        resolved = _resolve_path(abs_path)
+        for allowed_resolved in allowed_resolved_dirs:
+            if resolved == allowed_resolved or resolved.startswith(
+                allowed_resolved.rstrip(os.sep) + os.sep
+            ):
                 return True
-            except ValueError:
-                continue
         return False
     except (OSError, ValueError):
         return False
 
 
+# Resolve the default allow-list at import so the first lookup is warm
+_resolve_allowed(tuple(ALLOWED_CONFIG_DIRS))
+
+
 def safe_resolve_config(path: Optional[str]) -> Optional[Path]:
     """
     Resolve config path with security validation.
@@ -184,6 +240,28 @@ class Settings(BaseModel):
     metadata: MetadataSettings = MetadataSettings()
 
 
+# Top-level TOML sections and the model each one is loaded into
+_SECTIONS = {
+    "org": OrgSettings,
+    "catalog": CatalogSettings,
+    "billing": BillingSettings,
+    "finops": FinOpsSettings,
+    "labels": LabelsSettings,
+    "redaction": RedactionSettings,
+    "refresh": RefreshSettings,
+    "credentials": Settings.CredentialsSettings,
+    "security": Settings.SecuritySettings,
+    "reports": Settings.ReportsSettings,
+    "output": Settings.OutputSettings,
+    "metadata": Settings.MetadataSettings,
+    "decommission": DecommissionSettings,
+}
+
+# Shared default instances for sections absent from the file. Parsed settings
+# are only handed out as deep copies, so these are never mutated.
+_DEFAULTS = {name: model() for name, model in _SECTIONS.items()}
+
+
 def default_paths() -> List[str]:
     paths: List[str] = []
     cwd = os.getcwd()
@@ -193,6 +271,24 @@ def default_paths() -> List[str]:
     return paths
 
 
+@functools.lru_cache(maxsize=4)
+def _validated_default_paths(
+    cwd: str, xdg: Optional[str], home: Optional[str], allowed: Tuple[Path, ...]
+) -> Tuple[str, ...]:
+    """default_paths() that pass the allow-list check.
+
+    The arguments are the inputs default_paths() and the check depend on and
+    serve as the cache key.
+    """
+    paths = []
+    for p in default_paths():
+        if _is_path_safe(Path(p), list(allowed)):
+            paths.append(p)
+        else:
+            log.error("settings.config_path_rejected", path=p, security_event=True)
+    return tuple(paths)
+
+
 def locate_config(explicit: Optional[str] = None) -> Optional[str]:
     """Locate config file with path traversal protection.
 
@@ -211,11 +307,19 @@ def locate_config(explicit: Optional[str] = None) -> Optional[str]:
             else:
                 return None
 
-        # Check default paths
-        for p in default_paths():
-            safe_path = safe_resolve_config(p)
-            if safe_path and os.path.exists(safe_path):
-                return str(safe_path)
+        # Check default paths (validated once per cwd/env/allow-list)
+        for p in _validated_default_paths(
+            os.getcwd(),
+            os.environ.get("XDG_CONFIG_HOME"),
+            os.environ.get("HOME"),
+            tuple(ALLOWED_CONFIG_DIRS),
+        ):
+            # lstat: a symlink planted after validation is not followed
+            try:
+                if stat.S_ISREG(os.lstat(p).st_mode):
+                    return p
+            except FileNotFoundError:
+                continue
 
         return None
     except SecurityError as e:
@@ -228,35 +332,54 @@ def locate_config(explicit: Optional[str] = None) -> Optional[str]:
         return None
 
 
-def load_settings(path: Optional[str] = None) -> Settings:
+@functools.lru_cache(maxsize=8)
+def _parse_settings(cfg_path: str, mtime_ns: int, size: int) -> Settings:
+    """Parse a config file; memoized per (path, mtime, size).
+
+    Models are built with ``model_construct`` (no field validation): the file
+    is our own access-controlled config, and validate_settings() checks it on
+    save and from ``fulcrum config validate``.
+    """
+    # Read-only path: stdlib tomllib is much faster than tomlkit, which is
+    # kept for save_settings() where formatting round-trips matter.
+    with open(cfg_path, "rb") as f:
+        data = tomllib.load(f)
+    return Settings.model_construct(
+        **{
+            name: model.model_construct(**data[name]) if data.get(name) else _DEFAULTS[name]
+            for name, model in _SECTIONS.items()
+        }
+    )
+
+
+def validate_settings(s: Settings) -> Settings:
+    """Run full pydantic validation over ``s``; raises ``ValidationError``."""
+    return Settings.model_validate(s.model_dump(warnings=False))
+
+
+def load_settings(path: Optional[str] = None, *, located: bool = False) -> Settings:
     """Load settings with security validation.
 
+    Parsed settings are cached per file, modification time and size; callers
+    get a deep copy so they can mutate and save it without touching the cache.
+    ``clear_settings_cache()`` drops the cache.
+
     Args:
         path: Optional explicit config path
+        located: ``path`` is already the result of ``locate_config``
 
     Returns:
         Settings object
     """
-    cfg_path = locate_config(path)
-    if cfg_path and os.path.exists(cfg_path):
+    cfg_path = path if located else locate_config(path)
+    if cfg_path:
         try:
-            with open(cfg_path, "r") as f:
-                data = tomlkit.parse(f.read())
-            return Settings(
-                org=OrgSettings(**data.get("org", {})),
-                catalog=CatalogSettings(**data.get("catalog", {})),
-                billing=BillingSettings(**data.get("billing", {})),
-                finops=FinOpsSettings(**data.get("finops", {})),
-                labels=LabelsSettings(**data.get("labels", {})),
-                redaction=RedactionSettings(**data.get("redaction", {})),
-                refresh=RefreshSettings(**data.get("refresh", {})),
-                credentials=Settings.CredentialsSettings(**data.get("credentials", {})),
-                security=Settings.SecuritySettings(**data.get("security", {})),
-                reports=Settings.ReportsSettings(**data.get("reports", {})),
-                output=Settings.OutputSettings(**data.get("output", {})),
-                metadata=Settings.MetadataSettings(**data.get("metadata", {})),
-                decommission=DecommissionSettings(**data.get("decommission", {})),
-            )
+            st = os.stat(cfg_path)
+        except FileNotFoundError:
+            return Settings()
+        try:
+            cached = _parse_settings(os.path.abspath(cfg_path), st.st_mtime_ns, st.st_size)
+            return cached.model_copy(deep=True)
         except (OSError, IOError, Exception) as e:
             log.error(
                 "settings.load_error", path=cfg_path, error=str(e), security_event=True
@@ -265,70 +388,35 @@ def load_settings(path: Optional[str] = None) -> Settings:
     return Settings()
 
 
+def clear_settings_cache() -> None:
+    """Drop the parsed settings cached by load_settings()."""
+    _parse_settings.cache_clear()
+
+
 def save_settings(path: Optional[str], s: Settings) -> str:
+    data = validate_settings(s).model_dump()
     cfg_path = locate_config(path)
     os.makedirs(os.path.dirname(cfg_path), exist_ok=True)
-    doc = tomlkit.document()
-    doc.add("org", tomlkit.table())
-    doc["org"]["org_id"] = s.org.org_id
-    doc["org"]["folder_ids"] = s.org.folder_ids
-    doc.add("catalog", tomlkit.table())
-    doc["catalog"]["projects"] = s.catalog.projects
-    doc["catalog"]["timeout_sec"] = s.catalog.timeout_sec
-    doc["catalog"]["limit_per_project"] = s.catalog.limit_per_project
-    doc.add("billing", tomlkit.table())
-    doc["billing"]["export_dataset"] = s.billing.export_dataset
-    doc.add("finops", tomlkit.table())
-    doc["finops"]["billing_project_id"] = s.finops.billing_project_id
-    doc["finops"]["billing_account_id"] = s.finops.billing_account_id
-    doc["finops"]["default_date_range_days"] = s.finops.default_date_range_days
-    doc["finops"]["include_recommendations"] = s.finops.include_recommendations
-    doc["finops"]["include_gke_costs"] = s.finops.include_gke_costs
-    doc["finops"]["recommenders"] = s.finops.recommenders
-    doc.add("labels", tomlkit.table())
-    doc["labels"]["owner"] = s.labels.owner
-    doc["labels"]["cost_center"] = s.labels.cost_center
-    doc["labels"]["env"] = s.labels.env
-    doc.add("redaction", tomlkit.table())
-    doc["redaction"]["enabled"] = s.redaction.enabled
-    doc.add("refresh", tomlkit.table())
-    doc["refresh"]["cadence"] = s.refresh.cadence
-    doc.add("credentials", tomlkit.table())
-    doc["credentials"]["sa_key_path"] = s.credentials.sa_key_path or ""
-    doc["credentials"]["impersonate_service_account"] = (
-        s.credentials.impersonate_service_account or ""
-    )
-    doc["credentials"]["quota_project"] = s.credentials.quota_project or ""
-    doc.add("security", tomlkit.table())
-    doc["security"]["prowler_bin"] = s.security.prowler_bin
-    doc["security"]["api_url"] = s.security.api_url
-    doc["security"]["api_token"] = s.security.api_token
-    doc["security"]["timeout_sec"] = s.security.timeout_sec
-    doc.add("reports", tomlkit.table())
-    doc["reports"]["out_base"] = s.reports.out_base
-    doc["reports"]["formats"] = s.reports.formats
-    doc["reports"]["default_date"] = s.reports.default_date
-    doc.add("output", tomlkit.table())
-    doc["output"]["base_dir"] = s.output.base_dir
-    doc["output"]["summary_path"] = s.output.summary_path
-    doc["output"]["slides_dir"] = s.output.slides_dir
-    doc["output"]["csv_dir"] = s.output.csv_dir
-    doc["output"]["access_dir"] = s.output.access_dir
-    doc["output"]["raw_dir"] = s.output.raw_dir
-    doc.add("metadata", tomlkit.table())
-    doc["metadata"]["author"] = s.metadata.author
-    doc["metadata"]["version"] = s.metadata.version
-    doc.add("decommission", tomlkit.table())
-    doc["decommission"]["bucket_whitelist"] = s.decommission.bucket_whitelist
+    # TOML has no null; unset optional values are written as empty strings
+    doc = {
+        section: {k: "" if v is None else v for k, v in values.items()}
+        for section, values in data.items()
+    }
+    import tomlkit  # only needed on the write path
+
     with open(cfg_path, "w") as f:
         f.write(tomlkit.dumps(doc))
     return cfg_path
 
 
-def get_cli_defaults(s: Settings, cfg_path: Optional[str] = None) -> dict:
+def get_cli_defaults(
+    s: Settings, cfg_path: Optional[str] = None, *, located: bool = False
+) -> dict:
+    """CLI defaults derived from ``s``; pass ``located=True`` when ``cfg_path``
+    already came from ``locate_config`` to skip resolving it again."""
     from datetime import datetime, timezone
 
-    cfg_dir = os.path.dirname(locate_config(cfg_path) or "")
+    cfg_dir = os.path.dirname((cfg_path if located else locate_config(cfg_path)) or "")
     def_date = s.reports.default_date or "now"
     date_resolved = (
         datetime.now(timezone.utc).strftime("%Y%m%d") if def_date == "now" else def_date
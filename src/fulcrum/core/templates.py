@@ -22,19 +22,25 @@ Usage:
     )
 """
 
+import operator
 import os
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import jinja2
 import structlog
 
+if TYPE_CHECKING:
+    import jinja2
+
 log = structlog.get_logger()
 
 # Template directory - templates are in src/templates/
 TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
 
+# Ahead-of-time compiled templates, produced by compile_templates()
+COMPILED_DIR = TEMPLATE_DIR / "_compiled"
+
 # Default templates
 DEFAULT_TEMPLATES = {
     "report_page": "report_page.j2",
@@ -55,17 +61,34 @@ class TemplateEngine:
     - Context-aware rendering
     """
 
-    def __init__(self, template_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        template_dir: Optional[Path] = None,
+        compiled_dir: Optional[Path] = COMPILED_DIR,
+    ):
         self.template_dir = template_dir or TEMPLATE_DIR
-        self._env: Optional[jinja2.Environment] = None
-        self._cache: Dict[str, jinja2.Template] = {}
+        self.compiled_dir = compiled_dir
+        self._env: Optional["jinja2.Environment"] = None
+        self._cache: Dict[str, "jinja2.Template"] = {}
 
     @property
-    def env(self) -> jinja2.Environment:
-        """Get or create the Jinja2 environment."""
+    def env(self) -> "jinja2.Environment":
+        """Get or create the Jinja2 environment (jinja2 is imported on first use)."""
         if self._env is None:
+            import jinja2
+
+            source_loader = jinja2.FileSystemLoader(str(self.template_dir))
+            loader: jinja2.BaseLoader = source_loader
+            if self.compiled_dir is not None and _compiled_is_fresh(
+                self.template_dir, self.compiled_dir
+            ):
+                # Precompiled modules skip lexing/compiling on cold start;
+                # templates missing from them still load from source
+                loader = jinja2.ChoiceLoader(
+                    [jinja2.ModuleLoader(str(self.compiled_dir)), source_loader]
+                )
             self._env = jinja2.Environment(
-                loader=jinja2.FileSystemLoader(str(self.template_dir)),
+                loader=loader,
                 autoescape=False,  # We handle escaping ourselves
                 trim_blocks=True,
                 lstrip_blocks=True,
@@ -76,7 +99,7 @@ class TemplateEngine:
             self._env.filters["join"] = lambda x, y: y.join(x)
         return self._env
 
-    def get_template(self, name: str) -> jinja2.Template:
+    def get_template(self, name: str) -> "jinja2.Template":
         """Get a template by name (with caching)."""
         if name not in self._cache:
             self._cache[name] = self.env.get_template(name)
@@ -101,6 +124,8 @@ class TemplateEngine:
         Returns:
             Rendered markdown content
         """
+        import jinja2
+
         try:
             # Map template name to filename if needed
             template_file = DEFAULT_TEMPLATES.get(template_name, template_name)
@@ -116,6 +141,23 @@ class TemplateEngine:
             raise
 
 
+def _compiled_is_fresh(template_dir: Path, compiled_dir: Path) -> bool:
+    """True if ``compiled_dir`` exists and is newer than every template source."""
+    try:
+        built = compiled_dir.stat().st_mtime
+    except FileNotFoundError:
+        return False
+    return all(p.stat().st_mtime <= built for p in template_dir.glob("*.j2"))
+
+
+def compile_templates(target: Path = COMPILED_DIR) -> Path:
+    """Precompile the bundled templates into importable modules (build step)."""
+    engine = TemplateEngine(compiled_dir=None)
+    engine.env.compile_templates(str(target), zip=None, ignore_errors=False)
+    os.utime(target)
+    return target
+
+
 # Global template engine instance
 _engine: Optional[TemplateEngine] = None
 
@@ -128,6 +170,23 @@ def get_engine() -> TemplateEngine:
     return _engine
 
 
+def _emit_markdown_table(parts: List[str], headers: List[str], rows: List[List[str]]) -> None:
+    """Append the table block of report_page.j2/executive_page.j2 to ``parts``."""
+    if headers and rows:
+        parts.append("| " + " | ".join(headers) + " |\n")
+        parts.append("|" + " |".join(["---"] * len(headers)) + "|\n")
+        for row in rows:
+            parts.append("| " + " | ".join(row) + " |\n")
+        parts.append("\n\n")
+    else:
+        parts.append("No data available\n\n")
+
+
+def _uses_bundled_templates(engine: TemplateEngine) -> bool:
+    # The native emitters mirror the bundled templates only
+    return Path(engine.template_dir) == TEMPLATE_DIR
+
+
 def render_page(
     title: str,
     headers: List[str],
@@ -151,6 +210,12 @@ def render_page(
         Rendered markdown content
     """
     engine = get_engine()
+    if template == "report_page" and not extra and _uses_bundled_templates(engine):
+        parts = [f"## {title}\n\n"]
+        _emit_markdown_table(parts, headers, rows)
+        if footer:
+            parts.append(f"---\n{footer}\n")
+        return "".join(parts)
     return engine.render(
         template,
         {
@@ -217,6 +282,19 @@ def render_executive_page(
         Rendered markdown content
     """
     engine = get_engine()
+    if template == "executive_page" and not extra and _uses_bundled_templates(engine):
+        parts = [f"# {title}\n\n"]
+        _emit_markdown_table(parts, headers, rows)
+        if metadata:
+            project_id = (
+                metadata.get("project_id", "N/A")
+                if isinstance(metadata, dict)
+                else getattr(metadata, "project_id", "N/A")
+            )
+            parts.append(
+                f"---\n- **Project:** {project_id}\n- **Total Resources:** {len(rows)}\n"
+            )
+        return "".join(parts)
     return engine.render(
         template,
         {
@@ -230,6 +308,20 @@ def render_executive_page(
     )
 
 
+# Columns of the Kubernetes catalog table, in display order
+_CLUSTER_FIELDS = (
+    "project_id",
+    "name",
+    "location",
+    "masterVersion",
+    "network",
+    "subnetwork",
+    "labels",
+)
+_CLUSTER_KEYS = frozenset(_CLUSTER_FIELDS)
+_cluster_row = operator.itemgetter(*_CLUSTER_FIELDS)
+
+
 def render_kubernetes_catalog(
     author: str,
     clusters: List[Dict[str, Any]],
@@ -250,28 +342,15 @@ def render_kubernetes_catalog(
     """
     engine = get_engine()
 
-    # Extract headers and rows from clusters
-    headers = [
-        "project_id",
-        "name",
-        "location",
-        "masterVersion",
-        "network",
-        "subnetwork",
-        "labels",
-    ]
+    # Extract headers and rows from clusters; complete dicts go through the
+    # C-level itemgetter, others fall back to per-field defaults
     rows = [
-        [
-            c.get("project_id", ""),
-            c.get("name", ""),
-            c.get("location", ""),
-            c.get("masterVersion", ""),
-            c.get("network", ""),
-            c.get("subnetwork", ""),
-            c.get("labels", ""),
-        ]
+        _cluster_row(c)
+        if _CLUSTER_KEYS <= c.keys()
+        else tuple(c.get(k, "") for k in _CLUSTER_FIELDS)
         for c in clusters
     ]
+    headers = list(_CLUSTER_FIELDS)
 
     return engine.render(
         template,
@@ -1,10 +1,27 @@
+import shutil
 import subprocess
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from .runner import run_gcloud_json, GCloudError
 import structlog
 
 log = structlog.get_logger()
 
+# Bound on concurrent gcloud listings while walking a registry tree
+SCAN_WORKERS = 8
+
+# Default bound on concurrent image copies in migrate_project
+COPY_WORKERS = 8
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=1)
+def _crane() -> Optional[str]:
+    """Path of the crane binary, if installed."""
+    return shutil.which("crane")
+
 
 class GCRMigration:
     def __init__(
@@ -16,6 +33,10 @@ class GCRMigration:
         self.project_id = project_id
         self.location = location
         self.repo_name = repo_name
+        # Per-run caches so each registry path costs one gcloud call; the
+        # audit and the subsequent copies both resolve the latest tag.
+        self._tag_cache: Dict[str, Optional[Tuple[str, str]]] = {}
+        self._scan_cache: Dict[str, List[str]] = {}
 
     def audit_gcr_images(
         self, recursive: bool = False, specific_host: Optional[str] = None
@@ -24,55 +45,68 @@ class GCRMigration:
         If recursive is True, scans sub-repositories (expensive).
         If specific_host is provided, scans only that host/path.
         """
-        images = []
+        images: set[str] = set()
         hosts = (
             [specific_host]
             if specific_host
             else [f"gcr.io/{self.project_id}", f"eu.gcr.io/{self.project_id}"]
         )
 
-        for host in hosts:
-            if recursive:
-                log.info("ar.audit_recursive_start", root=host)
-                images.extend(self._scan_recursive(host))
-            else:
-                try:
-                    res = run_gcloud_json(
-                        ["container", "images", "list", f"--repository={host}"]
-                    )
-                    for item in res:
-                        if "name" in item:
-                            images.append(item["name"])
-                except GCloudError:
-                    pass
-        return sorted(list(set(images)))
+        # Hosts are independent; each scan is dominated by gcloud round-trips
+        scan = self._scan_recursive if recursive else self._scan_host
+        with ThreadPoolExecutor(max_workers=len(hosts)) as ex:
+            for found in ex.map(scan, hosts):
+                images.update(found)
+        return sorted(images)
 
-    def _scan_recursive(self, current_path: str) -> List[str]:
-        """Recursively find images under current_path."""
-        found = []
+    def _scan_host(self, host: str) -> List[str]:
+        """List the top-level images of host."""
+        children = self._list_children(host)
+        return [item["name"] for item in children or [] if "name" in item]
+
+    def _list_children(self, path: str) -> Optional[List[dict]]:
+        """List the entries under path, or None if it can't be listed."""
         try:
-            # 1. List children
-            children = run_gcloud_json(
-                ["container", "images", "list", f"--repository={current_path}"]
+            return run_gcloud_json(
+                ["container", "images", "list", f"--repository={path}"]
             )
-
-            # If we have children, recurse into them
-            if children:
-                for child in children:
-                    name = child.get("name")
-                    if name:
-                        found.extend(self._scan_recursive(name))
-            else:
-                # 2. No children, check if it's an image (has tags)
-                # Optimization: Only check if it looks like a repo path (depth?)
-                # But safer to just check tags.
-                if self.get_latest_tag(current_path):
-                    found.append(current_path)
-
         except GCloudError:
             # Access denied or not a repo
-            pass
+            return None
+
+    def _scan_recursive(self, current_path: str) -> List[str]:
+        """Recursively find images under current_path."""
+        found = self._scan_cache.get(current_path)
+        if found is None:
+            found = self._scan_cache[current_path] = self._walk_tree(current_path)
+        return found
+
+    def _walk_tree(self, current_path: str) -> List[str]:
+        """Find images under current_path.
 
+        The tree is walked level by level so the listings of sibling paths
+        run concurrently.
+        """
+        log.info("ar.audit_recursive_start", root=current_path)
+        found = []
+        frontier = [current_path]
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as ex:
+            while frontier:
+                next_frontier = []
+                leaves = []
+                for path, children in zip(frontier, ex.map(self._list_children, frontier)):
+                    if children is None:
+                        continue
+                    if children:
+                        # Recurse into the children on the next pass
+                        next_frontier.extend(c["name"] for c in children if c.get("name"))
+                    else:
+                        # No children, check if it's an image (has tags)
+                        leaves.append(path)
+                for path, tag in zip(leaves, ex.map(self.get_latest_tag, leaves)):
+                    if tag:
+                        found.append(path)
+                frontier = next_frontier
         return found
 
     def ensure_ar_repo(self) -> str:
@@ -115,8 +149,18 @@ class GCRMigration:
         log.info("ar.repo_created", repo=repo_path)
         return repo_path
 
-    def get_latest_tag(self, image_name: str) -> Optional[str]:
-        """Get the most recent tag for an image."""
+    def get_latest_tag(self, image_name: str) -> Optional[Tuple[str, str]]:
+        """Get the most recent tag for an image.
+
+        Returns ``("tag", tag)``, or ``("digest", "sha256:...")`` for an
+        untagged image, or None if the image has neither.
+        """
+        tag = self._tag_cache.get(image_name, _MISSING)
+        if tag is _MISSING:
+            tag = self._tag_cache[image_name] = self._fetch_latest_tag(image_name)
+        return tag
+
+    def _fetch_latest_tag(self, image_name: str) -> Optional[Tuple[str, str]]:
         try:
             # gcloud container images list-tags IMAGE --limit=1 --sort-by=~timestamp --format="value(tags)"
             # output might be comma separated if multiple tags on same digest, or empty
@@ -133,52 +177,59 @@ class GCRMigration:
             if res and len(res) > 0:
                 tags = res[0].get("tags", [])
                 if tags:
-                    return tags[0]
-                # If no tags, maybe just use digest? Docker pull by digest works.
+                    return ("tag", tags[0])
+                # If no tags, use the digest; pulling by digest works.
                 digest = res[0].get("digest")
                 if digest:
-                    return f"@{digest}"
+                    return ("digest", digest)
         except GCloudError:
             pass
         return None
 
     def copy_image(self, gcr_image: str, dry_run: bool = False) -> str:
         """
-        Copy the latest version of an image from GCR to AR using local Docker daemon.
+        Copy the latest version of an image from GCR to AR.
+        Uses a registry-to-registry ``crane cp`` when crane is on PATH and
+        falls back to pulling and pushing through the local Docker daemon.
         Returns the new AR image base URL.
         """
         # Resolve tag
-        tag_or_digest = self.get_latest_tag(gcr_image)
-        if not tag_or_digest:
+        latest = self.get_latest_tag(gcr_image)
+        if not latest:
             log.warning("ar.no_tags_found", image=gcr_image)
             return f"{gcr_image} (Skipped - No tags)"
 
-        # Construct full source and dest
-        # If tag_or_digest starts with @, it's a digest.
-        separator = "@" if tag_or_digest.startswith("sha256:") else ":"
-        if tag_or_digest.startswith("@"):
-            separator = ""  # digest already includes @ usually? No, list-tags returns 'sha256:...'
-            # Wait, get_latest_tag returns "@sha256:..." if digest
-            pass
-
-        full_src = f"{gcr_image}{separator}{tag_or_digest}"
-
         image_name = gcr_image.split("/")[-1]
         ar_base = f"{self.location}-docker.pkg.dev/{self.project_id}/{self.repo_name}"
 
-        # For dest, we prefer a tag if available. If we pulled by digest, we might want to push by digest?
-        # But we can't 'tag' a target with a digest. We need a tag.
-        # If we only have digest, we might need to tag it as 'migrated-latest' or similar.
-
-        target_tag = tag_or_digest if not tag_or_digest.startswith("@") else "latest"
-        full_dest = f"{ar_base}/{image_name}:{target_tag}"
+        # The destination needs a tag; an image only known by digest is
+        # pushed as 'latest'.
+        kind, value = latest
+        if kind == "digest":
+            full_src = f"{gcr_image}@{value}"
+            full_dest = f"{ar_base}/{image_name}:latest"
+        else:
+            full_src = f"{gcr_image}:{value}"
+            full_dest = f"{ar_base}/{image_name}:{value}"
 
         log.info("ar.copy_start", src=full_src, dest=full_dest)
 
         if dry_run:
             return full_dest
 
+        crane = _crane()
         try:
+            if crane:
+                # Layers are copied server-side; nothing lands on local disk
+                subprocess.run(
+                    [crane, "cp", full_src, full_dest],
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                )
+                log.info("ar.copy_success", dest=full_dest)
+                return full_dest
+
             # 1. Pull
             subprocess.run(
                 ["docker", "pull", full_src],
@@ -223,6 +274,7 @@ def migrate_project(
     dry_run: bool = False,
     recursive: bool = False,
     specific_host: Optional[str] = None,
+    copies_parallel: int = COPY_WORKERS,
 ):
     migrator = GCRMigration(project_id, location)
 
@@ -240,16 +292,21 @@ def migrate_project(
     else:
         log.info("ar.dry_run_repo", repo=migrator.repo_name)
 
-    mapping = []
-
-    # 3. Copy
-    for img in images:
-        log.info("ar.copy_processing", image=img)
-        try:
-            new_url = migrator.copy_image(img, dry_run=dry_run)
-            mapping.append({"old": img, "new": new_url})
-            log.info("ar.copy_mapping", source=img, dest=new_url)
-        except Exception as e:
-            log.error("ar.copy_failed", image=img, error=str(e))
-
-    return mapping
+    # 3. Copy; each copy mostly waits on subprocesses, so run them concurrently
+    copied: Dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(copies_parallel, len(images)))) as ex:
+        futures = {}
+        for img in images:
+            log.info("ar.copy_processing", image=img)
+            futures[ex.submit(migrator.copy_image, img, dry_run)] = img
+        for fut in as_completed(futures):
+            img = futures[fut]
+            try:
+                new_url = fut.result()
+                copied[img] = new_url
+                log.info("ar.copy_mapping", source=img, dest=new_url)
+            except Exception as e:
+                log.error("ar.copy_failed", image=img, error=str(e))
+
+    # Keep the mapping in audit order regardless of completion order
+    return [{"old": img, "new": copied[img]} for img in images if img in copied]
@@ -1,9 +1,17 @@
+import functools
 import json
+import logging
 import os
+import random
+import re
+import time
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 import structlog
 
+from ..core.jsonio import read_json
+from .client import execute
+
 log = structlog.get_logger()
 
 
@@ -15,40 +23,42 @@ class SecurityError(Exception):
 
 # Required file permissions for service account keys (0o600 = owner read/write only)
 REQUIRED_SA_KEY_MODE = 0o600
+_REQUIRED_SA_KEY_MODE_STR = oct(REQUIRED_SA_KEY_MODE)[-3:]
+
+# (realpath, inode, mtime_ns, size) -> validBeforeTime of keys that passed
+# validation, so a key file is read once per version rather than per client
+_SA_EXPIRY_CACHE: Dict[tuple, Optional[str]] = {}
+
+_UNREAD = object()
+
+_CURRENT_UID = os.getuid()
 
 
+# Shape of an RFC3339 timestamp; a missing offset is accepted and read as UTC
+_RFC3339_RE = re.compile(
+    r"\d{4}-\d{2}-\d{2}[Tt ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:[Zz]|[+-]\d{2}:?\d{2})?"
+)
+
+
+@functools.lru_cache(maxsize=4096)
 def _parse_rfc3339_timestamp(timestamp_str: str) -> Optional[datetime]:
-    """Parse RFC3339 timestamp string to datetime object."""
-    if not timestamp_str:
+    """Parse RFC3339 timestamp string to datetime object (memoized)."""
+    # Reject malformed input up front rather than via fromisoformat's exception
+    if not timestamp_str or not _RFC3339_RE.fullmatch(timestamp_str):
         return None
     try:
-        # Handle common RFC3339 formats
-        # Example: "2024-01-01T00:00:00Z" or "2024-01-01T00:00:00.000Z"
-        if timestamp_str.endswith("Z"):
-            timestamp_str = timestamp_str[:-1] + "+00:00"
-        # Parse with timezone
-        from datetime import timedelta
-
-        if "+" in timestamp_str:
-            tz_part = timestamp_str.split("+")[1]
-            hours, minutes = tz_part.split(":")
-            tz = timezone(timedelta(hours=int(hours), minutes=int(minutes)))
-            dt_str = timestamp_str.split("+")[0]
-        elif "-" in timestamp_str[-6:-4]:  # Check for negative offset like -05:00
-            tz_part = timestamp_str[-6:]
-            hours, minutes = tz_part.split(":")
-            tz = timezone(timedelta(hours=int(hours), minutes=int(minutes)))
-            dt_str = timestamp_str[:-6]
-        else:
-            tz = timezone.utc
-            dt_str = timestamp_str
-
-        return datetime.fromisoformat(dt_str).replace(tzinfo=tz)
-    except (ValueError, AttributeError):
+        # Handles "Z" and numeric offsets, e.g. "2024-01-01T00:00:00.000Z";
+        # RFC3339 also allows lowercase "t"/"z", which fromisoformat does not
+        dt = datetime.fromisoformat(timestamp_str.upper())
+    except (ValueError, TypeError):
         return None
+    # No offset given: treat as UTC
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
 
 
-def validate_service_account_key(sa_key_path: str) -> bool:
+def validate_service_account_key(
+    sa_key_path: str, file_stat: Optional[os.stat_result] = None
+) -> bool:
     """
     Validate service account key file has correct permissions and is not expired.
 
@@ -59,6 +69,7 @@ def validate_service_account_key(sa_key_path: str) -> bool:
 
     Args:
         sa_key_path: Path to the service account JSON key file
+        file_stat: ``os.stat`` result for ``sa_key_path`` if the caller has one
 
     Returns:
         True if validation passes
@@ -66,38 +77,52 @@ def validate_service_account_key(sa_key_path: str) -> bool:
     Raises:
         SecurityError: If file has insecure permissions, ownership, or is expired
     """
-    if not os.path.exists(sa_key_path):
+    try:
+        if file_stat is None:
+            file_stat = os.stat(sa_key_path)
+    except FileNotFoundError:
         raise SecurityError(f"Service account key not found: {sa_key_path}")
+    except OSError as e:
+        raise SecurityError(f"Failed to validate service account key: {e}")
 
     try:
-        file_stat = os.stat(sa_key_path)
-
         # Check file permissions (must be 0o600 or more restrictive)
         if file_stat.st_mode & 0o077:  # Check for group/other permissions
             actual_mode = oct(file_stat.st_mode)[-3:]
             raise SecurityError(
                 f"Service account key has insecure permissions: {actual_mode}. "
-                f"Expected {oct(REQUIRED_SA_KEY_MODE)[-3:]}. "
+                f"Expected {_REQUIRED_SA_KEY_MODE_STR}. "
                 f"Run: chmod 600 {sa_key_path}"
             )
 
         # Check file ownership (should be owned by application user)
-        if file_stat.st_uid != os.getuid():
+        if file_stat.st_uid != _CURRENT_UID:
             raise SecurityError(
                 f"Service account key is not owned by current user "
-                f"(file UID: {file_stat.st_uid}, current UID: {os.getuid()})"
+                f"(file UID: {file_stat.st_uid}, current UID: {_CURRENT_UID})"
             )
 
-        # Check key expiration
-        _check_sa_key_expiration(sa_key_path)
-
-        # Log successful validation
-        log.info(
-            "auth.sa_key_validated",
-            path=sa_key_path,
-            mode=oct(file_stat.st_mode)[-3:],
-            security_event=True,
+        # Check key expiration; the expiry of an unchanged file is not re-read
+        cache_key = (
+            os.path.realpath(sa_key_path),
+            file_stat.st_ino,
+            file_stat.st_mtime_ns,
+            file_stat.st_size,
         )
+        valid_before = _SA_EXPIRY_CACHE.get(cache_key, _UNREAD)
+        if valid_before is _UNREAD:
+            valid_before = _read_valid_before(sa_key_path)
+        _check_valid_before(valid_before)
+        _SA_EXPIRY_CACHE[cache_key] = valid_before
+
+        # Log successful validation; skip formatting the mode when INFO is off
+        if log.is_enabled_for(logging.INFO):
+            log.info(
+                "auth.sa_key_validated",
+                path=sa_key_path,
+                mode=oct(file_stat.st_mode)[-3:],
+                security_event=True,
+            )
 
         return True
 
@@ -105,46 +130,10 @@ def validate_service_account_key(sa_key_path: str) -> bool:
         raise SecurityError(f"Failed to validate service account key: {e}")
 
 
-def _check_sa_key_expiration(sa_key_path: str) -> None:
-    """
-    Check if a service account key is expired.
-
-    Reads the SA key JSON and checks validBeforeTime against current time.
-
-    Args:
-        sa_key_path: Path to the service account JSON key file
-
-    Raises:
-        SecurityError: If the key is expired
-    """
+def _read_valid_before(sa_key_path: str) -> Optional[str]:
+    """Return the validBeforeTime of a SA key JSON file, if it has one."""
     try:
-        with open(sa_key_path, "r") as f:
-            key_data = json.load(f)
-
-        # Check for expiration timestamp
-        valid_before = key_data.get("validBeforeTime") or key_data.get(
-            "valid_before_time"
-        )
-
-        if valid_before:
-            expiration_dt = _parse_rfc3339_timestamp(valid_before)
-            if expiration_dt:
-                now = datetime.now(timezone.utc)
-                if now > expiration_dt:
-                    expired_for = now - expiration_dt
-                    raise SecurityError(
-                        f"Service account key expired on {valid_before} "
-                        f"({expired_for.days} days ago). Please rotate the key."
-                    )
-                elif expiration_dt - now < timedelta(days=7):
-                    # Warn if expiring within 7 days
-                    log.warning(
-                        "auth.sa_key_expiring_soon",
-                        expires_at=valid_before,
-                        days_until_expiry=(expiration_dt - now).days,
-                        security_event=True,
-                    )
-
+        key_data = read_json(sa_key_path)
     except json.JSONDecodeError:
         # If we can't parse the JSON, skip expiration check
         log.warning(
@@ -152,6 +141,39 @@ def _check_sa_key_expiration(sa_key_path: str) -> None:
             reason="invalid_json",
             path=sa_key_path,
         )
+        return None
+    return key_data.get("validBeforeTime") or key_data.get("valid_before_time")
+
+
+def _check_valid_before(valid_before: Optional[str]) -> None:
+    """
+    Check if a service account key is expired.
+
+    Args:
+        valid_before: The key's validBeforeTime (RFC3339), if any
+
+    Raises:
+        SecurityError: If the key is expired
+    """
+    if not valid_before or not isinstance(valid_before, str):
+        return
+    expiration_dt = _parse_rfc3339_timestamp(valid_before)
+    if expiration_dt:
+        now = datetime.now(timezone.utc)
+        if now > expiration_dt:
+            expired_for = now - expiration_dt
+            raise SecurityError(
+                f"Service account key expired on {valid_before} "
+                f"({expired_for.days} days ago). Please rotate the key."
+            )
+        elif expiration_dt - now < timedelta(days=7):
+            # Warn if expiring within 7 days
+            log.warning(
+                "auth.sa_key_expiring_soon",
+                expires_at=valid_before,
+                days_until_expiry=(expiration_dt - now).days,
+                security_event=True,
+            )
 
 
 def load_credentials(sa_key_path: Optional[str] = None, scopes: Optional[list] = None):
@@ -177,20 +199,54 @@ def load_credentials(sa_key_path: Optional[str] = None, scopes: Optional[list] =
     scopes = scopes or [
         "https://www.googleapis.com/auth/cloud-platform",
     ]
-    if sa_key_path and os.path.exists(sa_key_path):
-        # Validate SA key before loading
-        validate_service_account_key(sa_key_path)
+    file_stat = None
+    if sa_key_path:
+        try:
+            file_stat = os.stat(sa_key_path)
+        except OSError:
+            pass  # missing or unreadable key path: fall back to ADC
+    if file_stat is not None:
+        # Validate SA key before loading, reusing the stat above
+        validate_service_account_key(sa_key_path, file_stat)
+
+        return _sa_credentials(
+            os.path.realpath(sa_key_path), file_stat.st_mtime_ns, tuple(scopes)
+        )
+    # Fallback to ADC
+    return _adc_default(tuple(scopes))
 
-        from google.oauth2.service_account import Credentials as SACredentials
 
-        creds = SACredentials.from_service_account_file(sa_key_path, scopes=scopes)
-        project_id = creds.project_id
-        return creds, project_id
-    # Fallback to ADC
+@functools.lru_cache(maxsize=8)
+def _sa_credentials(real_path: str, mtime_ns: int, scopes: Tuple[str, ...]):
+    """Credentials from a SA key file; memoized per file version and scopes."""
+    from google.oauth2.service_account import Credentials as SACredentials
+
+    creds = SACredentials.from_service_account_file(real_path, scopes=list(scopes))
+    return creds, creds.project_id
+
+
+@functools.lru_cache(maxsize=8)
+def _adc_default(scopes: Tuple[str, ...]):
+    """Application Default Credentials; discovery runs once per process."""
     import google.auth
 
-    creds, project_id = google.auth.default(scopes=scopes)
-    return creds, project_id
+    return google.auth.default(scopes=list(scopes))
+
+
+# google.auth and googleapiclient are slow to import and most commands never
+# need them; these resolve the classes on first use and keep them.
+@functools.cache
+def _impersonated_credentials_cls():
+    from google.auth import impersonated_credentials
+
+    return impersonated_credentials.Credentials
+
+
+@functools.cache
+def _http_error_cls():
+    from googleapiclient.errors import HttpError
+
+    return HttpError
 
 
 def load_impersonated_credentials(
@@ -198,9 +254,7 @@ def load_impersonated_credentials(
 ):
     scopes = scopes or ["https://www.googleapis.com/auth/cloud-platform"]
     try:
-        from google.auth import impersonated_credentials
-
-        target = impersonated_credentials.Credentials(
+        target = _impersonated_credentials_cls()(
             source_credentials=base_creds,
             target_principal=target_service_account,
             target_scopes=scopes,
@@ -211,21 +265,33 @@ def load_impersonated_credentials(
         raise RuntimeError(f"impersonation.failed: {e}")
 
 
+# Statuses worth retrying in the preflight check; anything else fails fast
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
 def preflight_permission_check(
     compute_client, project_id: str
 ) -> Tuple[bool, Optional[str]]:
-    attempts = 0
-    while attempts < 3:
+    HttpError = _http_error_cls()
+
+    for attempt in range(3):
+        if attempt:
+            time.sleep(0.5 * 2**attempt + random.random() * 0.25)
         try:
             req = compute_client.zones().list(project=project_id)
-            req.execute(num_retries=1)
+            # Retries are handled here; execute() only picks the thread's Http
+            execute(req, num_retries=0)
             return True, None
-        except Exception as e:
-            msg = str(e)
-            if "permission" in msg.lower() or "403" in msg:
+        except HttpError as e:
+            status = e.resp.status
+            if status == 403:
                 return (
                     False,
                     "Missing roles (compute.viewer). Please grant least-privilege viewer roles.",
                 )
-            attempts += 1
+            if status not in _RETRYABLE_STATUSES:
+                return False, f"Preflight failed (HTTP {status})"
+        except Exception:
+            # Transport errors (timeouts, resets) are retried like 5xx
+            pass
     return False, "Preflight failed"
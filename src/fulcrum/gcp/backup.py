@@ -1,8 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Any
 import time
 import structlog
 from googleapiclient.errors import HttpError
-from .client import build_gkebackup, build_container, list_gke_clusters
+from .client import build_gkebackup, build_container, execute, list_gke_clusters, thread_http
 
 log = structlog.get_logger()
 
@@ -13,37 +14,94 @@ class GKEBackupManager:
         self.backup_client = build_gkebackup(credentials)
         self.container_client = build_container(credentials)
 
+    def _execute(self, req) -> Dict:
+        """Execute ``req`` on a per-thread authorized Http (see client.execute)."""
+        return execute(req)
+
     def list_clusters(self) -> List[Dict]:
         """List all GKE clusters in the project."""
         return list_gke_clusters(self.container_client, self.project_id)
 
-    def list_backup_plans(self, location: str = "-") -> List[Dict]:
-        """List all GKE Backup Plans in the project/location."""
+    def list_backup_plans(self, location: str = "-", clusters: Optional[List[str]] = None) -> List[Dict]:
+        """List all GKE Backup Plans in the project/location.
+
+        Plans for clusters outside europe-west1 may have been created there,
+        so that location is probed as well. When ``clusters`` (the names of
+        the clusters in ``location``) is given and every one of them already
+        has a plan in ``location``, the europe-west1 probe is skipped.
+        """
         # Try specific location first
         locations_to_try = [location]
         if location != "-" and location != "europe-west1":
              locations_to_try.append("europe-west1")
         
-        all_items = []
-        for loc in locations_to_try:
-            parent = f"projects/{self.project_id}/locations/{loc}"
-            try:
-                req = self.backup_client.projects().locations().backupPlans().list(parent=parent)
-                while req:
-                    resp = req.execute()
-                    plans = resp.get("backupPlans", [])
-                    # Enrich plans with actual location found
-                    for p in plans:
-                        p['_actual_location'] = loc
-                    all_items.extend(plans)
-                    req = self.backup_client.projects().locations().backupPlans().list_next(previous_request=req, previous_response=resp)
-                # If we found items in the specific location, we might not need to look further, 
-                # but plans could be split. For safety, we can look at both.
-            except HttpError as e:
-                # If permission denied or not found, try next location or just log debug
-                log.debug("failed_to_list_backup_plans", project=self.project_id, location=loc, error=str(e))
-        
-        return all_items
+        if len(locations_to_try) == 1:
+            return self._list_backup_plans_in(location)
+        if clusters is not None:
+            plans = self._list_backup_plans_in(location)
+            covered = {p.get("cluster") for p in plans}
+            prefix = f"projects/{self.project_id}/locations/{location}/clusters/"
+            if all(prefix + c in covered for c in clusters):
+                return plans
+            return plans + self._list_backup_plans_in("europe-west1")
+        try:
+            by_loc = self._batch_list_backup_plans(locations_to_try)
+        except Exception as e:
+            # Batch endpoint unavailable: one listing per location, concurrently
+            log.debug("backup_plans_batch_failed", project=self.project_id, error=str(e))
+            with ThreadPoolExecutor(max_workers=len(locations_to_try)) as ex:
+                by_loc = dict(zip(locations_to_try, ex.map(self._list_backup_plans_in, locations_to_try)))
+        return [p for loc in locations_to_try for p in by_loc[loc]]
+
+    def _batch_list_backup_plans(self, locations: List[str]) -> Dict[str, List[Dict]]:
+        """List plans in several locations with one batched round-trip per page."""
+        plans_api = self.backup_client.projects().locations().backupPlans()
+        by_loc: Dict[str, List[Dict]] = {loc: [] for loc in locations}
+        pending = {
+            loc: plans_api.list(parent=f"projects/{self.project_id}/locations/{loc}")
+            for loc in locations
+        }
+
+        def on_page(loc, req, next_pending):
+            def callback(request_id, resp, exc):
+                if exc is not None:
+                    log.debug("failed_to_list_backup_plans", project=self.project_id, location=loc, error=str(exc))
+                    return
+                plans = resp.get("backupPlans", [])
+                for p in plans:
+                    p['_actual_location'] = loc
+                by_loc[loc].extend(plans)
+                nxt = plans_api.list_next(previous_request=req, previous_response=resp)
+                if nxt is not None:
+                    next_pending[loc] = nxt
+            return callback
+
+        while pending:
+            next_pending: Dict[str, Any] = {}
+            batch = self.backup_client.new_batch_http_request()
+            for loc, req in pending.items():
+                batch.add(req, callback=on_page(loc, req, next_pending), request_id=loc)
+            batch.execute(http=thread_http(self.creds))
+            pending = next_pending
+        return by_loc
+
+    def _list_backup_plans_in(self, loc: str) -> List[Dict]:
+        parent = f"projects/{self.project_id}/locations/{loc}"
+        items = []
+        try:
+            req = self.backup_client.projects().locations().backupPlans().list(parent=parent)
+            while req:
+                resp = self._execute(req)
+                plans = resp.get("backupPlans", [])
+                # Enrich plans with actual location found
+                for p in plans:
+                    p['_actual_location'] = loc
+                items.extend(plans)
+                req = self.backup_client.projects().locations().backupPlans().list_next(previous_request=req, previous_response=resp)
+        except HttpError as e:
+            # If permission denied or not found, try next location or just log debug
+            log.debug("failed_to_list_backup_plans", project=self.project_id, location=loc, error=str(e))
+        return items
 
     def list_backups(self, plan_full_name: str) -> List[Dict]:
         """List all backups for a given plan."""
@@ -51,7 +109,7 @@ class GKEBackupManager:
             req = self.backup_client.projects().locations().backupPlans().backups().list(parent=plan_full_name)
             items = []
             while req:
-                resp = req.execute()
+                resp = self._execute(req)
                 items.extend(resp.get("backups", []))
                 req = self.backup_client.projects().locations().backupPlans().backups().list_next(previous_request=req, previous_response=resp)
             return items
@@ -62,7 +120,7 @@ class GKEBackupManager:
     def get_backup_plan(self, plan_name: str) -> Optional[Dict]:
         """Get a specific backup plan."""
         try:
-            return self.backup_client.projects().locations().backupPlans().get(name=plan_name).execute()
+            return self._execute(self.backup_client.projects().locations().backupPlans().get(name=plan_name))
         except HttpError:
             return None
 
@@ -90,7 +148,8 @@ class GKEBackupManager:
                 backupPlanId=plan_id,
                 body=body
             )
-            op = req.execute()
+            # Not retried: a create is not idempotent
+            op = req.execute(http=thread_http(self.creds))
             log.info("backup_plan_creation_initiated", plan=plan_id, operation=op.get("name"))
             return op
         except HttpError as e:
@@ -111,7 +170,8 @@ class GKEBackupManager:
                 backupId=backup_id,
                 body=body
             )
-            op = req.execute()
+            # Not retried: a create is not idempotent
+            op = req.execute(http=thread_http(self.creds))
             log.info("backup_initiated", backup=backup_id, plan=plan_full_name)
             return op
         except HttpError as e:
@@ -121,6 +181,6 @@ class GKEBackupManager:
     def check_backup_status(self, backup_full_name: str) -> Dict:
         """Check status of a backup."""
         try:
-            return self.backup_client.projects().locations().backupPlans().backups().get(name=backup_full_name).execute()
+            return self._execute(self.backup_client.projects().locations().backupPlans().backups().get(name=backup_full_name))
         except HttpError:
             return {}
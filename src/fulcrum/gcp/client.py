@@ -1,16 +1,100 @@
-from typing import Dict, List, Optional
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional
+
+_local = threading.local()
+
+# Partial-response masks: only the fields the reports and backup workflows
+# read are transferred and decoded. Pass fields=None for full resources.
+INSTANCE_FIELDS = (
+    "items/*/instances(name,zone,status,machineType,creationTimestamp,labels,"
+    "networkInterfaces(network,subnetwork,networkIP)),nextPageToken"
+)
+# Keeps every field that scopes a rule; without the tag and service-account
+# selectors a narrowly targeted rule reads as applying to the whole network
+FIREWALL_FIELDS = (
+    "items(name,network,direction,priority,sourceRanges,destinationRanges,"
+    "sourceTags,targetTags,sourceServiceAccounts,targetServiceAccounts,"
+    "allowed,denied,disabled,logConfig),nextPageToken"
+)
+NETWORK_FIELDS = "items(name,autoCreateSubnetworks,subnetworks),nextPageToken"
+SUBNETWORK_FIELDS = (
+    "items(name,region,network,ipCidrRange,privateIpGoogleAccess),nextPageToken"
+)
+SUBNETWORK_AGG_FIELDS = (
+    "items/*/subnetworks(name,region,network,ipCidrRange,privateIpGoogleAccess),"
+    "nextPageToken"
+)
+SQL_INSTANCE_FIELDS = (
+    "items(name,databaseVersion,region,gceZone,state,settings(tier,userLabels)),"
+    "nextPageToken"
+)
+GKE_CLUSTER_FIELDS = (
+    "clusters(name,location,status,currentMasterVersion,network,subnetwork,"
+    "resourceLabels)"
+)
+
+# Largest page the compute and sqladmin list endpoints return
+MAX_RESULTS = 500
+
+
+def _list_kwargs(fields: Optional[str], **kwargs) -> Dict:
+    kwargs["maxResults"] = MAX_RESULTS
+    if fields:
+        kwargs["fields"] = fields
+    return kwargs
+
+
+def thread_http(creds):
+    """Authorized Http for ``creds`` owned by the calling thread."""
+    https = _local.__dict__.setdefault("https", {})
+    entry = https.get(id(creds))
+    if entry is None or entry[0] is not creds:
+        import google_auth_httplib2
+        import httplib2
+
+        http = google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http())
+        entry = https[id(creds)] = (creds, http)
+    return entry[1]
+
+
+def execute(req, num_retries: int = 2) -> Dict:
+    """Execute a googleapiclient request with retries on 429/5xx.
+
+    httplib2 connections are not thread-safe, so when the request carries
+    credentials it runs on a transport owned by the calling thread; list
+    calls can then be fanned out across worker threads.
+    """
+    creds = getattr(getattr(req, "http", None), "credentials", None)
+    if creds is None:
+        return req.execute(num_retries=num_retries)
+    return req.execute(http=thread_http(creds), num_retries=num_retries)
+
+
+@functools.lru_cache(maxsize=16)
+def _build(service: str, version: str, creds):
+    """Discovery-built client, memoized per (service, version, credentials).
+
+    Building parses the discovery document and generates the resource
+    methods, so each client is built once and shared across threads. The
+    client is built from the credentials alone, never from a thread's
+    transport; requests run through execute(), which attaches the calling
+    thread's own Http.
+    """
+    from googleapiclient.discovery import build
 
+    if creds is None:
+        return build(service, version, cache_discovery=False)
+    return build(service, version, credentials=creds, cache_discovery=False)
 
-def build_compute(creds):
-    from googleapiclient.discovery import build
 
-    return build("compute", "v1", credentials=creds, cache_discovery=False)
+def build_compute(creds):
+    return _build("compute", "v1", creds)
 
 
 def build_crm(creds):
-    from googleapiclient.discovery import build
-
-    return build("cloudresourcemanager", "v1", credentials=creds, cache_discovery=False)
+    return _build("cloudresourcemanager", "v1", creds)
 
 
 def build_storage_client(creds):
@@ -20,73 +104,97 @@ def build_storage_client(creds):
 
 
 def build_sqladmin(creds):
-    from googleapiclient.discovery import build
-
-    return build("sqladmin", "v1", credentials=creds, cache_discovery=False)
+    return _build("sqladmin", "v1", creds)
 
 
-def list_instances(compute, project: str) -> List[Dict]:
-    items: List[Dict] = []
-    req = compute.instances().aggregatedList(project=project)
+def _iter_pages(collection, req, next_method: str = "list_next") -> Iterator[Dict]:
+    """Yield each response page of ``req``, following ``next_method``."""
+    page_next = getattr(collection, next_method)
     while req is not None:
-        resp = req.execute(num_retries=2)
-        for _, zone_data in (resp.get("items") or {}).items():
-            for inst in zone_data.get("instances", []):
-                items.append(inst)
-        req = compute.instances().aggregatedList_next(
-            previous_request=req, previous_response=resp
-        )
-    return items
+        resp = execute(req)
+        yield resp
+        req = page_next(previous_request=req, previous_response=resp)
 
 
-def list_firewalls(compute, project: str) -> List[Dict]:
-    items: List[Dict] = []
-    req = compute.firewalls().list(project=project)
-    while req is not None:
-        resp = req.execute(num_retries=2)
-        items.extend(resp.get("items", []))
-        req = compute.firewalls().list_next(
-            previous_request=req, previous_response=resp
-        )
-    return items
+def iter_instances(
+    compute, project: str, fields: Optional[str] = INSTANCE_FIELDS
+) -> Iterator[Dict]:
+    instances = compute.instances()
+    req = instances.aggregatedList(**_list_kwargs(fields, project=project))
+    for resp in _iter_pages(instances, req, "aggregatedList_next"):
+        for zone_data in (resp.get("items") or {}).values():
+            yield from zone_data.get("instances", ())
 
 
-def list_networks(compute, project: str) -> List[Dict]:
-    items: List[Dict] = []
-    req = compute.networks().list(project=project)
-    while req is not None:
-        resp = req.execute(num_retries=2)
-        items.extend(resp.get("items", []))
-        req = compute.networks().list_next(previous_request=req, previous_response=resp)
-    return items
+def list_instances(
+    compute, project: str, fields: Optional[str] = INSTANCE_FIELDS
+) -> List[Dict]:
+    return list(iter_instances(compute, project, fields))
 
 
-def list_subnetworks(compute, project: str, region: Optional[str] = None) -> List[Dict]:
-    items: List[Dict] = []
+def iter_firewalls(
+    compute, project: str, fields: Optional[str] = FIREWALL_FIELDS
+) -> Iterator[Dict]:
+    firewalls = compute.firewalls()
+    req = firewalls.list(**_list_kwargs(fields, project=project))
+    for resp in _iter_pages(firewalls, req):
+        yield from resp.get("items", ())
+
+
+def list_firewalls(
+    compute, project: str, fields: Optional[str] = FIREWALL_FIELDS
+) -> List[Dict]:
+    return list(iter_firewalls(compute, project, fields))
+
+
+def iter_networks(
+    compute, project: str, fields: Optional[str] = NETWORK_FIELDS
+) -> Iterator[Dict]:
+    networks = compute.networks()
+    req = networks.list(**_list_kwargs(fields, project=project))
+    for resp in _iter_pages(networks, req):
+        yield from resp.get("items", ())
+
+
+def list_networks(
+    compute, project: str, fields: Optional[str] = NETWORK_FIELDS
+) -> List[Dict]:
+    return list(iter_networks(compute, project, fields))
+
+
+def iter_subnetworks(
+    compute,
+    project: str,
+    region: Optional[str] = None,
+    fields: Optional[str] = SUBNETWORK_FIELDS,
+    agg_fields: Optional[str] = SUBNETWORK_AGG_FIELDS,
+) -> Iterator[Dict]:
+    subnetworks = compute.subnetworks()
     if region:
-        req = compute.subnetworks().list(project=project, region=region)
-        while req is not None:
-            resp = req.execute(num_retries=2)
-            items.extend(resp.get("items", []))
-            req = compute.subnetworks().list_next(
-                previous_request=req, previous_response=resp
-            )
-        return items
+        req = subnetworks.list(**_list_kwargs(fields, project=project, region=region))
+        for resp in _iter_pages(subnetworks, req):
+            yield from resp.get("items", ())
+        return
     # aggregated across regions
-    req = compute.subnetworks().aggregatedList(project=project)
-    while req is not None:
-        resp = req.execute(num_retries=2)
-        for _, reg in (resp.get("items") or {}).items():
-            items.extend(reg.get("subnetworks", []))
-        req = compute.subnetworks().aggregatedList_next(
-            previous_request=req, previous_response=resp
-        )
-    return items
+    req = subnetworks.aggregatedList(**_list_kwargs(agg_fields, project=project))
+    for resp in _iter_pages(subnetworks, req, "aggregatedList_next"):
+        for reg in (resp.get("items") or {}).values():
+            yield from reg.get("subnetworks", ())
+
+
+def list_subnetworks(
+    compute,
+    project: str,
+    region: Optional[str] = None,
+    fields: Optional[str] = SUBNETWORK_FIELDS,
+    agg_fields: Optional[str] = SUBNETWORK_AGG_FIELDS,
+) -> List[Dict]:
+    return list(iter_subnetworks(compute, project, region, fields, agg_fields))
 
 
 def get_iam_policy(crm, project: str) -> Dict:
     req = crm.projects().getIamPolicy(resource=project, body={})
-    return req.execute(num_retries=2)
+    return execute(req)
 
 
 def list_buckets(storage_client, project: str) -> List[Dict]:
@@ -103,35 +211,69 @@ def list_buckets(storage_client, project: str) -> List[Dict]:
     return items
 
 
-def list_sql_instances(sqladmin, project: str) -> List[Dict]:
-    items: List[Dict] = []
-    req = sqladmin.instances().list(project=project)
-    while req is not None:
-        resp = req.execute(num_retries=2)
-        items.extend(resp.get("items", []))
-        req = sqladmin.instances().list_next(
-            previous_request=req, previous_response=resp
-        )
-    return items
+def iter_sql_instances(
+    sqladmin, project: str, fields: Optional[str] = SQL_INSTANCE_FIELDS
+) -> Iterator[Dict]:
+    instances = sqladmin.instances()
+    req = instances.list(**_list_kwargs(fields, project=project))
+    for resp in _iter_pages(instances, req):
+        yield from resp.get("items", ())
 
 
-def build_container(creds):
-    from googleapiclient.discovery import build
+def list_sql_instances(
+    sqladmin, project: str, fields: Optional[str] = SQL_INSTANCE_FIELDS
+) -> List[Dict]:
+    return list(iter_sql_instances(sqladmin, project, fields))
 
-    return build("container", "v1", credentials=creds, cache_discovery=False)
 
+def build_container(creds):
+    return _build("container", "v1", creds)
 
-def build_gkebackup(creds):
-    from googleapiclient.discovery import build
 
-    return build("gkebackup", "v1", credentials=creds, cache_discovery=False)
+def build_gkebackup(creds):
+    return _build("gkebackup", "v1", creds)
 
 
-def list_gke_clusters(container, project: str) -> List[Dict]:
-    items: List[Dict] = []
+def iter_gke_clusters(
+    container, project: str, fields: Optional[str] = GKE_CLUSTER_FIELDS
+) -> Iterator[Dict]:
+    # clusters.list returns every cluster in one response; the API has no
+    # page token to follow
     parent = f"projects/{project}/locations/-"
-    req = container.projects().locations().clusters().list(parent=parent)
-    resp = req.execute(num_retries=2) or {}
-    for c in resp.get("clusters", []):
-        items.append(c)
-    return items
+    kwargs = {"fields": fields} if fields else {}
+    req = container.projects().locations().clusters().list(parent=parent, **kwargs)
+    resp = execute(req) or {}
+    yield from resp.get("clusters", ())
+
+
+def list_gke_clusters(
+    container, project: str, fields: Optional[str] = GKE_CLUSTER_FIELDS
+) -> List[Dict]:
+    return list(iter_gke_clusters(container, project, fields))
+
+
+def iter_backup_plans(gkebackup, project: str, location: str = "-") -> Iterator[Dict]:
+    plans = gkebackup.projects().locations().backupPlans()
+    req = plans.list(parent=f"projects/{project}/locations/{location}")
+    for resp in _iter_pages(plans, req):
+        yield from resp.get("backupPlans", ())
+
+
+def list_gke_clusters_with_backup_plans(container, gkebackup, project: str) -> List[Dict]:
+    """Clusters of ``project``, each with its ``backupPlans`` attached.
+
+    Clusters and plans (across all locations) are listed concurrently and
+    joined on the plan's ``cluster`` resource name.
+    """
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        clusters_f = ex.submit(list_gke_clusters, container, project)
+        plans_f = ex.submit(lambda: list(iter_backup_plans(gkebackup, project)))
+        clusters, plans = clusters_f.result(), plans_f.result()
+    by_cluster: Dict[str, List[Dict]] = {}
+    for p in plans:
+        by_cluster.setdefault(p.get("cluster", ""), []).append(p)
+    prefix = f"projects/{project}/locations/"
+    return [
+        dict(c, backupPlans=by_cluster.get(f"{prefix}{c.get('location')}/clusters/{c.get('name')}", []))
+        for c in clusters
+    ]
@@ -1,4 +1,4 @@
-import sys
+import asyncio
 import structlog
 from .runner import run_gcloud_json, GCloudError
 
@@ -7,55 +7,71 @@ log = structlog.get_logger()
 PROJECTS = ["motit-motosharing-test", "motit-motosharing"]
 
 
-def discover():
-    for pid in PROJECTS:
-        log.info("iap.project_check", project_id=pid)
-        try:
-            services = run_gcloud_json(
-                ["compute", "backend-services", "list", "--project", pid]
-            )
-            found = 0
-            for svc in services:
-                name = svc.get("name")
-                iap = svc.get("iap", {})
-                enabled = iap.get("enabled", False)
-                client_id = iap.get("oauth2ClientId")
-
-                if enabled:
-                    found += 1
-                    status = "CUSTOM" if client_id else "GOOGLE-MANAGED"
-                    log.info(
-                        "iap.backend_service",
-                        service=name,
-                        enabled=enabled,
-                        oauth_client=status,
-                        client_id=client_id or "N/A",
-                    )
-
-            if found == 0:
-                log.info("iap.no_backend_services", project_id=pid)
-        except GCloudError as e:
-            log.error("iap.backend_service_error", project_id=pid, error=str(e))
-
-        # Check App Engine
-        log.info("iap.app_engine_check", project_id=pid)
-        try:
-            settings = run_gcloud_json(
-                [
-                    "iap",
-                    "settings",
-                    "get",
-                    "--project",
-                    pid,
-                    "--resource-type",
-                    "app-engine",
-                ]
-            )
-            # Inspect settings
-            log.info("iap.app_engine_settings", project_id=pid, settings=settings)
-        except GCloudError as e:
-            log.warning("iap.app_engine_failed", project_id=pid, error=str(e))
+async def _gcloud(args):
+    # run_gcloud_json blocks on a gcloud subprocess; run it off the event loop
+    return await asyncio.to_thread(run_gcloud_json, args)
+
+
+async def _check_backend_services(pid: str) -> None:
+    log.info("iap.project_check", project_id=pid)
+    try:
+        services = await _gcloud(
+            ["compute", "backend-services", "list", "--project", pid]
+        )
+        found = 0
+        for svc in services:
+            name = svc.get("name")
+            iap = svc.get("iap", {})
+            enabled = iap.get("enabled", False)
+            client_id = iap.get("oauth2ClientId")
+
+            if enabled:
+                found += 1
+                status = "CUSTOM" if client_id else "GOOGLE-MANAGED"
+                log.info(
+                    "iap.backend_service",
+                    service=name,
+                    enabled=enabled,
+                    oauth_client=status,
+                    client_id=client_id or "N/A",
+                )
+
+        if found == 0:
+            log.info("iap.no_backend_services", project_id=pid)
+    except GCloudError as e:
+        log.error("iap.backend_service_error", project_id=pid, error=str(e))
+
+
+async def _check_app_engine(pid: str) -> None:
+    log.info("iap.app_engine_check", project_id=pid)
+    try:
+        settings = await _gcloud(
+            [
+                "iap",
+                "settings",
+                "get",
+                "--project",
+                pid,
+                "--resource-type",
+                "app-engine",
+            ]
+        )
+        # Inspect settings
+        log.info("iap.app_engine_settings", project_id=pid, settings=settings)
+    except GCloudError as e:
+        log.warning("iap.app_engine_failed", project_id=pid, error=str(e))
+
+
+async def discover():
+    # Every project's backend-service and App Engine checks are independent
+    await asyncio.gather(
+        *(
+            check(pid)
+            for pid in PROJECTS
+            for check in (_check_backend_services, _check_app_engine)
+        )
+    )
 
 
 if __name__ == "__main__":
-    discover()
+    asyncio.run(discover())
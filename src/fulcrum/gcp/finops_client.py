@@ -7,16 +7,323 @@ Provides integration with:
 - BigQuery billing exports for detailed cost analysis
 """
 
-from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+import asyncio
+import functools
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from itertools import chain, product
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import structlog
 
+from ..core.jsonio import read_json, write_json
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - no cross-process locking off POSIX
+    fcntl = None
+
 log = structlog.get_logger()
 
+# Billing export queries are priced per byte scanned. Results for ranges
+# that reach into the export lag window keep changing as late cost rows
+# land, older days do not.
+QUERY_CACHE_TTL_OPEN = 600
+QUERY_CACHE_TTL_CLOSED = 86400
+BILLING_EXPORT_LAG_DAYS = 1
+QUERY_CACHE_SIZE = 128
+
+# Queries that would scan more than this fail instead of being billed
+MAX_BYTES_BILLED = 1024**4
+
+# Bound on concurrent API listings; each listing is a chain of page RTTs
+FINOPS_WORKERS = 8
+
+# Largest page the Cloud Billing Catalog API serves for list_skus
+SKU_PAGE_SIZE = 5000
+
+# SKU catalogs barely change within a day; get_sku_pricing keeps one JSON
+# file per service under the user cache dir for this long
+SKU_CACHE_TTL = 86400
+
+# HTTP connections kept per BigQuery client; requests' default of 10 would
+# queue the concurrent queries of the fan-outs and async variants
+BIGQUERY_POOL_SIZE = 32
+
+# Bound on concurrent Recommender listings in get_recommendations_bulk
+RECOMMENDER_WORKERS = 16
+RECOMMENDATIONS_PAGE_SIZE = 1000
+
+
+class _QueryCache:
+    """Thread-safe LRU of query results with per-entry expiry.
+
+    Concurrent misses on the same key are collapsed: one caller runs the
+    query while the others wait for its result.
+    """
+
+    def __init__(self, maxsize: int = QUERY_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Tuple, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key: Tuple, ttl: float, load: Callable[[], Any]) -> Any:
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    self._log(key, hit=True)
+                    return entry[1]
+                pending = self._inflight.get(key)
+                if pending is None:
+                    pending = self._inflight[key] = threading.Event()
+                    self.misses += 1
+                    self._log(key, hit=False)
+                    break
+            # Another thread is running the same query; if it fails, retry
+            # and possibly become the loader.
+            pending.wait()
+
+        try:
+            value = load()
+            with self._lock:
+                self._entries[key] = (time.monotonic() + ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+            return value
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            pending.set()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def _log(self, key: Tuple, hit: bool) -> None:
+        if log.is_enabled_for(logging.INFO):
+            log.info(
+                "finops_client.query_cache",
+                method=key[0],
+                hit=hit,
+                cache_hit_ratio=round(self.hits / (self.hits + self.misses), 3),
+            )
+
+
+_QUERY_CACHE = _QueryCache()
+
+
+# Proto fields read in one call each, in the order of the dataclass
+# fields they fill
+_service_fields = attrgetter("name", "display_name")
+_sku_fields = attrgetter(
+    "sku_id",
+    "name",
+    "display_name",
+    "category.service_family",
+    "category.resource_family",
+    "category.resource_group",
+)
+_pricing_unit_fields = attrgetter("unit", "unit_count", "aggregate_quantity")
+_price_fields = attrgetter("currency_code", "units", "nanos")
+
+
+@functools.cache
+def _bigquery():
+    from google.cloud import bigquery
+
+    return bigquery
+
+
+@functools.cache
+def _recommender_retry() -> Any:
+    """Backoff for Recommender quota errors, which a fan-out readily hits."""
+    from google.api_core import exceptions, retry
+
+    return retry.Retry(
+        predicate=retry.if_exception_type(exceptions.ResourceExhausted),
+        initial=1.0,
+        multiplier=2.0,
+        maximum=30.0,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _shared_bigquery_client(project: str) -> Any:
+    """One BigQuery client per project for the whole process."""
+    from requests.adapters import HTTPAdapter
+
+    client = _bigquery().Client(project=project)
+    # client._http is the AuthorizedSession (a requests.Session) it sends with
+    adapter = HTTPAdapter(
+        pool_connections=BIGQUERY_POOL_SIZE, pool_maxsize=BIGQUERY_POOL_SIZE
+    )
+    client._http.mount("https://", adapter)
+    return client
+
+
+@functools.cache
+def _bqstorage_available() -> bool:
+    """Whether the BigQuery Storage client and pyarrow are installed."""
+    try:
+        import pyarrow  # noqa: F401
+        from google.cloud import bigquery_storage_v1  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# Result columns of the billing export query, in SELECT order
+BILLING_EXPORT_COLUMNS = (
+    "usage_date",
+    "project_id",
+    "project_name",
+    "project_number",
+    "service_name",
+    "sku_name",
+    "sku_id",
+    "total_cost",
+    "total_cost_with_credits",
+    "usage_amount",
+    "pricing_unit",
+    "labels",
+    "resource_name",
+    "resource_type",
+    "location",
+    "country",
+    "region",
+)
+
+
+# Filter shared by the billing queries. The export is partitioned by
+# ingestion day and rows are never ingested before their usage starts, so
+# partitions older than @start are pruned; later partitions are kept since
+# late rows and corrections land there. An empty @projects means all.
+_BILLING_WHERE = (
+    "_PARTITIONTIME >= @start"
+    " AND usage_start_time >= @start"
+    " AND usage_start_time < @end"
+    " AND (ARRAY_LENGTH(@projects) = 0 OR project.id IN UNNEST(@projects))"
+)
+
+# Query templates; only the table and the WHERE clause vary, values are
+# always bound as parameters
+_BILLING_EXPORT_SQL = """
+    SELECT
+        DATE(usage_start_time) as usage_date,
+        project.id as project_id,
+        project.name as project_name,
+        project.number as project_number,
+        service.description as service_name,
+        sku.description as sku_name,
+        sku.id as sku_id,
+        SUM(cost) as total_cost,
+        SUM(cost + ifnull((SELECT SUM(amount) FROM UNNEST(credits)), 0)) as total_cost_with_credits,
+        SUM(usage.amount_in_pricing_units) as usage_amount,
+        usage.pricing_unit as pricing_unit,
+        labels,
+        resource.name as resource_name,
+        resource.type as resource_type,
+        location.location as location,
+        location.country as country,
+        location.region as region
+    FROM {table}
+    WHERE {where}
+    GROUP BY
+        usage_date,
+        project_id,
+        project_name,
+        project_number,
+        service_name,
+        sku_name,
+        sku_id,
+        labels,
+        resource_name,
+        resource_type,
+        location,
+        country,
+        region
+    ORDER BY
+        usage_date DESC,
+        total_cost DESC
+"""
+
+_COST_BY_SERVICE_SQL = """
+    SELECT
+        service.description as service_name,
+        service.id as service_id,
+        SUM(cost) as total_cost,
+        IF(
+            SUM(SUM(cost)) OVER () > 0,
+            SUM(cost) / SUM(SUM(cost)) OVER () * 100,
+            0
+        ) as percentage_of_total
+    FROM {table}
+    WHERE {where}
+    GROUP BY service_name, service_id
+    ORDER BY total_cost DESC
+"""
+
+_COST_BY_PROJECT_SQL = """
+    SELECT
+        project.id as project_id,
+        project.name as project_name,
+        SUM(cost) as total_cost,
+        IF(
+            SUM(SUM(cost)) OVER () > 0,
+            SUM(cost) / SUM(SUM(cost)) OVER () * 100,
+            0
+        ) as percentage_of_total
+    FROM {table}
+    WHERE {where}
+    GROUP BY project_id, project_name
+    ORDER BY total_cost DESC
+"""
+
+
+def _normalize_billing_export(columns: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
+    """Normalize raw billing export columns in place, one column at a time."""
+    for name in ("usage_date", "project_number"):
+        columns[name] = [str(v) for v in columns[name]]
+    for name in ("total_cost", "total_cost_with_credits", "usage_amount"):
+        columns[name] = [float(v or 0.0) for v in columns[name]]
+    # labels is a repeated key/value record
+    columns["labels"] = [
+        {label["key"]: label["value"] for label in labels or ()}
+        for labels in columns["labels"]
+    ]
+    return columns
+
+
+def _utc_day_start(d: datetime) -> datetime:
+    """Midnight UTC of d's calendar day; ranges are whole days."""
+    return datetime(d.year, d.month, d.day, tzinfo=timezone.utc)
+
+
+def _query_cache_ttl(end_date: datetime) -> int:
+    """TTL for a range ending (exclusively) at end_date."""
+    today = datetime.now(timezone.utc).date()
+    if end_date.date() < today - timedelta(days=BILLING_EXPORT_LAG_DAYS):
+        return QUERY_CACHE_TTL_CLOSED
+    return QUERY_CACHE_TTL_OPEN
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GCPServiceInfo:
     """Information about a GCP service."""
 
@@ -25,7 +332,7 @@ class GCPServiceInfo:
     service_name: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GCPBillingAccount:
     """Information about a billing account."""
 
@@ -35,7 +342,7 @@ class GCPBillingAccount:
     master_billing_account: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CostRecommendation:
     """Cost optimization recommendation."""
 
@@ -51,7 +358,39 @@ class CostRecommendation:
     last_refresh: datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class UnitPrice:
+    """A price as currency, whole units and nano units."""
+
+    currency_code: str
+    units: int
+    nanos: int
+
+
+@dataclass(slots=True, frozen=True)
+class PricingUnitInfo:
+    """Pricing of one SKU pricing unit."""
+
+    unit: str
+    unit_count: float
+    aggregate_quantity: float
+    effective_unit_price: Optional[UnitPrice] = None
+
+
+@dataclass(slots=True)
+class SKUPricing:
+    """Pricing information for a SKU."""
+
+    sku_id: str
+    sku_name: str
+    display_name: str
+    service_family: str
+    resource_family: str
+    resource_group: str
+    pricing_info: List[PricingUnitInfo] = field(default_factory=list)
+
+
+@dataclass(slots=True, frozen=True)
 class CostByService:
     """Cost breakdown by GCP service."""
 
@@ -61,7 +400,7 @@ class CostByService:
     percentage_of_total: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CostByProject:
     """Cost breakdown by GCP project."""
 
@@ -71,27 +410,83 @@ class CostByProject:
     percentage_of_total: float
 
 
+def _sku_cache_path(service_id: str) -> Optional[str]:
+    """Cache file for a service's SKUs, or None if the ID isn't a plain name."""
+    if not re.fullmatch(r"[\w-]+", service_id):
+        return None
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "fulcrum", "finops", "skus", f"{service_id}.json")
+
+
+def _read_sku_cache(path: str) -> Optional[List[SKUPricing]]:
+    """SKUs cached at path, or None if the file is missing, stale or unreadable."""
+    try:
+        if time.time() - os.stat(path).st_mtime >= SKU_CACHE_TTL:
+            return None
+        records = read_json(path)
+        return [
+            SKUPricing(
+                **{
+                    **record,
+                    "pricing_info": [
+                        PricingUnitInfo(
+                            **{
+                                **unit,
+                                "effective_unit_price": UnitPrice(
+                                    **unit["effective_unit_price"]
+                                )
+                                if unit["effective_unit_price"]
+                                else None,
+                            }
+                        )
+                        for unit in record["pricing_info"]
+                    ],
+                }
+            )
+            for record in records
+        ]
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+
+
+def _write_sku_cache(path: str, skus: List[SKUPricing]) -> None:
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        write_json(tmp, [asdict(sku) for sku in skus], indent=False)
+        # Readers never see a partly written file
+        os.replace(tmp, path)
+    except OSError as e:
+        log.warning("finops_client.sku_cache_write_failed", path=path, error=str(e))
+
+
 class GCPFinOpsClient:
     """Unified client for GCP FinOps operations."""
 
-    def __init__(self, billing_project_id: str, quota_project: Optional[str] = None):
+    def __init__(
+        self,
+        billing_project_id: str,
+        quota_project: Optional[str] = None,
+        max_bytes_billed: int = MAX_BYTES_BILLED,
+    ):
         """
         Initialize the FinOps client.
 
         Args:
             billing_project_id: GCP project ID containing BigQuery billing exports
             quota_project: Optional quota project for Recommender API (required for some APIs)
+            max_bytes_billed: Bytes a billing export query may bill; BigQuery
+                fails larger queries before running them
         """
         self.billing_project_id = billing_project_id
+        self._max_bytes_billed = max_bytes_billed
         self._billing_client = None
         self._recommender_client = None
         self._bigquery_client = None
+        self._bqstorage_client = None
         self._quota_project = quota_project or billing_project_id
 
         # Set quota project via environment variable if provided
         if quota_project:
-            import os
-
             os.environ["GOOGLE_CLOUD_QUOTA_PROJECT"] = quota_project
 
     def _get_billing_client(self) -> Any:
@@ -111,30 +506,88 @@ class GCPFinOpsClient:
         return self._recommender_client
 
     def _get_bigquery_client(self) -> Any:
-        """Get or create the BigQuery client."""
+        """Get the BigQuery client shared by every client on this project."""
         if self._bigquery_client is None:
-            from google.cloud import bigquery
-
-            self._bigquery_client = bigquery.Client(project=self.billing_project_id)
+            self._bigquery_client = _shared_bigquery_client(self.billing_project_id)
         return self._bigquery_client
 
+    def _get_bqstorage_client(self) -> Any:
+        """Get or create the BigQuery Storage Read client, if installed."""
+        if self._bqstorage_client is None and _bqstorage_available():
+            from google.cloud import bigquery_storage_v1
+
+            self._bqstorage_client = bigquery_storage_v1.BigQueryReadClient()
+        return self._bqstorage_client
+
+    def _query_job_config(self, params: List[Any]) -> Any:
+        """Job config binding params, with the bytes-billed guard rail."""
+        return _bigquery().QueryJobConfig(
+            query_parameters=params, maximum_bytes_billed=self._max_bytes_billed
+        )
+
+    def _billing_table(self) -> str:
+        """The detailed billing export tables."""
+        return (
+            f"`{self.billing_project_id}.gcp_billing_export_v1"
+            ".gcp_billing_export_resource_v1_*`"
+        )
+
+    def _build_billing_filters(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        project_filter: Optional[List[str]],
+    ) -> Tuple[str, List[Any]]:
+        """WHERE clause shared by the billing queries, and its parameters."""
+        bigquery = _bigquery()
+        params = [
+            bigquery.ScalarQueryParameter(
+                "start", "TIMESTAMP", _utc_day_start(start_date)
+            ),
+            bigquery.ScalarQueryParameter("end", "TIMESTAMP", _utc_day_start(end_date)),
+            bigquery.ArrayQueryParameter(
+                "projects", "STRING", list(project_filter or ())
+            ),
+        ]
+        return _BILLING_WHERE, params
+
+    def _cached_query(
+        self,
+        method: str,
+        start_date: datetime,
+        end_date: datetime,
+        project_filter: Optional[List[str]],
+        load: Callable[[], Any],
+    ) -> Any:
+        """Serve a billing export query from the process-wide cache."""
+        key = (
+            method,
+            self.billing_project_id,
+            start_date.date(),
+            end_date.date(),
+            tuple(sorted(project_filter or ())),
+        )
+        value = _QUERY_CACHE.get_or_load(key, _query_cache_ttl(end_date), load)
+        # Copy the containers so callers can't mutate the cached result
+        if isinstance(value, dict):
+            return {name: list(column) for name, column in value.items()}
+        return list(value)
+
     def list_billing_accounts(self) -> List[GCPBillingAccount]:
         """List all billing accounts accessible by the credentials."""
         client = self._get_billing_client()
-        accounts = []
 
         try:
-            for account in client.list_billing_accounts():
-                accounts.append(
-                    GCPBillingAccount(
-                        name=account.name,
-                        display_name=account.display_name,
-                        open=account.open,
-                        master_billing_account=getattr(
-                            account, "master_billing_account", None
-                        ),
-                    )
+            accounts = [
+                GCPBillingAccount(
+                    name=account.name,
+                    display_name=account.display_name,
+                    open=account.open,
+                    # Unset proto string fields read as ""
+                    master_billing_account=account.master_billing_account or None,
                 )
+                for account in client.list_billing_accounts()
+            ]
             log.info("finops_client.billing_accounts_retrieved", count=len(accounts))
         except Exception as e:
             log.error("finops_client.billing_accounts_error", error=str(e))
@@ -145,17 +598,16 @@ class GCPFinOpsClient:
     def list_services(self) -> List[GCPServiceInfo]:
         """List all available GCP services with their SKUs and pricing."""
         client = self._get_billing_client()
-        services = []
 
         try:
-            for service in client.list_services():
-                services.append(
-                    GCPServiceInfo(
-                        service_id=service.name.split("/")[-1],
-                        display_name=service.display_name,
-                        service_name=service.name,
-                    )
+            services = [
+                GCPServiceInfo(
+                    service_id=name.split("/")[-1],
+                    display_name=display_name,
+                    service_name=name,
                 )
+                for name, display_name in map(_service_fields, client.list_services())
+            ]
             log.info("finops_client.services_retrieved", count=len(services))
         except Exception as e:
             log.error("finops_client.services_error", error=str(e))
@@ -163,54 +615,76 @@ class GCPFinOpsClient:
 
         return services
 
-    def get_sku_pricing(self, service_id: str) -> List[Dict[str, Any]]:
-        """Get pricing information for all SKUs in a service."""
+    def iter_sku_pricing(self, service_id: str) -> Iterator[SKUPricing]:
+        """Yield pricing information for each SKU in a service as it is listed."""
         client = self._get_billing_client()
         service_name = f"services/{service_id}"
-        skus = []
+        count = 0
 
         try:
-            for sku in client.list_skus(parent=service_name):
-                sku_info = {
-                    "sku_id": sku.sku_id,
-                    "sku_name": sku.name,
-                    "display_name": sku.display_name,
-                    "category": {
-                        "service_family": sku.category.service_family,
-                        "resource_family": sku.category.resource_family,
-                        "resource_group": sku.category.resource_group,
-                    },
-                    "pricing_info": [],
-                }
-
-                for pricing_unit in sku.pricing_info:
-                    pricing_info = {
-                        "unit": pricing_unit.unit,
-                        "unit_count": pricing_unit.unit_count,
-                        "aggregate_quantity": pricing_unit.aggregate_quantity,
-                        "effective_unit_price": None,
-                    }
-
-                    if pricing_unit.exclusive_price:
-                        pricing_info["effective_unit_price"] = {
-                            "currency_code": pricing_unit.exclusive_price.currency_code,
-                            "units": pricing_unit.exclusive_price.units,
-                            "nanos": pricing_unit.exclusive_price.nanos,
-                        }
-
-                    sku_info["pricing_info"].append(pricing_info)
-
-                skus.append(sku_info)
+            # Pages are chained by token, so fewer, larger pages is what helps
+            for sku in client.list_skus(
+                request={"parent": service_name, "page_size": SKU_PAGE_SIZE}
+            ):
+                pricing_info = [
+                    PricingUnitInfo(
+                        *_pricing_unit_fields(pricing_unit),
+                        UnitPrice(*_price_fields(pricing_unit.exclusive_price))
+                        if pricing_unit.exclusive_price
+                        else None,
+                    )
+                    for pricing_unit in sku.pricing_info
+                ]
+                yield SKUPricing(*_sku_fields(sku), pricing_info)
+                count += 1
 
             log.info(
-                "finops_client.skus_retrieved", service_id=service_id, count=len(skus)
+                "finops_client.skus_retrieved", service_id=service_id, count=count
             )
         except Exception as e:
             log.error("finops_client.skus_error", service_id=service_id, error=str(e))
             raise
 
+    def get_sku_pricing(self, service_id: str) -> List[SKUPricing]:
+        """Get pricing information for all SKUs in a service.
+
+        Results are cached on disk for SKU_CACHE_TTL. Concurrent callers, in
+        this or another process, wait for one listing instead of repeating it.
+        """
+        path = _sku_cache_path(service_id)
+        if path is None:
+            return list(self.iter_sku_pricing(service_id))
+
+        skus = _read_sku_cache(path)
+        if skus is not None:
+            return skus
+
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            lock = open(f"{path}.lock", "a")
+        except OSError:
+            return list(self.iter_sku_pricing(service_id))
+        with lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            # Whoever held the lock may have just refreshed the cache
+            skus = _read_sku_cache(path)
+            if skus is None:
+                skus = list(self.iter_sku_pricing(service_id))
+                _write_sku_cache(path, skus)
         return skus
 
+    def get_sku_pricing_by_service(
+        self, service_ids: List[str]
+    ) -> Dict[str, List[SKUPricing]]:
+        """Get SKU pricing for several services, listing them concurrently."""
+        if not service_ids:
+            return {}
+        with ThreadPoolExecutor(
+            max_workers=min(FINOPS_WORKERS, len(service_ids))
+        ) as ex:
+            return dict(zip(service_ids, ex.map(self.get_sku_pricing, service_ids)))
+
     def get_recommendations(
         self,
         recommender_id: str,
@@ -229,11 +703,13 @@ class GCPFinOpsClient:
                     f"projects/-/locations/{location}/recommenders/{recommender_id}"
                 )
 
-            from google.cloud import recommender_v1
-
-            request = recommender_v1.ListRecommendationsRequest(parent=parent)
+            request = {"parent": parent, "page_size": RECOMMENDATIONS_PAGE_SIZE}
+            # Every recommendation in one listing shares its refresh time
+            now = datetime.now(timezone.utc)
 
-            for rec in client.list_recommendations(request=request):
+            for rec in client.list_recommendations(
+                request=request, retry=_recommender_retry()
+            ):
                 cost_impact = 0.0
                 current_spend = 0.0
 
@@ -244,9 +720,9 @@ class GCPFinOpsClient:
                             cost_projection.cost.nanos / 1e9
                         )
 
-                affected_resources = []
-                for resource in rec.content.impacted_resources:
-                    affected_resources.append(resource.resource)
+                affected_resources = [
+                    resource.resource for resource in rec.content.impacted_resources
+                ]
 
                 recommendations.append(
                     CostRecommendation(
@@ -259,7 +735,7 @@ class GCPFinOpsClient:
                         current_spend=current_spend,
                         affected_resources=affected_resources,
                         state=str(rec.state_info.state),
-                        last_refresh=datetime.now(timezone.utc),
+                        last_refresh=now,
                     )
                 )
 
@@ -280,69 +756,73 @@ class GCPFinOpsClient:
 
         return recommendations
 
+    def get_recommendations_bulk(
+        self,
+        project_ids: List[str],
+        recommender_ids: List[str],
+        locations: Tuple[str, ...] = ("global",),
+    ) -> List[CostRecommendation]:
+        """Get recommendations for every project, recommender and location.
+
+        The listings run concurrently. One that fails is logged and skipped
+        so the rest of the results are still returned.
+        """
+        targets = list(product(project_ids, locations, recommender_ids))
+        if not targets:
+            return []
+
+        def fetch(target: Tuple[str, str, str]) -> List[CostRecommendation]:
+            project_id, location, recommender_id = target
+            try:
+                return self.get_recommendations(
+                    recommender_id, project_id=project_id, location=location
+                )
+            except Exception:
+                # get_recommendations has already logged the error
+                return []
+
+        with ThreadPoolExecutor(
+            max_workers=min(RECOMMENDER_WORKERS, len(targets))
+        ) as ex:
+            return list(chain.from_iterable(ex.map(fetch, targets)))
+
     def query_billing_export(
         self,
         billing_account_id: str,
         start_date: datetime,
         end_date: datetime,
         project_filter: Optional[List[str]] = None,
-    ) -> List[Dict[str, Any]]:
-        """Query BigQuery billing export for cost data."""
-        client = self._get_bigquery_client()
-        table_pattern = (
-            f"`{self.billing_project_id}.gcp_billing_export_v1.gcp_billing_export_*`"
+    ) -> Dict[str, List[Any]]:
+        """Query BigQuery billing export for cost data.
+
+        Returns the rows column-wise: a list per name in
+        BILLING_EXPORT_COLUMNS, all of the same length.
+        """
+        return self._cached_query(
+            "query_billing_export",
+            start_date,
+            end_date,
+            project_filter,
+            lambda: self._query_billing_export(
+                billing_account_id, start_date, end_date, project_filter
+            ),
         )
 
-        where_clauses = [
-            f"usage_start_time >= TIMESTAMP('{start_date.strftime('%Y-%m-%d')}')",
-            f"usage_start_time < TIMESTAMP('{end_date.strftime('%Y-%m-%d')}')",
-        ]
+    def _query_billing_export(
+        self,
+        billing_account_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        project_filter: Optional[List[str]],
+    ) -> Dict[str, List[Any]]:
+        client = self._get_bigquery_client()
+        where_clause, params = self._build_billing_filters(
+            start_date, end_date, project_filter
+        )
 
-        if project_filter:
-            project_list = ", ".join(f"'{p}'" for p in project_filter)
-            where_clauses.append(f"project.id IN ({project_list})")
-
-        where_clause = " AND ".join(where_clauses)
-
-        query = f"""
-        SELECT
-            DATE(usage_start_time) as usage_date,
-            project.id as project_id,
-            project.name as project_name,
-            project.number as project_number,
-            service.description as service_name,
-            sku.description as sku_name,
-            sku.id as sku_id,
-            SUM(cost) as total_cost,
-            SUM(cost + ifnull((SELECT SUM(amount) FROM UNNEST(credits)), 0)) as total_cost_with_credits,
-            SUM(usage.amount_in_pricing_units) as usage_amount,
-            usage.pricing_unit as pricing_unit,
-            labels,
-            resource.name as resource_name,
-            resource.type as resource_type,
-            location.location as location,
-            location.country as country,
-            location.region as region
-        FROM {table_pattern}
-        WHERE {where_clause}
-        GROUP BY
-            usage_date,
-            project_id,
-            project_name,
-            project_number,
-            service_name,
-            sku_name,
-            sku_id,
-            labels,
-            resource_name,
-            resource_type,
-            location,
-            country,
-            region
-        ORDER BY
-            usage_date DESC,
-            total_cost DESC
-        """
+        query = _BILLING_EXPORT_SQL.format(
+            table=self._billing_table(), where=where_clause
+        )
 
         try:
             log.info(
@@ -352,41 +832,30 @@ class GCPFinOpsClient:
                 end_date=end_date.isoformat(),
             )
 
-            query_job = client.query(query)
+            query_job = client.query(
+                query,
+                job_config=self._query_job_config(params),
+            )
             results = query_job.result()
 
-            costs = []
-            for row in results:
-                costs.append(
-                    {
-                        "usage_date": str(row.usage_date),
-                        "project_id": row.project_id,
-                        "project_name": row.project_name,
-                        "project_number": str(row.project_number),
-                        "service_name": row.service_name,
-                        "sku_name": row.sku_name,
-                        "sku_id": row.sku_id,
-                        "total_cost": float(row.total_cost) if row.total_cost else 0.0,
-                        "total_cost_with_credits": float(row.total_cost_with_credits)
-                        if row.total_cost_with_credits
-                        else 0.0,
-                        "usage_amount": float(row.usage_amount)
-                        if row.usage_amount
-                        else 0.0,
-                        "pricing_unit": row.pricing_unit,
-                        "labels": dict(row.labels) if row.labels else {},
-                        "resource_name": row.resource_name,
-                        "resource_type": row.resource_type,
-                        "location": row.location,
-                        "country": row.country,
-                        "region": row.region,
-                    }
-                )
+            bqstorage_client = self._get_bqstorage_client()
+            if bqstorage_client is not None:
+                # Columnar download over the Storage Read API
+                columns = results.to_arrow(
+                    bqstorage_client=bqstorage_client
+                ).to_pydict()
+            else:
+                rows = list(results)
+                columns = {
+                    name: [row[name] for row in rows]
+                    for name in BILLING_EXPORT_COLUMNS
+                }
+            costs = _normalize_billing_export(columns)
 
             log.info(
                 "finops_client.billing_export_query_complete",
                 billing_account_id=billing_account_id,
-                result_count=len(costs),
+                result_count=len(costs["usage_date"]),
             )
 
             return costs
@@ -406,54 +875,47 @@ class GCPFinOpsClient:
         project_filter: Optional[List[str]] = None,
     ) -> List[CostByService]:
         """Get cost breakdown by GCP service."""
-        client = self._get_bigquery_client()
-        table_pattern = (
-            f"`{self.billing_project_id}.gcp_billing_export_v1.gcp_billing_export_*`"
+        return self._cached_query(
+            "get_cost_summary_by_service",
+            start_date,
+            end_date,
+            project_filter,
+            lambda: self._get_cost_summary_by_service(
+                billing_account_id, start_date, end_date, project_filter
+            ),
         )
 
-        where_clauses = [
-            f"usage_start_time >= TIMESTAMP('{start_date.strftime('%Y-%m-%d')}')",
-            f"usage_start_time < TIMESTAMP('{end_date.strftime('%Y-%m-%d')}')",
-        ]
+    def _get_cost_summary_by_service(
+        self,
+        billing_account_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        project_filter: Optional[List[str]],
+    ) -> List[CostByService]:
+        client = self._get_bigquery_client()
+        where_clause, params = self._build_billing_filters(
+            start_date, end_date, project_filter
+        )
 
-        if project_filter:
-            project_list = ", ".join(f"'{p}'" for p in project_filter)
-            where_clauses.append(f"project.id IN ({project_list})")
-
-        where_clause = " AND ".join(where_clauses)
-
-        query = f"""
-        SELECT
-            service.description as service_name,
-            service.id as service_id,
-            SUM(cost) as total_cost
-        FROM {table_pattern}
-        WHERE {where_clause}
-        GROUP BY service_name, service_id
-        ORDER BY total_cost DESC
-        """
+        query = _COST_BY_SERVICE_SQL.format(
+            table=self._billing_table(), where=where_clause
+        )
 
         try:
-            query_job = client.query(query)
-            results = list(query_job.result())
-
-            total_cost = sum(
-                float(row.total_cost) if row.total_cost else 0.0 for row in results
+            query_job = client.query(
+                query,
+                job_config=self._query_job_config(params),
             )
-
-            cost_by_service = []
-            for row in results:
-                service_cost = float(row.total_cost) if row.total_cost else 0.0
-                cost_by_service.append(
-                    CostByService(
-                        service_name=row.service_id,
-                        service_display_name=row.service_name,
-                        total_cost=service_cost,
-                        percentage_of_total=(service_cost / total_cost * 100)
-                        if total_cost > 0
-                        else 0.0,
-                    )
+            # Shares are computed server-side with a window over the groups
+            cost_by_service = [
+                CostByService(
+                    service_name=row.service_id,
+                    service_display_name=row.service_name,
+                    total_cost=float(row.total_cost or 0.0),
+                    percentage_of_total=float(row.percentage_of_total or 0.0),
                 )
+                for row in query_job.result()
+            ]
 
             log.info(
                 "finops_client.cost_by_service",
@@ -478,54 +940,47 @@ class GCPFinOpsClient:
         project_filter: Optional[List[str]] = None,
     ) -> List[CostByProject]:
         """Get cost breakdown by GCP project."""
-        client = self._get_bigquery_client()
-        table_pattern = (
-            f"`{self.billing_project_id}.gcp_billing_export_v1.gcp_billing_export_*`"
+        return self._cached_query(
+            "get_cost_summary_by_project",
+            start_date,
+            end_date,
+            project_filter,
+            lambda: self._get_cost_summary_by_project(
+                billing_account_id, start_date, end_date, project_filter
+            ),
         )
 
-        where_clauses = [
-            f"usage_start_time >= TIMESTAMP('{start_date.strftime('%Y-%m-%d')}')",
-            f"usage_start_time < TIMESTAMP('{end_date.strftime('%Y-%m-%d')}')",
-        ]
+    def _get_cost_summary_by_project(
+        self,
+        billing_account_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        project_filter: Optional[List[str]],
+    ) -> List[CostByProject]:
+        client = self._get_bigquery_client()
+        where_clause, params = self._build_billing_filters(
+            start_date, end_date, project_filter
+        )
 
-        if project_filter:
-            project_list = ", ".join(f"'{p}'" for p in project_filter)
-            where_clauses.append(f"project.id IN ({project_list})")
-
-        where_clause = " AND ".join(where_clauses)
-
-        query = f"""
-        SELECT
-            project.id as project_id,
-            project.name as project_name,
-            SUM(cost) as total_cost
-        FROM {table_pattern}
-        WHERE {where_clause}
-        GROUP BY project_id, project_name
-        ORDER BY total_cost DESC
-        """
+        query = _COST_BY_PROJECT_SQL.format(
+            table=self._billing_table(), where=where_clause
+        )
 
         try:
-            query_job = client.query(query)
-            results = list(query_job.result())
-
-            total_cost = sum(
-                float(row.total_cost) if row.total_cost else 0.0 for row in results
+            query_job = client.query(
+                query,
+                job_config=self._query_job_config(params),
             )
-
-            cost_by_project = []
-            for row in results:
-                project_cost = float(row.total_cost) if row.total_cost else 0.0
-                cost_by_project.append(
-                    CostByProject(
-                        project_id=row.project_id,
-                        project_name=row.project_name,
-                        total_cost=project_cost,
-                        percentage_of_total=(project_cost / total_cost * 100)
-                        if total_cost > 0
-                        else 0.0,
-                    )
+            # Shares are computed server-side with a window over the groups
+            cost_by_project = [
+                CostByProject(
+                    project_id=row.project_id,
+                    project_name=row.project_name,
+                    total_cost=float(row.total_cost or 0.0),
+                    percentage_of_total=float(row.percentage_of_total or 0.0),
                 )
+                for row in query_job.result()
+            ]
 
             log.info(
                 "finops_client.cost_by_project",
@@ -541,3 +996,70 @@ class GCPFinOpsClient:
                 error=str(e),
             )
             raise
+
+    # Async variants for callers running an event loop. The Google clients
+    # block, so each call runs on a worker thread; the clients are thread-safe.
+
+    async def alist_billing_accounts(self) -> List[GCPBillingAccount]:
+        return await asyncio.to_thread(self.list_billing_accounts)
+
+    async def alist_services(self) -> List[GCPServiceInfo]:
+        return await asyncio.to_thread(self.list_services)
+
+    async def aget_sku_pricing(self, service_id: str) -> List[SKUPricing]:
+        return await asyncio.to_thread(self.get_sku_pricing, service_id)
+
+    async def aget_recommendations(
+        self,
+        recommender_id: str,
+        project_id: Optional[str] = None,
+        location: str = "global",
+    ) -> List[CostRecommendation]:
+        return await asyncio.to_thread(
+            self.get_recommendations, recommender_id, project_id, location
+        )
+
+    async def aquery_billing_export(
+        self,
+        billing_account_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        project_filter: Optional[List[str]] = None,
+    ) -> Dict[str, List[Any]]:
+        return await asyncio.to_thread(
+            self.query_billing_export,
+            billing_account_id,
+            start_date,
+            end_date,
+            project_filter,
+        )
+
+    async def aget_cost_summary_by_service(
+        self,
+        billing_account_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        project_filter: Optional[List[str]] = None,
+    ) -> List[CostByService]:
+        return await asyncio.to_thread(
+            self.get_cost_summary_by_service,
+            billing_account_id,
+            start_date,
+            end_date,
+            project_filter,
+        )
+
+    async def aget_cost_summary_by_project(
+        self,
+        billing_account_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        project_filter: Optional[List[str]] = None,
+    ) -> List[CostByProject]:
+        return await asyncio.to_thread(
+            self.get_cost_summary_by_project,
+            billing_account_id,
+            start_date,
+            end_date,
+            project_filter,
+        )
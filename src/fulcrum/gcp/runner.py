@@ -5,6 +5,7 @@ import logging
 import re
 import structlog
 
+from ..core.jsonio import loads
 from ..core.settings import load_settings
 
 logger = logging.getLogger(__name__)
@@ -92,10 +93,9 @@ def run_gcloud(args: List[str], timeout: int = 60) -> Any:
     )
 
     try:
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, check=True, timeout=timeout
-        )
-        return json.loads(result.stdout)
+        # Raw bytes straight into the decoder; no text decoding pass
+        result = subprocess.run(cmd, capture_output=True, check=True, timeout=timeout)
+        return loads(result.stdout)
     except subprocess.TimeoutExpired:
         error_msg = f"Command timed out after {timeout}s"
         logger.error(error_msg)
@@ -104,7 +104,11 @@ def run_gcloud(args: List[str], timeout: int = 60) -> Any:
         )
         raise GCloudError(error_msg)
     except subprocess.CalledProcessError as e:
-        err_msg = e.stderr.strip() if e.stderr else "Unknown error"
+        err_msg = (
+            e.stderr.decode("utf-8", errors="replace").strip()
+            if e.stderr
+            else "Unknown error"
+        )
         full_msg = f"Command failed: {err_msg}"
         logger.error(full_msg)
         security_logger.error(
@@ -17,7 +17,7 @@ import signal
 from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Callable
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional
 import structlog
 
 log = structlog.get_logger()
@@ -321,14 +321,37 @@ class SecurityAuditor:
         """Synchronous wrapper that runs the async scanner."""
         return asyncio.run(self.scan_async())
 
+    def iter_scan(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield findings one at a time as files are scanned.
+
+        Drives ``iter_scan_async`` on a private event loop so callers can
+        render or persist each finding without holding the full result set.
+        """
+        loop = asyncio.new_event_loop()
+        agen = self.iter_scan_async()
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(agen.__anext__())
+                except StopAsyncIteration:
+                    break
+        finally:
+            loop.run_until_complete(agen.aclose())
+            loop.close()
+
     async def scan_async(self) -> List[Dict[str, Any]]:
+        """Perform security scan asynchronously and return all findings."""
+        return [finding async for finding in self.iter_scan_async()]
+
+    async def iter_scan_async(self) -> AsyncIterator[Dict[str, Any]]:
         """
-        Perform security scan asynchronously.
+        Perform security scan asynchronously, yielding findings as they arrive.
 
         Uses ProcessPoolExecutor for parallel regex matching while
         keeping file I/O async.
         """
-        findings: List[SecurityFinding] = []
+        findings_found = 0
 
         log.info("security.audit_start", path=self.root_path)
 
@@ -343,7 +366,7 @@ class SecurityAuditor:
         )
 
         if not files:
-            return []
+            return
 
         if self.use_parallel and len(files) > 10:
             # Use ProcessPoolExecutor for parallel scanning
@@ -351,18 +374,10 @@ class SecurityAuditor:
                 # Submit all files for parallel processing
                 futures = [executor.submit(_scan_file_worker, (f,)) for f in files]
 
-                # Collect results as they complete
-                for future in futures:
+                # Collect results in submission order
+                for file_path, future in zip(files, futures):
                     file_findings = future.result()
-                    findings.extend(file_findings)
-                    self._progress.files_scanned += 1
-
-                    if self._progress.files_total > 0:
-                        self._progress.percent_complete = (
-                            self._progress.files_scanned
-                            / self._progress.files_total
-                            * 100
-                        )
+                    self._progress.update(file_path, len(file_findings))
 
                     # Log progress every 100 files
                     if self._progress.files_scanned % 100 == 0:
@@ -372,6 +387,10 @@ class SecurityAuditor:
                             percent_complete=self._progress.percent_complete,
                             findings_found=self._progress.findings_found,
                         )
+
+                    for finding in file_findings:
+                        findings_found += 1
+                        yield finding.to_dict()
         else:
             # Sequential scanning for small codebases
             for file_path in files:
@@ -379,18 +398,18 @@ class SecurityAuditor:
                     file_path,
                     SECURITY_PATTERNS,
                 )
-                findings.extend(file_findings)
-                self._progress.files_scanned += 1
+                self._progress.update(file_path, len(file_findings))
+                for finding in file_findings:
+                    findings_found += 1
+                    yield finding.to_dict()
 
         log.info(
             "security.audit_complete",
             path=self.root_path,
             files_scanned=self._progress.files_scanned,
-            findings_found=len(findings),
+            findings_found=findings_found,
         )
 
-        return [f.to_dict() for f in findings]
-
     def scan_with_progress(self) -> tuple[List[Dict[str, Any]], ScanProgress]:
         """
         Perform security scan with detailed progress tracking.
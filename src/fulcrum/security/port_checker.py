@@ -4,14 +4,15 @@ Port Checker Module for Fulcrum
 This module provides functionality to check if specific ports are open/closed
 across GCP projects by examining firewall rules.
 """
+import asyncio
 import json
 import subprocess
+from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional
 import typer
 from rich.console import Console
 from rich.table import Table
-from rich.progress import Progress
-import concurrent.futures
+from rich.progress import Progress, TaskID
 
 console = Console()
 
@@ -23,52 +24,32 @@ class PortChecker:
         self.port = port
         self.results: List[Dict[str, Any]] = []
 
-    def check_project(self, project_id: str) -> Dict[str, Any]:
-        """Check if the specified port is open in the given project.
+    def _command(self, project_id: str) -> List[str]:
+        """Build the gcloud command listing ingress allow rules for a project."""
+        return [
+            'gcloud', 'compute', 'firewall-rules', 'list',
+            f'--project={project_id}',
+            '--format=json',
+            '--filter=ALLOW AND (direction=INGRESS OR direction=INGRESS_ENABLED)'
+        ]
+
+    def _open_rules(self, firewall_rules: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return the firewall rules that allow ``self.port``."""
+        open_rules = []
         
-        Args:
-            project_id: The GCP project ID to check
-            
-        Returns:
-            Dict containing project ID and port status information
-        """
-        try:
-            # Get all firewall rules that allow the specified port
-            cmd = [
-                'gcloud', 'compute', 'firewall-rules', 'list',
-                f'--project={project_id}',
-                '--format=json',
-                '--filter=ALLOW AND (direction=INGRESS OR direction=INGRESS_ENABLED)'
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            firewall_rules = json.loads(result.stdout)
-            
-            open_rules = []
-            
-            for rule in firewall_rules:
-                if not rule.get('allowed', []):
-                    continue
-                    
-                for allowed in rule['allowed']:
-                    # Check if the rule allows any port or the specific port we're looking for
-                    if 'ports' in allowed:
-                        ports = allowed['ports']
-                        for port_range in ports:
-                            # Handle port ranges (e.g., "1000-2000")
-                            if '-' in port_range:
-                                start, end = map(int, port_range.split('-'))
-                                if start <= self.port <= end:
-                                    open_rules.append({
-                                        'name': rule['name'],
-                                        'network': rule.get('network', '').split('/')[-1],
-                                        'source_ranges': rule.get('sourceRanges', []),
-                                        'target_tags': rule.get('targetTags', []),
-                                        'priority': rule.get('priority', '')
-                                    })
-                                    break
-                            # Handle single port
-                            elif port_range == str(self.port):
+        for rule in firewall_rules:
+            if not rule.get('allowed', []):
+                continue
+                
+            for allowed in rule['allowed']:
+                # Check if the rule allows any port or the specific port we're looking for
+                if 'ports' in allowed:
+                    ports = allowed['ports']
+                    for port_range in ports:
+                        # Handle port ranges (e.g., "1000-2000")
+                        if '-' in port_range:
+                            start, end = map(int, port_range.split('-'))
+                            if start <= self.port <= end:
                                 open_rules.append({
                                     'name': rule['name'],
                                     'network': rule.get('network', '').split('/')[-1],
@@ -77,65 +58,103 @@ class PortChecker:
                                     'priority': rule.get('priority', '')
                                 })
                                 break
+                        # Handle single port
+                        elif port_range == str(self.port):
+                            open_rules.append({
+                                'name': rule['name'],
+                                'network': rule.get('network', '').split('/')[-1],
+                                'source_ranges': rule.get('sourceRanges', []),
+                                'target_tags': rule.get('targetTags', []),
+                                'priority': rule.get('priority', '')
+                            })
+                            break
+        return open_rules
+
+    def _result(self, project_id: str, stdout: str) -> Dict[str, Any]:
+        open_rules = self._open_rules(json.loads(stdout))
+        return {
+            'project_id': project_id,
+            'is_open': len(open_rules) > 0,
+            'open_rules': open_rules
+        }
+
+    @staticmethod
+    def _error(project_id: str, message: str) -> Dict[str, Any]:
+        return {
+            'project_id': project_id,
+            'error': message,
+            'is_open': False,
+            'open_rules': []
+        }
+
+    def check_project(self, project_id: str) -> Dict[str, Any]:
+        """Check if the specified port is open in the given project.
+        
+        Args:
+            project_id: The GCP project ID to check
             
-            return {
-                'project_id': project_id,
-                'is_open': len(open_rules) > 0,
-                'open_rules': open_rules
-            }
-            
+        Returns:
+            Dict containing project ID and port status information
+        """
+        try:
+            result = subprocess.run(
+                self._command(project_id), capture_output=True, text=True, check=True
+            )
+            return self._result(project_id, result.stdout)
         except subprocess.CalledProcessError as e:
-            return {
-                'project_id': project_id,
-                'error': f"Error checking project: {e.stderr}",
-                'is_open': False,
-                'open_rules': []
-            }
+            return self._error(project_id, f"Error checking project: {e.stderr}")
         except Exception as e:
-            return {
-                'project_id': project_id,
-                'error': f"Unexpected error: {str(e)}",
-                'is_open': False,
-                'open_rules': []
-            }
-    
-    def run_checks(self, max_workers: int = 5) -> None:
-        """Run port checks across all projects in parallel.
+            return self._error(project_id, f"Unexpected error: {str(e)}")
+
+    async def check_project_async(
+        self, project_id: str, semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """Async variant of :meth:`check_project`, bounded by ``semaphore``."""
+        try:
+            async with semaphore:
+                proc = await asyncio.create_subprocess_exec(
+                    *self._command(project_id),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                stdout, stderr = await proc.communicate()
+            if proc.returncode != 0:
+                return self._error(
+                    project_id, f"Error checking project: {stderr.decode(errors='replace')}"
+                )
+            return self._result(project_id, stdout.decode())
+        except Exception as e:
+            return self._error(project_id, f"Unexpected error: {str(e)}")
+
+    async def run_checks_async(
+        self,
+        max_workers: int = 10,
+        progress: Optional[Progress] = None,
+        task: Optional[TaskID] = None,
+    ) -> None:
+        """Check all projects concurrently with at most ``max_workers`` in flight."""
+        semaphore = asyncio.Semaphore(max_workers)
+        pending = [self.check_project_async(p, semaphore) for p in self.projects]
+        for next_result in asyncio.as_completed(pending):
+            self.results.append(await next_result)
+            if progress is not None and task is not None:
+                progress.update(task, advance=1)
+
+    def run_checks(self, max_workers: int = 10) -> None:
+        """Run port checks across all projects concurrently.
         
         Args:
-            max_workers: Maximum number of parallel checks to run
+            max_workers: Maximum number of concurrent checks to run
         """
         with Progress() as progress:
             task = progress.add_task(
                 f"[cyan]Checking port {self.port} across {len(self.projects)} projects...",
                 total=len(self.projects)
             )
-            
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_project = {
-                    executor.submit(self.check_project, project): project
-                    for project in self.projects
-                }
-                
-                for future in concurrent.futures.as_completed(future_to_project):
-                    project = future_to_project[future]
-                    try:
-                        result = future.result()
-                        self.results.append(result)
-                    except Exception as e:
-                        self.results.append({
-                            'project_id': project,
-                            'error': str(e),
-                            'is_open': False,
-                            'open_rules': []
-                        })
-                    progress.update(task, advance=1)
+            asyncio.run(self.run_checks_async(max_workers, progress, task))
     
     def export_json(self, filename: str) -> None:
         """Export results to a JSON file."""
-        import json
-        from datetime import datetime, timezone
-        
         report_data = {
             "port": self.port,
             "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -208,13 +227,13 @@ class PortChecker:
         
         console.print(table)
 
-def check_port(projects: List[str], port: int, max_workers: int = 5, export_format: Optional[str] = None) -> None:
+def check_port(projects: List[str], port: int, max_workers: int = 10, export_format: Optional[str] = None) -> None:
     """Check if a specific port is open across multiple GCP projects.
     
     Args:
         projects: List of GCP project IDs to check
         port: Port number to check
-        max_workers: Maximum number of parallel checks to run
+        max_workers: Maximum number of concurrent gcloud calls
         export_format: Optional export format ('json')
     """
     checker = PortChecker(projects, port)
@@ -49,3 +49,16 @@ def test_remediation_not_found():
     res = mgr.remediate("unknown", "target")
     assert not res.success
     assert "No remediation action found" in res.message
+
+def test_remediation_skips_info_payload_when_filtered(monkeypatch):
+    import fulcrum.core.remediation as remediation
+
+    class Target:
+        def __str__(self):
+            raise AssertionError("target should not be stringified")
+
+    monkeypatch.setattr(remediation.log, "is_enabled_for", lambda level: False, raising=False)
+    mgr = RemediationManager()
+    mgr.register_action(MockAction())
+    res = mgr.remediate("mock_action", Target(), dry_run=True)
+    assert res.success
@@ -0,0 +1,78 @@
+from fulcrum.gcp import artifact_registry
+from fulcrum.gcp.artifact_registry import GCRMigration
+from fulcrum.gcp.runner import GCloudError
+
+
+TREE = {
+    "gcr.io/p": [{"name": "gcr.io/p/app"}, {"name": "gcr.io/p/team"}],
+    "gcr.io/p/app": [],
+    "gcr.io/p/team": [{"name": "gcr.io/p/team/api"}, {"name": "gcr.io/p/team/empty"}],
+    "gcr.io/p/team/api": [],
+    "gcr.io/p/team/empty": [],
+    "eu.gcr.io/p": [{"name": "eu.gcr.io/p/app"}],
+    "eu.gcr.io/p/app": [],
+}
+TAGS = {"gcr.io/p/app", "gcr.io/p/team/api", "eu.gcr.io/p/app"}
+
+
+def fake_gcloud(args):
+    if args[2] == "list":
+        path = args[3].split("=", 1)[1]
+        if path not in TREE:
+            raise GCloudError(path)
+        return TREE[path]
+    image = args[3]
+    return [{"tags": ["v1"]}] if image in TAGS else []
+
+
+def test_audit_gcr_images_recursive(monkeypatch):
+    monkeypatch.setattr(artifact_registry, "run_gcloud_json", fake_gcloud)
+    images = GCRMigration("p").audit_gcr_images(recursive=True)
+    assert images == ["eu.gcr.io/p/app", "gcr.io/p/app", "gcr.io/p/team/api"]
+
+
+def test_audit_gcr_images_top_level(monkeypatch):
+    monkeypatch.setattr(artifact_registry, "run_gcloud_json", fake_gcloud)
+    images = GCRMigration("p").audit_gcr_images()
+    assert images == ["eu.gcr.io/p/app", "gcr.io/p/app", "gcr.io/p/team"]
+
+
+def test_latest_tag_resolved_once(monkeypatch):
+    calls = []
+
+    def counting(args):
+        calls.append(args)
+        return fake_gcloud(args)
+
+    monkeypatch.setattr(artifact_registry, "run_gcloud_json", counting)
+    migrator = GCRMigration("p")
+    migrator.audit_gcr_images(recursive=True)
+    n = len(calls)
+    assert migrator.copy_image("gcr.io/p/app", dry_run=True).endswith("/app:v1")
+    migrator.audit_gcr_images(recursive=True)
+    assert len(calls) == n
+
+
+def test_migrate_project_keeps_audit_order(monkeypatch):
+    monkeypatch.setattr(artifact_registry, "run_gcloud_json", fake_gcloud)
+    mapping = artifact_registry.migrate_project("p", "europe-west1", dry_run=True, recursive=True)
+    assert [m["old"] for m in mapping] == ["eu.gcr.io/p/app", "gcr.io/p/app", "gcr.io/p/team/api"]
+    assert mapping[2]["new"] == "europe-west1-docker.pkg.dev/p/docker-images/api:v1"
+
+
+def test_copy_image_prefers_crane(monkeypatch):
+    runs = []
+    monkeypatch.setattr(artifact_registry, "run_gcloud_json", fake_gcloud)
+    monkeypatch.setattr(artifact_registry, "_crane", lambda: "/usr/bin/crane")
+    monkeypatch.setattr(artifact_registry.subprocess, "run", lambda cmd, **kw: runs.append(cmd))
+    dest = GCRMigration("p").copy_image("gcr.io/p/app")
+    assert runs == [["/usr/bin/crane", "cp", "gcr.io/p/app:v1", dest]]
+
+
+def test_copy_image_untagged_uses_digest(monkeypatch):
+    monkeypatch.setattr(
+        artifact_registry, "run_gcloud_json", lambda args: [{"tags": [], "digest": "sha256:abc"}]
+    )
+    migrator = GCRMigration("p")
+    assert migrator.get_latest_tag("gcr.io/p/app") == ("digest", "sha256:abc")
+    assert migrator.copy_image("gcr.io/p/app", dry_run=True).endswith("/docker-images/app:latest")
@@ -0,0 +1,134 @@
+from datetime import datetime, timedelta, timezone
+
+from fulcrum.gcp.auth import _parse_rfc3339_timestamp
+
+
+def test_parse_rfc3339_timestamp():
+    assert _parse_rfc3339_timestamp("2024-01-01T00:00:00Z") == datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert _parse_rfc3339_timestamp("2024-01-01T00:00:00.123Z").microsecond == 123000
+    assert _parse_rfc3339_timestamp("2024-01-01T00:00:00-05:30").utcoffset() == -timedelta(hours=5, minutes=30)
+    assert _parse_rfc3339_timestamp("2024-01-01T00:00:00").tzinfo is timezone.utc
+    assert _parse_rfc3339_timestamp("not a date") is None
+    assert _parse_rfc3339_timestamp("") is None
+
+
+def _write_key(path, valid_before):
+    import json
+
+    path.write_text(json.dumps({"type": "service_account", "validBeforeTime": valid_before}))
+    path.chmod(0o600)
+
+
+def test_validate_sa_key_reads_unchanged_file_once(tmp_path, monkeypatch):
+    import pytest
+    import fulcrum.gcp.auth as auth
+
+    key = tmp_path / "sa.json"
+    future = (datetime.now(timezone.utc) + timedelta(days=30)).isoformat()
+    _write_key(key, future)
+
+    reads = []
+    real = auth._read_valid_before
+    monkeypatch.setattr(auth, "_read_valid_before", lambda p: reads.append(p) or real(p))
+    assert auth.validate_service_account_key(str(key))
+    assert auth.validate_service_account_key(str(key))
+    assert len(reads) == 1
+
+    # A rewritten key is re-read and its expiry enforced
+    _write_key(key, "2000-01-01T00:00:00Z")
+    with pytest.raises(auth.SecurityError):
+        auth.validate_service_account_key(str(key))
+
+
+def test_validate_sa_key_missing_file(tmp_path):
+    import pytest
+    from fulcrum.gcp.auth import SecurityError, validate_service_account_key
+
+    with pytest.raises(SecurityError, match="not found"):
+        validate_service_account_key(str(tmp_path / "missing.json"))
+
+
+def test_load_credentials_memoizes_adc(monkeypatch):
+    import google.auth
+    import fulcrum.gcp.auth as auth
+
+    calls = []
+    monkeypatch.setattr(google.auth, "default", lambda scopes: calls.append(scopes) or (object(), "p1"))
+    auth._adc_default.cache_clear()
+    try:
+        first = auth.load_credentials(None)
+        assert auth.load_credentials(None) is first
+        assert len(calls) == 1
+    finally:
+        auth._adc_default.cache_clear()
+
+
+class _Zones:
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.calls = 0
+
+    def zones(self):
+        return self
+
+    def list(self, project):
+        return self
+
+    def execute(self, num_retries=0):
+        import httplib2
+        from googleapiclient.errors import HttpError
+
+        self.calls += 1
+        status = self.statuses.pop(0)
+        if status != 200:
+            raise HttpError(httplib2.Response({"status": status}), b"")
+        return {}
+
+
+def test_preflight_retries_transient_and_fails_fast(monkeypatch):
+    import fulcrum.gcp.auth as auth
+
+    monkeypatch.setattr(auth.time, "sleep", lambda s: None)
+    client = _Zones([503, 200])
+    assert auth.preflight_permission_check(client, "p") == (True, None)
+    assert client.calls == 2
+
+    client = _Zones([403])
+    ok, msg = auth.preflight_permission_check(client, "p")
+    assert not ok and "compute.viewer" in msg and client.calls == 1
+
+    client = _Zones([404])
+    assert auth.preflight_permission_check(client, "p")[0] is False
+    assert client.calls == 1
+
+
+def test_preflight_runs_on_thread_http(monkeypatch):
+    import types
+
+    import fulcrum.gcp.auth as auth
+    import fulcrum.gcp.client as client
+
+    creds = object()
+    thread_http = object()
+    seen = {}
+    monkeypatch.setattr(client, "thread_http", lambda c: thread_http if c is creds else None)
+
+    class Req:
+        http = types.SimpleNamespace(credentials=creds)
+
+        def execute(self, http=None, num_retries=0):
+            seen.update(http=http, num_retries=num_retries)
+            return {}
+
+    compute = types.SimpleNamespace(
+        zones=lambda: types.SimpleNamespace(list=lambda project: Req())
+    )
+    assert auth.preflight_permission_check(compute, "p") == (True, None)
+    assert seen == {"http": thread_http, "num_retries": 0}
+
+
+def test_parse_rfc3339_timestamp_shape():
+    assert _parse_rfc3339_timestamp("2024-01-01t00:00:00z") == datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert _parse_rfc3339_timestamp("2024-13-01T00:00:00Z") is None
+    assert _parse_rfc3339_timestamp("2024-01-01") is None
+    assert _parse_rfc3339_timestamp("2024-01-01T00:00:00Z trailing") is None
@@ -0,0 +1,170 @@
+import fulcrum.core.backup as backup_mod
+
+
+class FakeManager:
+    def __init__(self, creds, project_id):
+        self.calls = {"clusters": 0, "plans": 0, "create_plan": 0}
+
+    def list_clusters(self):
+        self.calls["clusters"] += 1
+        return [
+            {"name": "c1", "location": "europe-west1", "status": "RUNNING"},
+            {"name": "c2", "location": "us-central1", "status": "RUNNING"},
+        ]
+
+    def list_backup_plans(self, location, clusters=None):
+        self.calls["plans"] += 1
+        if location != "europe-west1":
+            return []
+        return [
+            {
+                "name": "projects/p1/locations/europe-west1/backupPlans/plan-a",
+                "cluster": "projects/p1/locations/europe-west1/clusters/c1",
+                "_actual_location": "europe-west1",
+            }
+        ]
+
+    def list_backups(self, plan_full_name):
+        return [{"name": plan_full_name + "/backups/b1", "state": "SUCCEEDED"}]
+
+    def create_backup_plan(self, **kwargs):
+        self.calls["create_plan"] += 1
+        return {"name": "operations/op-1"}
+
+
+def _orchestrator(monkeypatch):
+    monkeypatch.setattr(backup_mod, "load_credentials", lambda path: (object(), "p1"))
+    monkeypatch.setattr(backup_mod, "GKEBackupManager", FakeManager)
+    return backup_mod.BackupOrchestrator("p1", sa_key_path="key.json")
+
+
+def test_inventory_and_details_share_cached_listings(monkeypatch):
+    orch = _orchestrator(monkeypatch)
+    inv = orch.inventory()
+    assert [i["protected"] for i in inv] == [True, False]
+    assert inv[0]["backup_plans"] == ["plan-a"]
+
+    details = orch.get_backup_plans_details()
+    assert [(d["name"], d["location"], d["cluster"]) for d in details] == [
+        ("plan-a", "europe-west1", "c1")
+    ]
+    assert orch.mgr.calls == {"clusters": 1, "plans": 2, "create_plan": 0}
+
+
+def test_protect_invalidates_cache_after_creating_plans(monkeypatch):
+    orch = _orchestrator(monkeypatch)
+    results = orch.protect_unprotected_clusters()
+    assert [r["status"] for r in results] == ["Skipped", "Created"]
+    orch.inventory()
+    assert orch.mgr.calls["clusters"] == 2
+
+
+def test_list_cluster_backups_fetches_plans_concurrently(monkeypatch):
+    orch = _orchestrator(monkeypatch)
+    rows = orch.list_cluster_backups()
+    assert [(r["cluster"], r["plan"], r["backup_name"], r["state"]) for r in rows] == [
+        ("c1", "plan-a", "b1", "SUCCEEDED"),
+        ("c2", "-", "-", "UNPROTECTED"),
+    ]
+
+
+def test_ainventory_matches_sync_inventory(monkeypatch):
+    import asyncio
+
+    expected = _orchestrator(monkeypatch).inventory()
+    orch = _orchestrator(monkeypatch)
+    assert asyncio.run(orch.ainventory()) == expected
+    assert orch.inventory() is orch._inventory_cache
+    assert orch.mgr.calls == {"clusters": 1, "plans": 2, "create_plan": 0}
+
+
+class _FakePlansApi:
+    """backupPlans() stand-in: two pages in europe-west1, one in us-central1."""
+
+    PAGES = {
+        "europe-west1": [["a", "b"], ["c"]],
+        "us-central1": [["d"]],
+    }
+
+    def list(self, parent):
+        return {"loc": parent.rsplit("/", 1)[1], "page": 0}
+
+    def list_next(self, previous_request, previous_response):
+        req = dict(previous_request, page=previous_request["page"] + 1)
+        return req if req["page"] < len(self.PAGES[req["loc"]]) else None
+
+
+class _FakeBatch:
+    def __init__(self, log):
+        self.log = log
+        self.items = []
+
+    def add(self, req, callback, request_id):
+        self.items.append((req, callback, request_id))
+
+    def execute(self, http=None):
+        self.log.append(len(self.items))
+        for req, callback, request_id in self.items:
+            names = _FakePlansApi.PAGES[req["loc"]][req["page"]]
+            callback(request_id, {"backupPlans": [{"name": n} for n in names]}, None)
+
+
+class _FakeBackupClient:
+    def __init__(self):
+        self.api = _FakePlansApi()
+        self.batches = []
+
+    def projects(self):
+        return self
+
+    def locations(self):
+        return self
+
+    def backupPlans(self):
+        return self.api
+
+    def new_batch_http_request(self):
+        return _FakeBatch(self.batches)
+
+
+def test_list_backup_plans_batches_locations(monkeypatch):
+    import fulcrum.gcp.backup as gcp_backup
+
+    client = _FakeBackupClient()
+    monkeypatch.setattr(gcp_backup, "build_gkebackup", lambda creds: client)
+    monkeypatch.setattr(gcp_backup, "build_container", lambda creds: object())
+    monkeypatch.setattr(gcp_backup, "thread_http", lambda creds: None)
+    mgr = gcp_backup.GKEBackupManager(object(), "p1")
+
+    plans = mgr.list_backup_plans("us-central1")
+    assert [p["name"] for p in plans] == ["d", "a", "b", "c"]
+    assert [p["_actual_location"] for p in plans] == ["us-central1"] + ["europe-west1"] * 3
+    # Both first pages share one batch; only europe-west1 has a second page
+    assert client.batches == [2, 1]
+
+
+def test_list_backup_plans_skips_fallback_only_when_clusters_covered(monkeypatch):
+    import fulcrum.gcp.backup as gcp_backup
+
+    client = _FakeBackupClient()
+    monkeypatch.setattr(gcp_backup, "build_gkebackup", lambda creds: client)
+    monkeypatch.setattr(gcp_backup, "build_container", lambda creds: object())
+    mgr = gcp_backup.GKEBackupManager(object(), "p1")
+    listed = []
+
+    def fake_execute(req):
+        listed.append(req["loc"])
+        names = _FakePlansApi.PAGES.get(req["loc"], [[]])[req["page"]]
+        cluster = "projects/p1/locations/us-central1/clusters/c1"
+        return {"backupPlans": [{"name": n, "cluster": cluster} for n in names]}
+
+    monkeypatch.setattr(mgr, "_execute", fake_execute)
+
+    assert [p["name"] for p in mgr.list_backup_plans("us-central1", ["c1"])] == ["d"]
+    assert listed == ["us-central1"]
+
+    # c2 has no plan in us-central1; its plan may live in europe-west1
+    listed.clear()
+    plans = mgr.list_backup_plans("us-central1", ["c1", "c2"])
+    assert [p["name"] for p in plans] == ["d", "a", "b", "c"]
+    assert listed == ["us-central1", "europe-west1", "europe-west1"]
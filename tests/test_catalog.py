@@ -20,3 +20,32 @@ def test_validate_csvs(tmp_path):
         f.write("project_id,principal\n")
     issues = validate_csvs(str(out))
     assert issues == []
+
+
+def test_read_header_and_iter_csv(tmp_path):
+    from fulcrum.core.catalog import iter_csv, read_header
+
+    p = tmp_path / "rows.csv"
+    p.write_text("project_id,name\np1,a\np2,b\n")
+    assert read_header(str(p)) == ["project_id", "name"]
+    assert list(iter_csv(str(p)))[1:] == [["p1", "a"], ["p2", "b"]]
+    assert read_header(str(tmp_path / "missing.csv")) == []
+
+
+def test_safe_copy_file_and_dir(tmp_path):
+    from fulcrum.core.catalog import safe_copy_dir, safe_copy_file
+
+    src = tmp_path / "slides"
+    (src / "nested").mkdir(parents=True)
+    (src / "a.md").write_text("alpha")
+    (src / "nested" / "b.md").write_text("beta")
+
+    dst = tmp_path / "out" / "slides"
+    safe_copy_dir(str(src), str(dst))
+    safe_copy_dir(str(src), str(dst))  # existing destination is fine
+    assert (dst / "a.md").read_text() == "alpha"
+    assert (dst / "nested" / "b.md").read_text() == "beta"
+
+    target = tmp_path / "copy" / "summary.md"
+    safe_copy_file(str(src / "a.md"), str(target))
+    assert target.read_text() == "alpha"
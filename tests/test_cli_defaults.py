@@ -43,3 +43,79 @@ def test_preflight_prowler_bin_resolution(tmp_path, monkeypatch):
     s2 = load_settings(cfg.as_posix())
     d = get_cli_defaults(s2, cfg.as_posix())
     assert os.path.exists(d["prowler_bin"]) and os.access(d["prowler_bin"], os.X_OK)
+
+
+def test_report_cli_defaults_fast_path_and_config(tmp_path, monkeypatch):
+    import fulcrum.core.settings as settings_mod
+    from fulcrum.commands.report import _get_cli_defaults
+
+    monkeypatch.setattr(settings_mod, "ALLOWED_CONFIG_DIRS", [tmp_path])
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+    monkeypatch.chdir(tmp_path)
+    assert _get_cli_defaults()["projects"] == []
+
+    (tmp_path / "fulcrum.toml").write_text('[catalog]\nprojects = ["p1"]\n')
+    assert _get_cli_defaults()["projects"] == ["p1"]
+
+
+def test_report_cli_defaults_locates_config_once(tmp_path, monkeypatch):
+    import fulcrum.core.settings as settings_mod
+    import fulcrum.commands.report as report_mod
+
+    monkeypatch.setattr(settings_mod, "ALLOWED_CONFIG_DIRS", [tmp_path])
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "fulcrum.toml").write_text('[catalog]\nprojects = ["p1"]\n')
+
+    calls = []
+    real = settings_mod.locate_config
+
+    def counting(explicit=None):
+        calls.append(explicit)
+        return real(explicit)
+
+    monkeypatch.setattr(settings_mod, "locate_config", counting)
+    monkeypatch.setattr(report_mod, "locate_config", counting)
+    assert report_mod._get_cli_defaults()["projects"] == ["p1"]
+    assert calls == [None]
+
+
+def test_report_aggregates_and_initialises_state(tmp_path):
+    import asyncio
+
+    from fulcrum.commands.report import _CATEGORIES, _aggregate_and_init_projects
+    from fulcrum.core.progress import read_state
+    from fulcrum.prowler.aggregator import ReportAggregator
+
+    state_path = str(tmp_path / "report" / "progress.json")
+    aggregator = ReportAggregator(report_dir=str(tmp_path))
+    summary = asyncio.run(_aggregate_and_init_projects(aggregator, ["p1"], state_path))
+    assert summary["total_stats"]["FAIL"] == 0
+    phases = read_state(state_path)["projects"]["p1"]["phases"]
+    assert set(phases) == set(_CATEGORIES)
+    assert asyncio.run(_aggregate_and_init_projects(None, ["p1"], state_path)) is None
+
+
+def test_report_wait_counts_done_phases(tmp_path):
+    import asyncio
+
+    from fulcrum.commands.report import _CATEGORIES, _wait_for_completion_async
+    from fulcrum.core.progress import init_projects, update_phase
+
+    state_path = str(tmp_path / "progress.json")
+    init_projects(state_path, ["p1", "p2"], list(_CATEGORIES))
+    for p in ("p1", "p2"):
+        for cat in _CATEGORIES:
+            update_phase(state_path, p, cat, 100.0, "done")
+
+    class Prog:
+        finished = False
+        completed = None
+
+        def update(self, task, completed):
+            self.completed = completed
+
+    prog = Prog()
+    total = 2 * len(_CATEGORIES)
+    asyncio.run(_wait_for_completion_async(state_path, total, prog, None))
+    assert prog.completed == total
@@ -14,7 +14,7 @@ class FakeAgg:
     def __init__(self, pages):
         self.req = FakeReq(pages)
 
-    def aggregatedList(self, project):
+    def aggregatedList(self, project, **kwargs):
         return self.req
 
     def aggregatedList_next(self, previous_request=None, previous_response=None):
@@ -97,3 +97,79 @@ def test_collect_project(monkeypatch):
     assert data["instances"][0]["name"] == "vm1"
     assert data["buckets"][0]["name"] == "b1"
     assert data["sql_instances"][0]["name"] == "sql1"
+
+
+def test_list_helpers_request_field_masks():
+    from fulcrum.gcp.client import FIREWALL_FIELDS, MAX_RESULTS, list_firewalls
+
+    seen = {}
+
+    class Firewalls(FakeList):
+        def list(self, **kwargs):
+            seen.update(kwargs)
+            return super().list(**kwargs)
+
+    class Compute:
+        def __init__(self):
+            self.fw = Firewalls([{"items": [{"name": "fw1"}]}])
+
+        def firewalls(self):
+            return self.fw
+
+    assert list_firewalls(Compute(), "p1") == [{"name": "fw1"}]
+    assert seen == {"project": "p1", "maxResults": MAX_RESULTS, "fields": FIREWALL_FIELDS}
+    for scope in ("sourceTags", "targetServiceAccounts", "sourceServiceAccounts", "destinationRanges"):
+        assert scope in FIREWALL_FIELDS
+
+
+def test_discovery_clients_are_built_once(monkeypatch):
+    import googleapiclient.discovery
+    from fulcrum.gcp import client
+
+    built = []
+    monkeypatch.setattr(
+        googleapiclient.discovery,
+        "build",
+        lambda *a, **kw: built.append((a, kw)) or object(),
+    )
+    client._build.cache_clear()
+    creds = object()
+    try:
+        assert client.build_compute(creds) is client.build_compute(creds)
+        assert client.build_container(creds) is not client.build_compute(creds)
+        assert [a for a, _ in built] == [("compute", "v1"), ("container", "v1")]
+        # Shared clients must not carry the building thread's transport
+        assert all("http" not in kw and kw["credentials"] is creds for _, kw in built)
+    finally:
+        client._build.cache_clear()
+
+
+def test_list_gke_clusters_with_backup_plans():
+    from fulcrum.gcp.client import list_gke_clusters_with_backup_plans
+
+    class Chain:
+        def __init__(self, leaf):
+            self.leaf = leaf
+
+        def projects(self):
+            return self
+
+        def locations(self):
+            return self
+
+        def clusters(self):
+            return self.leaf
+
+        def backupPlans(self):
+            return self.leaf
+
+    clusters = FakeList([{"clusters": [
+        {"name": "c1", "location": "europe-west1"},
+        {"name": "c2", "location": "us-central1"},
+    ]}])
+    plans = FakeList([
+        {"backupPlans": [{"name": "bp1", "cluster": "projects/p1/locations/europe-west1/clusters/c1"}]},
+        {"backupPlans": [{"name": "bp2", "cluster": "projects/p1/locations/europe-west1/clusters/c1"}]},
+    ])
+    result = list_gke_clusters_with_backup_plans(Chain(clusters), Chain(plans), "p1")
+    assert [[p["name"] for p in c["backupPlans"]] for c in result] == [["bp1", "bp2"], []]
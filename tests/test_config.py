@@ -7,3 +7,14 @@ def test_merge_projects():
     assert res["org_id"] == "y"
     assert res["projects"] == ["b", "c"]
     assert res["redaction"]["enabled"] is True
+
+
+def test_yaml_roundtrip_returns_independent_copies(tmp_path):
+    from fulcrum.core.config import load_yaml, write_yaml
+
+    path = str(tmp_path / "cfg" / "config.yaml")
+    write_yaml(path, {"org_id": "x", "redaction": {"enabled": False}})
+    first = load_yaml(path)
+    first["redaction"]["enabled"] = True
+    assert load_yaml(path) == {"org_id": "x", "redaction": {"enabled": False}}
+    assert load_yaml(str(tmp_path / "missing.yaml")) == {}
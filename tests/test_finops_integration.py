@@ -1,4 +1,5 @@
-from datetime import datetime, timezone
+import asyncio
+from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 
 import pytest
@@ -6,10 +7,33 @@ from typer.testing import CliRunner
 
 from fulcrum.cli import app
 from fulcrum.commands import finops as finops_cmd
+from fulcrum.gcp import finops_client as finops_client_mod
 from fulcrum.gcp.finops_client import GCPFinOpsClient
 from fulcrum.gcp.gke_cost_client import GKECostClient
 
 
+class _FakeQueryJobConfig:
+    def __init__(self, query_parameters=(), maximum_bytes_billed=None):
+        self.query_parameters = list(query_parameters)
+        self.maximum_bytes_billed = maximum_bytes_billed
+
+
+_fake_bigquery = SimpleNamespace(
+    QueryJobConfig=_FakeQueryJobConfig,
+    ScalarQueryParameter=lambda *args: args,
+    ArrayQueryParameter=lambda *args: args,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_query_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(finops_client_mod, "_bigquery", lambda: _fake_bigquery)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    finops_client_mod._QUERY_CACHE.clear()
+    yield
+    finops_client_mod._QUERY_CACHE.clear()
+
+
 class _FakeQueryJob:
     def __init__(self, rows):
         self._rows = rows
@@ -22,9 +46,11 @@ class _FakeBigQueryClient:
     def __init__(self, rows):
         self._rows = rows
         self.queries = []
+        self.job_configs = []
 
-    def query(self, query):
+    def query(self, query, job_config=None):
         self.queries.append(query)
+        self.job_configs.append(job_config)
         return _FakeQueryJob(self._rows)
 
 
@@ -32,7 +58,7 @@ class _FakeBillingClient:
     def __init__(self, accounts=None, services=None, skus=None):
         self._accounts = accounts or []
         self._services = services or []
-        self._skus = skus or []
+        self._skus = skus or {}
 
     def list_billing_accounts(self):
         return self._accounts
@@ -40,8 +66,8 @@ class _FakeBillingClient:
     def list_services(self):
         return self._services
 
-    def list_skus(self, parent):
-        return self._skus
+    def list_skus(self, request):
+        return self._skus.get(request["parent"], [])
 
 
 class _FakeRecommendation:
@@ -60,7 +86,14 @@ class _FakeRecommendation:
 
 
 class _FakeRecommenderClient:
-    def list_recommendations(self, request):
+    def __init__(self, failing=()):
+        self.parents = []
+        self._failing = failing
+
+    def list_recommendations(self, request, retry=None):
+        self.parents.append(request["parent"])
+        if any(p in request["parent"] for p in self._failing):
+            raise RuntimeError("denied")
         return [_FakeRecommendation()]
 
 
@@ -87,6 +120,51 @@ def test_finops_client_lists_accounts_and_services(monkeypatch):
     assert services[0].display_name == "Compute Engine"
 
 
+def test_finops_client_sku_pricing_by_service(monkeypatch):
+    client = GCPFinOpsClient(billing_project_id="billing-project")
+
+    def sku(sku_id):
+        return SimpleNamespace(
+            sku_id=sku_id,
+            name=f"services/x/skus/{sku_id}",
+            display_name=sku_id,
+            category=SimpleNamespace(
+                service_family="Compute", resource_family="CPU", resource_group="N1"
+            ),
+            pricing_info=[
+                SimpleNamespace(
+                    unit="h",
+                    unit_count=1,
+                    aggregate_quantity=0,
+                    exclusive_price=SimpleNamespace(
+                        currency_code="USD", units=0, nanos=5
+                    ),
+                )
+            ],
+        )
+
+    billing_client = _FakeBillingClient(
+        skus={"services/a": [sku("a1"), sku("a2")], "services/b": [sku("b1")]}
+    )
+    monkeypatch.setattr(client, "_get_billing_client", lambda: billing_client)
+
+    pricing = client.get_sku_pricing_by_service(["a", "b"])
+
+    assert [s.sku_id for s in pricing["a"]] == ["a1", "a2"]
+    assert [s.sku_id for s in pricing["b"]] == ["b1"]
+    assert pricing["a"][0].service_family == "Compute"
+    assert pricing["a"][0].resource_group == "N1"
+    assert pricing["a"][0].pricing_info[0].unit == "h"
+    assert pricing["a"][0].pricing_info[0].effective_unit_price.nanos == 5
+    assert next(client.iter_sku_pricing("b")).sku_id == "b1"
+
+    # Served from the on-disk cache once the catalog is gone
+    billing_client._skus = {}
+    cached = client.get_sku_pricing("a")
+    assert cached == pricing["a"]
+    assert cached[0].pricing_info[0].effective_unit_price.currency_code == "USD"
+
+
 def test_finops_client_recommendations(monkeypatch):
     client = GCPFinOpsClient(billing_project_id="billing-project")
 
@@ -100,10 +178,34 @@ def test_finops_client_recommendations(monkeypatch):
     assert recommendations[0].recommender_id == "rec"
 
 
+def test_finops_client_recommendations_bulk(monkeypatch):
+    client = GCPFinOpsClient(billing_project_id="billing-project")
+    recommender_client = _FakeRecommenderClient(failing=("projects/p2/",))
+
+    monkeypatch.setattr(client, "_get_recommender_client", lambda: recommender_client)
+
+    recommendations = client.get_recommendations_bulk(
+        ["p1", "p2"], ["rec-a", "rec-b"], locations=("global", "europe-west1")
+    )
+
+    assert len(recommender_client.parents) == 8
+    assert sorted(r.recommender_id for r in recommendations) == [
+        "rec-a",
+        "rec-a",
+        "rec-b",
+        "rec-b",
+    ]
+
+
 def test_finops_client_cost_summary(monkeypatch):
     client = GCPFinOpsClient(billing_project_id="billing-project")
 
-    row = SimpleNamespace(total_cost=12.5, service_id="svc", service_name="Compute")
+    row = SimpleNamespace(
+        total_cost=12.5,
+        percentage_of_total=100.0,
+        service_id="svc",
+        service_name="Compute",
+    )
     bigquery_client = _FakeBigQueryClient([row])
 
     monkeypatch.setattr(client, "_get_bigquery_client", lambda: bigquery_client)
@@ -115,6 +217,124 @@ def test_finops_client_cost_summary(monkeypatch):
     )
 
     assert cost_by_service[0].service_display_name == "Compute"
+    assert cost_by_service[0].percentage_of_total == 100.0
+    assert "OVER ()" in bigquery_client.queries[0]
+    assert bigquery_client.job_configs[0].maximum_bytes_billed == (
+        finops_client_mod.MAX_BYTES_BILLED
+    )
+
+
+def test_finops_client_cost_summary_is_cached(monkeypatch):
+    client = GCPFinOpsClient(billing_project_id="billing-project", max_bytes_billed=10)
+
+    row = SimpleNamespace(
+        total_cost=12.5, percentage_of_total=100.0, project_id="p1", project_name="P1"
+    )
+    bigquery_client = _FakeBigQueryClient([row])
+
+    monkeypatch.setattr(client, "_get_bigquery_client", lambda: bigquery_client)
+
+    kwargs = dict(
+        billing_account_id="billing-account",
+        start_date=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        end_date=datetime(2025, 1, 2, tzinfo=timezone.utc),
+    )
+    first = client.get_cost_summary_by_project(project_filter=["p2", "p1"], **kwargs)
+    second = client.get_cost_summary_by_project(project_filter=["p1", "p2"], **kwargs)
+    client.get_cost_summary_by_project(project_filter=["p1"], **kwargs)
+
+    assert first == second
+    assert len(bigquery_client.queries) == 2
+    assert "IN UNNEST(@projects)" in bigquery_client.queries[0]
+    assert "_PARTITIONTIME >= @start" in bigquery_client.queries[0]
+    params = bigquery_client.job_configs[0].query_parameters
+    assert ("projects", "STRING", ["p2", "p1"]) in params
+    assert ("end", "TIMESTAMP", datetime(2025, 1, 2, tzinfo=timezone.utc)) in params
+    assert "2025-01" not in bigquery_client.queries[0]
+    assert bigquery_client.job_configs[0].maximum_bytes_billed == 10
+
+
+def test_query_cache_ttl_waits_out_export_lag():
+    ttl = finops_client_mod._query_cache_ttl
+    now = datetime.now(timezone.utc)
+    assert ttl(now + timedelta(days=1)) == finops_client_mod.QUERY_CACHE_TTL_OPEN
+    # Yesterday's rows may still be landing in the export
+    assert ttl(now) == finops_client_mod.QUERY_CACHE_TTL_OPEN
+    assert ttl(now - timedelta(days=1)) == finops_client_mod.QUERY_CACHE_TTL_OPEN
+    assert ttl(now - timedelta(days=2)) == finops_client_mod.QUERY_CACHE_TTL_CLOSED
+
+
+def test_finops_client_async_cost_summaries(monkeypatch):
+    client = GCPFinOpsClient(billing_project_id="billing-project")
+
+    row = SimpleNamespace(
+        total_cost=1.0,
+        percentage_of_total=100.0,
+        service_id="svc",
+        service_name="Compute",
+        project_id="p1",
+        project_name="P1",
+    )
+    bigquery_client = _FakeBigQueryClient([row])
+
+    monkeypatch.setattr(client, "_get_bigquery_client", lambda: bigquery_client)
+
+    async def both():
+        args = (
+            "billing-account",
+            datetime(2025, 1, 1, tzinfo=timezone.utc),
+            datetime(2025, 1, 2, tzinfo=timezone.utc),
+        )
+        return await asyncio.gather(
+            client.aget_cost_summary_by_service(*args),
+            client.aget_cost_summary_by_project(*args),
+        )
+
+    by_service, by_project = asyncio.run(both())
+
+    assert by_service[0].service_display_name == "Compute"
+    assert by_project[0].project_id == "p1"
+    assert len(bigquery_client.queries) == 2
+
+
+def test_finops_client_billing_export_rows(monkeypatch):
+    client = GCPFinOpsClient(billing_project_id="billing-project")
+
+    row = {
+        "usage_date": "2025-01-01",
+        "project_id": "p1",
+        "project_name": "P1",
+        "project_number": 42,
+        "service_name": "Compute",
+        "sku_name": "CPU",
+        "sku_id": "sku",
+        "total_cost": 3,
+        "total_cost_with_credits": None,
+        "usage_amount": 1.5,
+        "pricing_unit": "hour",
+        "labels": [{"key": "env", "value": "prod"}],
+        "resource_name": "vm-1",
+        "resource_type": "instance",
+        "location": "europe-west1",
+        "country": "BE",
+        "region": "europe-west1",
+    }
+    bigquery_client = _FakeBigQueryClient([row])
+
+    monkeypatch.setattr(client, "_get_bigquery_client", lambda: bigquery_client)
+    monkeypatch.setattr(client, "_get_bqstorage_client", lambda: None)
+
+    costs = client.query_billing_export(
+        billing_account_id="billing-account",
+        start_date=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        end_date=datetime(2025, 1, 2, tzinfo=timezone.utc),
+    )
+
+    assert costs["project_number"] == ["42"]
+    assert costs["total_cost"] == [3.0]
+    assert costs["total_cost_with_credits"] == [0.0]
+    assert costs["labels"] == [{"env": "prod"}]
+    assert costs["region"] == ["europe-west1"]
 
 
 def test_gke_cost_client_summary(monkeypatch):
@@ -0,0 +1,30 @@
+import json
+
+import pytest
+
+import fulcrum.core.jsonio as jsonio
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_write_json_roundtrip(tmp_path, monkeypatch, use_orjson):
+    if use_orjson and jsonio.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    path = tmp_path / "findings.json"
+    data = [{"file": "a.py", "line": 3, "match_snippet": "contraseña=..."}]
+    jsonio.write_json(str(path), data)
+    text = path.read_text(encoding="utf-8")
+    assert json.loads(text) == data
+    assert "contraseña" in text
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_read_json(tmp_path, monkeypatch, use_orjson):
+    if use_orjson and jsonio.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    path = tmp_path / "state.json"
+    path.write_text('{"projects": {"p1": {"phase": "añadir"}}}', encoding="utf-8")
+    assert jsonio.read_json(str(path)) == {"projects": {"p1": {"phase": "añadir"}}}
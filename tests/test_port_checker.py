@@ -0,0 +1,30 @@
+import json
+import os
+
+from fulcrum.security.port_checker import PortChecker
+
+
+def test_run_checks_fans_out_over_projects(tmp_path, monkeypatch):
+    rules = [
+        {"name": "allow-ssh", "network": "global/networks/default",
+         "allowed": [{"IPProtocol": "tcp", "ports": ["22"]}]},
+        {"name": "allow-web", "allowed": [{"IPProtocol": "tcp", "ports": ["80-443"]}]},
+    ]
+    gcloud = tmp_path / "gcloud"
+    gcloud.write_text(
+        "#!/bin/sh\n"
+        'case "$*" in *--project=broken*) echo denied >&2; exit 1;; esac\n'
+        f"echo '{json.dumps(rules)}'\n"
+    )
+    os.chmod(gcloud, 0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+
+    checker = PortChecker(["p1", "p2", "broken"], 22)
+    checker.run_checks(max_workers=2)
+
+    results = {r["project_id"]: r for r in checker.results}
+    assert set(results) == {"p1", "p2", "broken"}
+    assert results["p1"]["is_open"]
+    assert [r["name"] for r in results["p1"]["open_rules"]] == ["allow-ssh"]
+    assert results["p1"]["open_rules"][0]["network"] == "default"
+    assert "denied" in results["broken"]["error"]
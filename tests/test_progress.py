@@ -0,0 +1,101 @@
+import json
+
+from fulcrum.core import progress
+
+
+def test_update_phase_appends_to_log_until_compacted(tmp_path, monkeypatch):
+    path = str(tmp_path / "state" / "progress.json")
+    monkeypatch.setattr(progress, "_STATE_CACHE", {})
+    monkeypatch.setattr(progress, "FLUSH_INTERVAL", 0.0)
+
+    progress.init_projects(path, ["p1"], ["iam"])
+    progress.update_phase(path, "p1", "iam", 25.0, "running")
+    progress.update_phase(path, "p1", "iam", 50.0, "running")
+    with open(path) as f:
+        assert json.load(f)["projects"]["p1"]["phases"]["iam"]["progress"] == 0.0
+    with open(path + ".log") as f:
+        assert len(f.readlines()) == 2
+
+    merged = progress.read_state(path)
+    assert merged["projects"]["p1"]["phases"]["iam"]["progress"] == 50.0
+    assert merged["projects"]["p1"]["summary"]["completion"] == 50.0
+
+    progress.compact_state(path)
+    assert not (tmp_path / "state" / "progress.json.log").exists()
+    with open(path) as f:
+        assert json.load(f)["projects"]["p1"]["phases"]["iam"]["progress"] == 50.0
+
+
+def test_update_phase_writes_terminal_status(tmp_path, monkeypatch):
+    path = str(tmp_path / "progress.json")
+    monkeypatch.setattr(progress, "_STATE_CACHE", {})
+
+    progress.init_projects(path, ["p1"], ["iam", "net"])
+    progress.update_phase(path, "p1", "iam", 100.0, "done")
+    with open(path) as f:
+        proj = json.load(f)["projects"]["p1"]
+    assert proj["phases"]["iam"]["status"] == "done"
+    assert proj["summary"]["completion"] == 50.0
+
+
+def test_update_phase_completion_tracks_new_phases(tmp_path, monkeypatch):
+    path = str(tmp_path / "progress.json")
+    monkeypatch.setattr(progress, "_STATE_CACHE", {})
+
+    progress.init_projects(path, ["p1"], ["iam"])
+    progress.update_phase(path, "p1", "iam", 80.0, "running")
+    progress.update_phase(path, "p1", "iam", 60.0, "running")
+    progress.update_phase(path, "p1", "net", 20.0, "done")
+    with open(path) as f:
+        summary = json.load(f)["projects"]["p1"]["summary"]
+    assert summary == {"avg_eta": "--", "completion": 40.0}
+
+
+def test_update_phase_throttles_and_compacts_log(tmp_path, monkeypatch):
+    path = str(tmp_path / "progress.json")
+    clock = [1000.0]
+    monkeypatch.setattr(progress, "_STATE_CACHE", {})
+    monkeypatch.setattr(progress, "now", lambda: clock[0])
+    monkeypatch.setattr(progress, "COMPACT_EVERY", 3)
+
+    progress.init_projects(path, ["p1"], ["iam", "net"])
+    # Within FLUSH_INTERVAL of the snapshot write: held in memory
+    progress.update_phase(path, "p1", "iam", 10.0, "running")
+    progress.update_phase(path, "p1", "net", 10.0, "running")
+    assert not (tmp_path / "progress.json.log").exists()
+
+    # Both pending phases go out together once the interval has passed
+    clock[0] += 1.0
+    progress.update_phase(path, "p1", "iam", 20.0, "running")
+    with open(path + ".log") as f:
+        assert len(f.readlines()) == 2
+    merged = progress.read_state(path)
+    assert merged["projects"]["p1"]["phases"]["net"]["progress"] == 10.0
+
+    clock[0] += 1.0
+    progress.update_phase(path, "p1", "net", 30.0, "running")
+    with open(path + ".log") as f:
+        assert len(f.readlines()) == 3
+
+    # The next flush would exceed COMPACT_EVERY records: fold into the snapshot
+    clock[0] += 1.0
+    progress.update_phase(path, "p1", "iam", 40.0, "running")
+    assert not (tmp_path / "progress.json.log").exists()
+    with open(path) as f:
+        phases = json.load(f)["projects"]["p1"]["phases"]
+    assert phases["net"]["progress"] == 30.0
+    assert phases["iam"]["progress"] == 40.0
+
+
+def test_update_phase_compacts_log_after_interval(tmp_path, monkeypatch):
+    path = str(tmp_path / "progress.json")
+    clock = [1000.0]
+    monkeypatch.setattr(progress, "_STATE_CACHE", {})
+    monkeypatch.setattr(progress, "now", lambda: clock[0])
+
+    progress.init_projects(path, ["p1"], ["iam"])
+    clock[0] += progress.COMPACT_INTERVAL
+    progress.update_phase(path, "p1", "iam", 10.0, "running")
+    assert not (tmp_path / "progress.json.log").exists()
+    with open(path) as f:
+        assert json.load(f)["projects"]["p1"]["phases"]["iam"]["progress"] == 10.0
@@ -0,0 +1,74 @@
+import os
+
+from fulcrum.core.report_builder import (
+    ReportBuilder,
+    ReportConfig,
+    StandardReportStrategy,
+)
+
+
+def test_standard_index_lists_known_pages(tmp_path):
+    out = str(tmp_path)
+    strategy = StandardReportStrategy(ReportConfig(output_dir=out))
+    pages = {
+        "compute": os.path.join(out, "projects", "compute.md"),
+        "data_storage": os.path.join(out, "projects", "data_storage.md"),
+        "unknown": os.path.join(out, "projects", "unknown.md"),
+    }
+    content = strategy.format_index(pages, "Jane")
+    assert content.splitlines() == [
+        "## Report Overview",
+        "",
+        "Author: Jane",
+        "",
+        "### Contents",
+        "",
+        "- [Compute](projects/compute.md)",
+        "- [Data Storage](projects/data_storage.md)",
+    ]
+
+
+def test_ensure_output_dir_claims_next_suffix(tmp_path):
+    cfg = ReportConfig(output_dir=str(tmp_path), report_date="20240101")
+    strategy = StandardReportStrategy(cfg)
+    first = strategy.ensure_output_dir()
+    assert os.path.basename(first) == "report-std-20240101"
+    (tmp_path / "report-std-20240101-07").mkdir()
+    second = strategy.ensure_output_dir()
+    assert os.path.basename(second) == "report-std-20240101-08"
+    assert os.path.isdir(os.path.join(second, "projects"))
+
+
+def test_read_csv_pads_and_skips_blank_rows(tmp_path):
+    p = tmp_path / "data.csv"
+    p.write_text("a,b,c\n1,2,3\n\n4\n5,6,7,8\n")
+    headers, rows = ReportBuilder().read_csv(str(p))
+    assert headers == ["a", "b", "c"]
+    assert rows == [["1", "2", "3"], ["4", "", ""], ["5", "6", "7"]]
+
+
+def test_from_config_selects_registered_strategy(tmp_path):
+    import pytest
+
+    from fulcrum.core.report_builder import FinOpsReportStrategy
+
+    builder = ReportBuilder.from_config(ReportConfig(output_dir=str(tmp_path), report_type="finops"))
+    assert isinstance(builder.strategy, FinOpsReportStrategy)
+    with pytest.raises(ValueError):
+        ReportBuilder.from_config(ReportConfig(report_type="bogus"))
+
+
+def test_finops_index_relative_links(tmp_path):
+    from fulcrum.core.report_builder import FinOpsReportStrategy
+
+    out = str(tmp_path / "out")
+    strategy = FinOpsReportStrategy(ReportConfig(output_dir=out))
+    pages = {
+        "gke_costs": os.path.join(out, "finops", "gke_costs.md"),
+        "summary": os.path.join(out, "finops", "summary.md"),
+        "external": str(tmp_path / "elsewhere" / "x.md"),
+    }
+    lines = strategy.format_index(pages, "Jane").splitlines()
+    assert "- [GKE Cost Analysis](finops/gke_costs.md)" in lines
+    assert "- [Summary](finops/summary.md)" in lines
+    assert "- [External](../elsewhere/x.md)" in lines
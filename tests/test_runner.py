@@ -0,0 +1,29 @@
+import subprocess
+
+import pytest
+
+import fulcrum.gcp.runner as runner
+
+
+def test_run_gcloud_parses_bytes_output(monkeypatch):
+    def fake_run(cmd, **kwargs):
+        assert "text" not in kwargs
+        return subprocess.CompletedProcess(cmd, 0, stdout=b'[{"name": "caf\xc3\xa9"}]', stderr=b"")
+
+    monkeypatch.setattr(runner.subprocess, "run", fake_run)
+    assert runner.run_gcloud(["projects", "list"]) == [{"name": "café"}]
+
+
+def test_run_gcloud_reports_stderr_and_bad_json(monkeypatch):
+    def failing(cmd, **kwargs):
+        raise subprocess.CalledProcessError(1, cmd, output=b"", stderr=b"ERROR: denied\n")
+
+    monkeypatch.setattr(runner.subprocess, "run", failing)
+    with pytest.raises(runner.GCloudError, match="denied"):
+        runner.run_gcloud(["projects", "list"])
+
+    monkeypatch.setattr(
+        runner.subprocess, "run", lambda cmd, **kw: subprocess.CompletedProcess(cmd, 0, stdout=b"", stderr=b"")
+    )
+    with pytest.raises(runner.GCloudError, match="parse"):
+        runner.run_gcloud(["projects", "list"])
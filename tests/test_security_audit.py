@@ -0,0 +1,14 @@
+from fulcrum.security.audit import SecurityAuditor
+
+
+def test_serial_scan_counts_findings_in_progress(tmp_path):
+    (tmp_path / "settings.py").write_text('password = "hunter2"\n')
+    (tmp_path / "clean.py").write_text("x = 1\n")
+
+    auditor = SecurityAuditor(str(tmp_path), use_parallel=False)
+    findings, progress = auditor.scan_with_progress()
+
+    assert len(findings) == 1
+    assert progress.findings_found == 1
+    assert progress.files_scanned == 2
+    assert progress.percent_complete == 100
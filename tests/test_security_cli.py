@@ -65,3 +65,19 @@ def test_security_run_missing_prowler(tmp_path, monkeypatch):
         ],
     )
     assert result.exit_code == 0
+
+
+def test_security_audit_streams_ndjson(tmp_path):
+    import json
+
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "settings.py").write_text('password = "hunter2"\n')
+    out = tmp_path / "findings.ndjson"
+    result = runner.invoke(
+        app, ["security-local", "audit", str(src), "--output", str(out)]
+    )
+    assert result.exit_code == 1
+    records = [json.loads(line) for line in out.read_text().splitlines()]
+    assert [r["rule"] for r in records] == ["password"]
+    assert records[0]["line"] == 1
@@ -1,5 +1,5 @@
 import os
-from fulcrum.core.settings import load_settings, save_settings, Settings
+from fulcrum.core.settings import clear_settings_cache, load_settings, save_settings, Settings
 
 
 def test_settings_roundtrip(tmp_path):
@@ -12,3 +12,133 @@ def test_settings_roundtrip(tmp_path):
     s2 = load_settings(str(path))
     assert s2.org.org_id == "308776007368"
     assert s2.catalog.projects == ["proj-a", "proj-b"]
+
+
+def test_load_settings_cached_copy_and_reload(tmp_path, monkeypatch):
+    import fulcrum.core.settings as settings_mod
+
+    monkeypatch.setattr(settings_mod, "ALLOWED_CONFIG_DIRS", [tmp_path])
+    path = tmp_path / "fulcrum.toml"
+    path.write_text('[org]\norg_id = "111"\n')
+
+    first = load_settings(str(path))
+    first.org.org_id = "mutated"
+    assert load_settings(str(path)).org.org_id == "111"
+
+    path.write_text('[org]\norg_id = "222"\n')
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert load_settings(str(path)).org.org_id == "222"
+
+
+def test_clear_settings_cache(tmp_path, monkeypatch):
+    import fulcrum.core.settings as settings_mod
+
+    monkeypatch.setattr(settings_mod, "ALLOWED_CONFIG_DIRS", [tmp_path])
+    path = tmp_path / "fulcrum.toml"
+    path.write_text('[org]\norg_id = "111"\n')
+    load_settings(str(path))
+    assert settings_mod._parse_settings.cache_info().currsize >= 1
+    clear_settings_cache()
+    assert settings_mod._parse_settings.cache_info().currsize == 0
+
+
+def test_validate_settings_rejects_bad_types(tmp_path, monkeypatch):
+    import pytest
+    from pydantic import ValidationError
+
+    import fulcrum.core.settings as settings_mod
+
+    monkeypatch.setattr(settings_mod, "ALLOWED_CONFIG_DIRS", [tmp_path])
+    path = tmp_path / "fulcrum.toml"
+    path.write_text('[catalog]\ntimeout_sec = "soon"\n')
+    s = load_settings(str(path))
+    assert s.catalog.limit_per_project == 500
+    with pytest.raises(ValidationError):
+        settings_mod.validate_settings(s)
+
+
+def test_is_path_safe_uses_resolved_allow_list(tmp_path):
+    from pathlib import Path
+
+    from fulcrum.core.settings import _is_path_safe
+
+    allowed = [tmp_path / "cfg"]
+    (tmp_path / "cfg").mkdir()
+    assert _is_path_safe(tmp_path / "cfg" / "fulcrum.toml", allowed)
+    assert not _is_path_safe(tmp_path / "cfg" / ".." / "fulcrum.toml", allowed)
+    assert not _is_path_safe(Path("/etc/passwd"), allowed)
+
+
+def test_is_path_safe_rejects_symlink_escape(tmp_path):
+    from fulcrum.core.settings import _is_path_safe
+
+    allowed = tmp_path / "cfg"
+    allowed.mkdir()
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "secret").write_text("x")
+    (allowed / "fulcrum.toml").symlink_to(outside / "secret")
+    (allowed / "linked").symlink_to(outside, target_is_directory=True)
+
+    assert not _is_path_safe(allowed / "fulcrum.toml", [allowed])
+    assert not _is_path_safe(allowed / "linked" / "secret", [allowed])
+
+
+def test_is_path_safe_resolves_dotdot_after_symlink(tmp_path, monkeypatch):
+    import fulcrum.core.settings as settings_mod
+
+    allowed = tmp_path / "cfg"
+    allowed.mkdir()
+    outside = tmp_path / "outside" / "deep"
+    outside.mkdir(parents=True)
+    (allowed / "link").symlink_to(outside, target_is_directory=True)
+    # Skip the symlink walk: containment alone must catch the escape
+    monkeypatch.setattr(settings_mod, "_symlink_component", lambda *a: None)
+
+    assert not settings_mod._is_path_safe(
+        allowed / "link" / ".." / "fulcrum.toml", [allowed]
+    )
+
+
+def test_is_path_safe_rejects_symlink_before_dotdot(tmp_path):
+    from fulcrum.core.settings import _is_path_safe, _symlink_component
+
+    allowed = tmp_path / "cfg"
+    allowed.mkdir()
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (allowed / "link").symlink_to(outside, target_is_directory=True)
+    requested = allowed / "link" / ".." / "fulcrum.toml"
+
+    assert _symlink_component(str(requested), {str(allowed)}) == str(allowed / "link")
+    assert not _is_path_safe(requested, [allowed])
+
+
+def test_missing_sections_use_defaults(tmp_path, monkeypatch):
+    import fulcrum.core.settings as settings_mod
+
+    monkeypatch.setattr(settings_mod, "ALLOWED_CONFIG_DIRS", [tmp_path])
+    path = tmp_path / "fulcrum.toml"
+    path.write_text('[org]\norg_id = "111"\n')
+    s = load_settings(str(path))
+    assert s.labels.env == ["env", "environment"]
+    s.labels.env.append("stage")
+    assert settings_mod._DEFAULTS["labels"].env == ["env", "environment"]
+    assert load_settings(str(path)).labels.env == ["env", "environment"]
+
+
+def test_locate_config_default_paths(tmp_path, monkeypatch):
+    import fulcrum.core.settings as settings_mod
+
+    monkeypatch.setattr(settings_mod, "ALLOWED_CONFIG_DIRS", [tmp_path])
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+    monkeypatch.chdir(tmp_path)
+    assert settings_mod.locate_config() is None
+
+    (tmp_path / "fulcrum.toml").write_text("")
+    assert settings_mod.locate_config() == str(tmp_path / "fulcrum.toml")
+
+    (tmp_path / "fulcrum.toml").unlink()
+    (tmp_path / "fulcrum.toml").symlink_to(tmp_path / "xdg")
+    assert settings_mod.locate_config() is None
@@ -0,0 +1,62 @@
+from fulcrum.core.templates import TemplateEngine
+
+
+def test_compiled_templates_are_used_when_fresh(tmp_path):
+    import os
+
+    from fulcrum.core.templates import compile_templates
+
+    compiled = compile_templates(tmp_path / "compiled")
+    engine = TemplateEngine(compiled_dir=compiled)
+    assert type(engine.env.loader).__name__ == "ChoiceLoader"
+    out = engine.render("report_index", {"author": "A", "pages": {"compute": "c.md"}, "generated_at": "now"})
+    assert "[Compute](c.md)" in out
+
+    os.utime(compiled, (0, 0))
+    stale = TemplateEngine(compiled_dir=compiled)
+    assert type(stale.env.loader).__name__ == "FileSystemLoader"
+
+
+def test_native_page_emitters_match_templates():
+    from fulcrum.core.templates import render_executive_page, render_page
+
+    engine = TemplateEngine(compiled_dir=None)
+    cases = [
+        ("T", ["a", "b"], [["1", "2"], ["3", "4"]]),
+        ("T", ["a"], []),
+        ("T", [], [["x"]]),
+        ("T", ["a"], [["1"]]),
+    ]
+    for title, headers, rows in cases:
+        for footer in (None, "foot"):
+            expected = engine.render(
+                "report_page",
+                {"title": title, "headers": headers, "rows": rows, "footer": footer},
+            )
+            assert render_page(title, headers, rows, footer=footer) == expected
+        for metadata in (None, {}, {"project_id": "p"}, {"other": 1}):
+            expected = engine.render(
+                "executive_page",
+                {"title": title, "headers": headers, "rows": rows, "metadata": metadata},
+            )
+            assert render_executive_page(title, headers, rows, metadata=metadata) == expected
+
+
+def test_render_kubernetes_catalog_rows():
+    from fulcrum.core.templates import render_kubernetes_catalog
+
+    full = {
+        "project_id": "p1",
+        "name": "c1",
+        "location": "europe-west1",
+        "masterVersion": "1.29",
+        "network": "net",
+        "subnetwork": "sub",
+        "labels": "env=prod",
+    }
+    partial = {"project_id": "p2", "name": "c2", "location": "us-east1"}
+    out = render_kubernetes_catalog("A", [full, partial])
+    assert "| p1 | c1 | europe-west1 | 1.29 | net | sub | env=prod |" in out
+    assert "| p2 | c2 | us-east1 |  |  |  |  |" in out
+    assert "Total Clusters:** 2" in out
+    assert partial == {"project_id": "p2", "name": "c2", "location": "us-east1"}
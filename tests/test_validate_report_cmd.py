@@ -0,0 +1,30 @@
+import os
+
+from fulcrum.commands.report import _resolve_report_dir
+
+
+def test_resolve_report_dir_prefers_date_token(tmp_path):
+    for name in ("report-20240101", "report-20250301", "report-zzz", "other-20990101"):
+        (tmp_path / name).mkdir()
+    assert _resolve_report_dir(str(tmp_path)) == os.path.join(
+        str(tmp_path), "report-20250301"
+    )
+
+
+def test_resolve_report_dir_falls_back_to_name(tmp_path):
+    for name in ("report-a", "report-c", "report-b"):
+        (tmp_path / name).mkdir()
+    assert _resolve_report_dir(str(tmp_path)) == os.path.join(str(tmp_path), "report-c")
+
+
+def test_resolve_report_dir_keeps_report_with_index(tmp_path):
+    (tmp_path / "report-20250101").mkdir()
+    (tmp_path / "index.md").write_text("# Report\n")
+    assert _resolve_report_dir(str(tmp_path)) == str(tmp_path)
+
+
+def test_resolve_report_dir_passthrough(tmp_path):
+    (tmp_path / "misc").mkdir()
+    assert _resolve_report_dir(str(tmp_path)) == str(tmp_path)
+    missing = str(tmp_path / "missing")
+    assert _resolve_report_dir(missing) == missing